@@ -0,0 +1,19 @@
+"""
+Gemeinsamer Numba-Zugang für die numerischen Kernmodule (layout/_num, motive_inputs/_num)
+
+Ist Numba installiert, werden njit/prange direkt durchgereicht. Ohne Numba gibt njit
+die Funktion unverändert zurück und prange entspricht range.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback-Decorator: gibt die Funktion unverändert zurück"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -9,12 +9,107 @@ Datenbankmodul für Element-Bewertungen und Wahrscheinlichkeitsanpassung
 import sqlite3
 import json
 import random
-from typing import Dict, List, Tuple, Optional
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Tuple, Optional, Sequence
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Einzelner Hintergrund-Writer: Bewertungen werden seriell persistiert, ohne die UI zu blockieren.
+# Wird erst beim ersten submit_evaluation_batch angelegt (kein Thread beim bloßen Import).
+_writer: Optional[ThreadPoolExecutor] = None
+_writer_lock = threading.Lock()
+
+# Eine Writer-Verbindung je db_path, nur vom (einzigen) Writer-Thread benutzt und beim Beenden geschlossen
+_writer_connections: Dict[str, sqlite3.Connection] = {}
+
+
+def _get_writer() -> ThreadPoolExecutor:
+    """Gibt den Hintergrund-Writer zurück und legt ihn beim ersten Aufruf an"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evaluation-writer")
+                atexit.register(_shutdown_writer)
+    return _writer
+
+
+def _writer_connection(db_path: str) -> sqlite3.Connection:
+    """Gibt die Writer-Verbindung für db_path zurück (nur im Writer-Thread aufrufen)"""
+    conn = _writer_connections.get(db_path)
+    if conn is None:
+        # check_same_thread=False nur für das Schließen in _shutdown_writer; geschrieben wird
+        # ausschließlich seriell im Writer-Thread
+        conn = _writer_connections[db_path] = sqlite3.connect(db_path, check_same_thread=False)
+    return conn
+
+
+def _shutdown_writer() -> None:
+    """Wartet auf ausstehende Batches und schließt danach alle Writer-Verbindungen"""
+    if _writer is not None:
+        _writer.shutdown(wait=True)
+    for conn in _writer_connections.values():
+        conn.close()
+    _writer_connections.clear()
+
+
+# Kumulierte Gewichte je (db_path, element_type) und Auswahl-Tupel für get_weighted_choice;
+# wird nach jedem Commit, der Wahrscheinlichkeiten eines Element-Typs ändert, verworfen
+_cum_weights_cache: Dict[Tuple[str, str], Dict[Tuple[str, ...], Tuple[List[str], List[float], float]]] = {}
+
+
+def _log_writer_error(future: Future) -> None:
+    """Protokolliert Fehler des Hintergrund-Writers (sonst gingen sie im Future verloren)"""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"❌ Fehler beim Speichern der Bewertungen: {error}")
+
+
+class _AliasTable:
+    """Vose-Alias-Tabelle für O(1)-Ziehungen bei vielen Samples aus derselben Verteilung"""
+    
+    __slots__ = ('population', 'prob', 'alias', '_rng')
+    
+    def __init__(self, population: Sequence[str], weights: Sequence[float],
+                 rng: Optional[random.Random] = None):
+        n = len(population)
+        total = float(sum(weights))
+        self.population = list(population)
+        self._rng = rng or random
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        if n == 0 or total <= 0:
+            # Gleichverteilung (entspricht random.choice)
+            return
+        
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Rest (inkl. Rundungsfehler) hat Wahrscheinlichkeit 1
+        for i in small + large:
+            self.prob[i] = 1.0
+    
+    def sample(self) -> str:
+        """Zieht ein Element in O(1); leere Tabelle: IndexError wie random.choice"""
+        rng = self._rng
+        try:
+            i = rng.randrange(len(self.population))
+        except ValueError:
+            raise IndexError("Cannot choose from an empty sequence") from None
+        return self.population[i] if rng.random() < self.prob[i] else self.population[self.alias[i]]
+
 class ElementEvaluationDB:
     """Datenbank für Element-Bewertungen und Wahrscheinlichkeitsanpassung"""
     
@@ -79,10 +174,75 @@ class ElementEvaluationDB:
                 (element_type, element_value, rating, session_id, context)
                 VALUES (?, ?, ?, ?, ?)
             """, (element_type, element_value, rating, session_id, context))
-            conn.commit()
             
-            # Wahrscheinlichkeiten aktualisieren
-            self._update_probabilities(element_type, element_value)
+            # Wahrscheinlichkeiten aktualisieren (gleiche Verbindung)
+            self._update_probabilities(element_type, element_value, conn)
+            conn.commit()
+        self._invalidate_weights((element_type,))
+    
+    def add_evaluation_batch(self, ratings: List[Tuple[str, str, int]], session_id: str = None,
+                             context: str = None, prompt_evaluation: Optional[Dict] = None):
+        """Schreibt mehrere Element-Bewertungen (und optional die Prompt-Bewertung) in einer Transaktion
+        
+        Args:
+            ratings: Liste von (element_type, element_value, rating)
+            session_id: Session für Gruppierung
+            context: Zusätzlicher Kontext
+            prompt_evaluation: Optional {'prompt_text', 'generated_elements', 'overall_rating'}
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            self._write_evaluation_batch(conn, ratings, session_id, context, prompt_evaluation)
+    
+    def _write_evaluation_batch(self, conn: sqlite3.Connection, ratings: List[Tuple[str, str, int]],
+                                session_id: Optional[str], context: Optional[str],
+                                prompt_evaluation: Optional[Dict]):
+        """Schreibt einen Bewertungs-Batch über die übergebene Verbindung und committet"""
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO element_ratings 
+            (element_type, element_value, rating, session_id, context)
+            VALUES (?, ?, ?, ?, ?)
+        """, [(et, ev, rating, session_id, context) for et, ev, rating in ratings])
+        
+        if prompt_evaluation is not None:
+            cursor.execute("""
+                INSERT INTO prompt_evaluations 
+                (session_id, prompt_text, generated_elements, overall_rating)
+                VALUES (?, ?, ?, ?)
+            """, (session_id, prompt_evaluation.get('prompt_text', ''),
+                  json.dumps(prompt_evaluation.get('generated_elements', {})),
+                  prompt_evaluation.get('overall_rating')))
+        
+        # Wahrscheinlichkeiten je Element einmal aktualisieren
+        for element_type, element_value in dict.fromkeys((et, ev) for et, ev, _ in ratings):
+            self._update_probabilities(element_type, element_value, conn)
+        
+        conn.commit()
+        self._invalidate_weights({et for et, _, _ in ratings})
+    
+    def _write_evaluation_batch_in_writer(self, ratings: List[Tuple[str, str, int]],
+                                          session_id: Optional[str], context: Optional[str],
+                                          prompt_evaluation: Optional[Dict]):
+        """Läuft im Writer-Thread: nutzt die gemeinsame Writer-Verbindung für db_path"""
+        conn = _writer_connection(self.db_path)
+        try:
+            self._write_evaluation_batch(conn, ratings, session_id, context, prompt_evaluation)
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def submit_evaluation_batch(self, ratings: List[Tuple[str, str, int]], session_id: str = None,
+                                context: str = None, prompt_evaluation: Optional[Dict] = None) -> Future:
+        """Reiht den Batch im Hintergrund-Writer ein und kehrt sofort zurück
+        
+        Returns:
+            Future, das nach dem Commit erfüllt ist (bzw. die Schreib-Exception trägt)
+        """
+        future = _get_writer().submit(
+            self._write_evaluation_batch_in_writer, ratings, session_id, context, prompt_evaluation
+        )
+        future.add_done_callback(_log_writer_error)
+        return future
     
     def add_prompt_evaluation(self, session_id: str, prompt_text: str, 
                              generated_elements: Dict, overall_rating: int = None):
@@ -96,81 +256,113 @@ class ElementEvaluationDB:
             """, (session_id, prompt_text, json.dumps(generated_elements), overall_rating))
             conn.commit()
     
-    def _update_probabilities(self, element_type: str, element_value: str):
+    def _update_probabilities(self, element_type: str, element_value: str,
+                              conn: Optional[sqlite3.Connection] = None):
         """ULTRA-DEZENTE Wahrscheinlichkeitsanpassung"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT AVG(rating), COUNT(*) 
-                FROM element_ratings 
-                WHERE element_type = ? AND element_value = ?
-            """, (element_type, element_value))
-            
-            avg_rating, total_ratings = cursor.fetchone()
-            avg_rating = avg_rating or 5.0
-            total_ratings = total_ratings or 0
-            
-            # ULTRA-DEZENTE Anpassung
-            # 👎 = 2 → 0.85x (15% weniger)
-            # 😐 = 5 → 1.0x (neutral)
-            # 👍 = 9 → 1.15x (15% mehr)
-            
-            if avg_rating <= 3:
-                probability_multiplier = 0.85
-            elif avg_rating <= 7:
-                probability_multiplier = 1.0
-            else:
-                probability_multiplier = 1.15
-            
-            # Bei sehr wenigen Bewertungen noch konservativer
-            if total_ratings < 3:
-                probability_multiplier = 1.0  # Keine Änderung bei < 3 Bewertungen
-            elif total_ratings < 5:
-                probability_multiplier = max(0.9, min(1.1, probability_multiplier))
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO element_probabilities 
-                (element_type, element_value, current_probability, total_ratings, 
-                 average_rating, last_updated)
-                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (element_type, element_value, probability_multiplier, total_ratings, avg_rating))
-            
-            conn.commit()
+        if conn is None:
+            with sqlite3.connect(self.db_path) as conn:
+                self._update_probabilities(element_type, element_value, conn)
+                conn.commit()
+            self._invalidate_weights((element_type,))
+            return
+        
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT AVG(rating), COUNT(*) 
+            FROM element_ratings 
+            WHERE element_type = ? AND element_value = ?
+        """, (element_type, element_value))
+        
+        avg_rating, total_ratings = cursor.fetchone()
+        avg_rating = avg_rating or 5.0
+        total_ratings = total_ratings or 0
+        
+        # Bei < 3 Bewertungen bleibt der Multiplikator 1.0 (= Default beim Lesen),
+        # daher entfällt der Schreibzugriff komplett
+        if total_ratings < 3:
+            return
+        
+        # ULTRA-DEZENTE Anpassung
+        # 👎 = 2 → 0.85x (15% weniger)
+        # 😐 = 5 → 1.0x (neutral)
+        # 👍 = 9 → 1.15x (15% mehr)
+        
+        if avg_rating <= 3:
+            probability_multiplier = 0.85
+        elif avg_rating <= 7:
+            probability_multiplier = 1.0
+        else:
+            probability_multiplier = 1.15
+        
+        # Bei wenigen Bewertungen noch konservativer
+        if total_ratings < 5:
+            probability_multiplier = max(0.9, min(1.1, probability_multiplier))
+        
+        # Immer schreiben (eine Anweisung in der offenen Transaktion), damit total_ratings,
+        # average_rating und last_updated mit element_ratings übereinstimmen
+        cursor.execute("""
+            INSERT OR REPLACE INTO element_probabilities 
+            (element_type, element_value, current_probability, total_ratings, 
+             average_rating, last_updated)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """, (element_type, element_value, probability_multiplier, total_ratings, avg_rating))
+    
+    def _invalidate_weights(self, element_types) -> None:
+        """Verwirft gecachte kumulierte Gewichte (nach dem Commit, damit kein alter Stand nachrückt)"""
+        for element_type in element_types:
+            _cum_weights_cache.pop((self.db_path, element_type), None)
     
     def get_weighted_choice(self, element_type: str, choices: List[str]) -> str:
         """Wählt ein Element basierend auf gewichteten Wahrscheinlichkeiten"""
+        # Kumulierte Gewichte je Element-Typ und Auswahl gecacht; Ziehung per Binärsuche
+        per_type = _cum_weights_cache.get((self.db_path, element_type))
+        choices_key = tuple(choices)
+        entry = per_type.get(choices_key) if per_type is not None else None
+        if entry is None:
+            probabilities = self.get_probabilities(element_type, choices)
+            cum_weights = list(accumulate(probabilities.values()))
+            entry = (list(probabilities), cum_weights, cum_weights[-1] if cum_weights else 0)
+            _cum_weights_cache.setdefault((self.db_path, element_type), {})[choices_key] = entry
+        return self._draw_weighted(*entry)
+    
+    def get_alias_table(self, element_type: str, choices: List[str]) -> _AliasTable:
+        """Erstellt eine Alias-Tabelle für viele Ziehungen (z.B. Batch-Generierung)"""
+        probabilities = self.get_probabilities(element_type, choices)
+        return _AliasTable(list(probabilities.keys()), list(probabilities.values()))
+    
+    def get_probabilities(self, element_type: str, choices: List[str]) -> Dict[str, float]:
+        """Liest die aktuellen Wahrscheinlichkeiten für alle verfügbaren Elemente"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
-            # Wahrscheinlichkeiten für alle verfügbaren Elemente abrufen
-            probabilities = {}
-            for choice in choices:
-                cursor.execute("""
-                    SELECT current_probability FROM element_probabilities 
-                    WHERE element_type = ? AND element_value = ?
-                """, (element_type, choice))
-                
-                result = cursor.fetchone()
-                probabilities[choice] = result[0] if result else 1.0  # Standard-Wahrscheinlichkeit
+            # Wahrscheinlichkeiten für alle verfügbaren Elemente in einer Abfrage abrufen
+            probabilities = dict.fromkeys(choices, 1.0)  # Standard-Wahrscheinlichkeit
+            if probabilities:
+                placeholders = ", ".join("?" * len(probabilities))
+                cursor.execute(f"""
+                    SELECT element_value, current_probability FROM element_probabilities 
+                    WHERE element_type = ? AND element_value IN ({placeholders})
+                """, (element_type, *probabilities))
+                probabilities.update(cursor.fetchall())
             
-            # Gewichtete Zufallsauswahl
-            return self._weighted_random_choice(probabilities)
+            return probabilities
     
     def _weighted_random_choice(self, probabilities: Dict[str, float]) -> str:
         """Führt eine gewichtete Zufallsauswahl durch"""
-        choices = list(probabilities.keys())
-        weights = list(probabilities.values())
-        
-        # Normalisierung der Gewichte
-        total_weight = sum(weights)
+        # Kumulierte Gewichte; eine Normalisierung ist nicht nötig
+        cum_weights = list(accumulate(probabilities.values()))
+        return self._draw_weighted(list(probabilities), cum_weights, cum_weights[-1] if cum_weights else 0)
+    
+    @staticmethod
+    def _draw_weighted(choices: List[str], cum_weights: List[float], total_weight: float) -> str:
+        """Zieht ein Element aus vorberechneten kumulierten Gewichten"""
         if total_weight == 0:
             return random.choice(choices)
         
-        normalized_weights = [w / total_weight for w in weights]
-        
-        # Gewichtete Zufallsauswahl
-        return random.choices(choices, weights=normalized_weights)[0]
+        # Gewichtete Zufallsauswahl (k=1) direkt per Binärsuche
+        index = bisect_right(cum_weights, random.random() * total_weight)
+        return choices[min(index, len(choices) - 1)]
     
     def get_evaluation_stats(self, element_type: str = None) -> Dict:
         """Gibt Statistiken über die Bewertungen zurück"""
@@ -10,6 +10,10 @@ import streamlit as st
 from typing import Dict, List, Optional
 from .database import ElementEvaluationDB
 
+# Daumen-Optionen und vorberechnete Indizes (vermeidet list.index() bei jedem Rerun)
+_SYMBOL_OPTIONS = ["👎", "😐", "👍"]
+_SYMBOL_INDEX = {"👎": 0, "😐": 1, "👍": 2}
+
 class EvaluationInterface:
     """Streamlit-Interface für Element-Bewertungen"""
     
@@ -31,10 +35,11 @@ class EvaluationInterface:
             "Balance & Wirkung": ["motiv_style", "layout_style"],
         }
 
-        symbol_options = ["👎", "😐", "👍"]
+        symbol_options = _SYMBOL_OPTIONS
         symbol_to_score = {"👎": 2, "😐": 5, "👍": 9}
 
-        # Defaults im Session State hinterlegen
+        # Defaults im Session State bei jedem Lauf hinterlegen: Streamlit entfernt Widget-Keys,
+        # sobald das Formular in einem Lauf nicht gerendert wurde
         for category in category_to_elements.keys():
             st.session_state.setdefault(f"thumbs_sel_{category}_{session_id}", "😐")
         st.session_state.setdefault(f"overall_thumbs_sel_{session_id}", "😐")
@@ -58,7 +63,7 @@ class EvaluationInterface:
                         options=symbol_options,
                         horizontal=True,
                         key=f"thumbs_sel_{category}_{session_id}",
-                        index=symbol_options.index(st.session_state[f"thumbs_sel_{category}_{session_id}"])
+                        index=_SYMBOL_INDEX.get(st.session_state.get(f"thumbs_sel_{category}_{session_id}", "😐"), 1)
                     )
 
             st.divider()
@@ -67,33 +72,36 @@ class EvaluationInterface:
                 options=symbol_options,
                 horizontal=True,
                 key=f"overall_thumbs_sel_{session_id}",
-                index=symbol_options.index(st.session_state[f"overall_thumbs_sel_{session_id}"])
+                index=_SYMBOL_INDEX.get(st.session_state.get(f"overall_thumbs_sel_{session_id}", "😐"), 1)
             )
 
             submitted = st.form_submit_button("💾 Bewertungen speichern", type="primary")
 
         if submitted:
+            ratings = []
             for category, mapped_elements in category_to_elements.items():
                 sel_symbol = st.session_state.get(f"thumbs_sel_{category}_{session_id}", "😐")
                 score = symbol_to_score.get(sel_symbol, 5)
                 for et in mapped_elements:
                     if et in generated_elements and generated_elements.get(et):
-                        self.db.add_element_rating(
-                            element_type=et,
-                            element_value=generated_elements[et],
-                            rating=score,
-                            session_id=session_id,
-                            context=context
-                        )
+                        ratings.append((et, generated_elements[et], score))
 
-            self.db.add_prompt_evaluation(
+            # Persistenz im Hintergrund-Writer, damit der Rerun nicht auf SQLite wartet;
+            # Schreibfehler protokolliert der Writer selbst
+            self.db.submit_evaluation_batch(
+                ratings,
                 session_id=session_id,
-                prompt_text=generated_elements.get('prompt_text', ''),
-                generated_elements=generated_elements,
-                overall_rating=symbol_to_score.get(st.session_state[f"overall_thumbs_sel_{session_id}"], 5)
+                context=context,
+                prompt_evaluation={
+                    'prompt_text': generated_elements.get('prompt_text', ''),
+                    'generated_elements': dict(generated_elements),
+                    'overall_rating': symbol_to_score.get(
+                        st.session_state.get(f"overall_thumbs_sel_{session_id}", "😐"), 5
+                    )
+                }
             )
 
-            st.success("✅ Bewertungen gespeichert – Gewichtungen aktualisiert")
+            st.info("⏳ Bewertungen eingereiht – werden im Hintergrund gespeichert, Statistiken folgen beim nächsten Lauf")
 
         # Rückgabe: Aktuelle Auswahl (aus Session State)
         return {
@@ -10,6 +10,72 @@ import random
 from typing import List, Dict, Any
 from .database import ElementEvaluationDB
 
+
+# Auswahlmöglichkeiten je Element-Typ
+ELEMENT_CHOICES: Dict[str, List[str]] = {
+    "layout_style": [
+        "abgerundet_modern", "scharf_zeitgemaess", "organisch_fliessend",
+        "geometrisch_praezise", "neon_tech", "editorial_clean",
+        "soft_neumorph", "glassmorph_minimal", "clay_ui", "warm_documentary"
+    ],
+    "container_shape": [
+        "abgerundet", "scharf", "organisch", "geometrisch", "capsule",
+        "ribbon", "tag", "asymmetrisch", "hexagon", "diamond", "pill",
+        "rounded_square", "soft_rectangle", "wave", "cloud", "bubble"
+    ],
+    "border_style": [
+        "keine", "weicher_schatten", "harte_konturen", "gradient_rand",
+        "doppelstrich", "innenlinie", "emboss", "outline_glow"
+    ],
+    "texture_style": [
+        "farbverlauf", "glaseffekt", "matte_oberflaeche", "strukturiert",
+        "paper_grain", "film_grain", "noise_gradient", "subtle_pattern",
+        "soft_neumorph", "emboss_deboss"
+    ],
+    "background_treatment": [
+        "transparent", "vollflaechig", "gradient", "subtiles_muster",
+        "duotone_motivtint", "vignette_soft", "depth_layers"
+    ],
+    "corner_radius": [
+        "klein_8px", "mittel_16px", "gross_24px", "sehr_gross_32px",
+        "auto_radius", "minimal_4px", "extra_gross_40px", "asymmetrisch",
+        "variable", "organic", "sharp_corners", "mixed_radius"
+    ],
+    "accent_elements": [
+        "modern_minimal", "sanft_organisch", "geometrisch_praezise",
+        "kreativ_verspielt", "micro_badges", "divider_dots", "icon_chips"
+    ],
+    "typography_style": [
+        "humanist_sans", "grotesk_bold", "serif_editorial",
+        "mono_detail", "rounded_sans"
+    ],
+    "photo_treatment": [
+        "natural_daylight", "cinematic_warm", "clean_clinic",
+        "documentary_soft_grain", "duotone_subtle", "bokeh_light"
+    ],
+    "depth_style": [
+        "soft_shadow_stack", "drop_inner_shadow", "card_elevation_1",
+        "card_elevation_2", "card_elevation_3"
+    ],
+    "motiv_quality": [
+        "authentisch_warm", "professionell_vertrauensvoll", "einfuehlsam_menschlich",
+        "dynamisch_energetisch", "ruhig_beruhigend", "inspirierend_motivierend",
+        "vertrauensvoll_serioes", "freundlich_einladend", "modern_zeitgemaess"
+    ],
+    "motiv_style": [
+        "natuerlich_candid", "documentary_stil", "studio_professional",
+        "cinematisch_dramatisch", "kuenstlerisch_kreativ"
+    ],
+    "lighting_type": [
+        "natuerliches_tageslicht", "studio_beleuchtung", "dramatisches_licht",
+        "sanftes_licht", "kontrastreiches_licht"
+    ],
+    "framing": [
+        "nahaufnahme", "halbtotale", "totale", "detailaufnahme", "gruppenaufnahme"
+    ]
+}
+
+
 class WeightedElementGenerator:
     """Generator für gewichtete Element-Auswahl basierend auf Bewertungen"""
     
@@ -18,119 +84,59 @@ class WeightedElementGenerator:
     
     def get_weighted_layout_style(self) -> str:
         """Gewichtete Auswahl für Layout-Style"""
-        choices = [
-            "abgerundet_modern", "scharf_zeitgemaess", "organisch_fliessend", 
-            "geometrisch_praezise", "neon_tech", "editorial_clean", 
-            "soft_neumorph", "glassmorph_minimal", "clay_ui", "warm_documentary"
-        ]
-        return self.db.get_weighted_choice("layout_style", choices)
+        return self.db.get_weighted_choice("layout_style", ELEMENT_CHOICES["layout_style"])
     
     def get_weighted_container_shape(self) -> str:
         """Gewichtete Auswahl für Container-Form"""
-        choices = [
-            "abgerundet", "scharf", "organisch", "geometrisch", "capsule", 
-            "ribbon", "tag", "asymmetrisch", "hexagon", "diamond", "pill",
-            "rounded_square", "soft_rectangle", "wave", "cloud", "bubble"
-        ]
-        return self.db.get_weighted_choice("container_shape", choices)
+        return self.db.get_weighted_choice("container_shape", ELEMENT_CHOICES["container_shape"])
     
     def get_weighted_border_style(self) -> str:
         """Gewichtete Auswahl für Rahmen-Style"""
-        choices = [
-            "keine", "weicher_schatten", "harte_konturen", "gradient_rand",
-            "doppelstrich", "innenlinie", "emboss", "outline_glow"
-        ]
-        return self.db.get_weighted_choice("border_style", choices)
+        return self.db.get_weighted_choice("border_style", ELEMENT_CHOICES["border_style"])
     
     def get_weighted_texture_style(self) -> str:
         """Gewichtete Auswahl für Textur-Style"""
-        choices = [
-            "farbverlauf", "glaseffekt", "matte_oberflaeche", "strukturiert",
-            "paper_grain", "film_grain", "noise_gradient", "subtle_pattern",
-            "soft_neumorph", "emboss_deboss"
-        ]
-        return self.db.get_weighted_choice("texture_style", choices)
+        return self.db.get_weighted_choice("texture_style", ELEMENT_CHOICES["texture_style"])
     
     def get_weighted_background_treatment(self) -> str:
         """Gewichtete Auswahl für Hintergrund-Behandlung"""
-        choices = [
-            "transparent", "vollflaechig", "gradient", "subtiles_muster",
-            "duotone_motivtint", "vignette_soft", "depth_layers"
-        ]
-        return self.db.get_weighted_choice("background_treatment", choices)
+        return self.db.get_weighted_choice("background_treatment", ELEMENT_CHOICES["background_treatment"])
     
     def get_weighted_corner_radius(self) -> str:
         """Gewichtete Auswahl für Ecken-Radius"""
-        choices = [
-            "klein_8px", "mittel_16px", "gross_24px", "sehr_gross_32px",
-            "auto_radius", "minimal_4px", "extra_gross_40px", "asymmetrisch",
-            "variable", "organic", "sharp_corners", "mixed_radius"
-        ]
-        return self.db.get_weighted_choice("corner_radius", choices)
+        return self.db.get_weighted_choice("corner_radius", ELEMENT_CHOICES["corner_radius"])
     
     def get_weighted_accent_elements(self) -> str:
         """Gewichtete Auswahl für Akzent-Elemente"""
-        choices = [
-            "modern_minimal", "sanft_organisch", "geometrisch_praezise", 
-            "kreativ_verspielt", "micro_badges", "divider_dots", "icon_chips"
-        ]
-        return self.db.get_weighted_choice("accent_elements", choices)
+        return self.db.get_weighted_choice("accent_elements", ELEMENT_CHOICES["accent_elements"])
     
     def get_weighted_typography_style(self) -> str:
         """Gewichtete Auswahl für Typografie-Style"""
-        choices = [
-            "humanist_sans", "grotesk_bold", "serif_editorial", 
-            "mono_detail", "rounded_sans"
-        ]
-        return self.db.get_weighted_choice("typography_style", choices)
+        return self.db.get_weighted_choice("typography_style", ELEMENT_CHOICES["typography_style"])
     
     def get_weighted_photo_treatment(self) -> str:
         """Gewichtete Auswahl für Foto-Behandlung"""
-        choices = [
-            "natural_daylight", "cinematic_warm", "clean_clinic", 
-            "documentary_soft_grain", "duotone_subtle", "bokeh_light"
-        ]
-        return self.db.get_weighted_choice("photo_treatment", choices)
+        return self.db.get_weighted_choice("photo_treatment", ELEMENT_CHOICES["photo_treatment"])
     
     def get_weighted_depth_style(self) -> str:
         """Gewichtete Auswahl für Tiefen-Style"""
-        choices = [
-            "soft_shadow_stack", "drop_inner_shadow", "card_elevation_1",
-            "card_elevation_2", "card_elevation_3"
-        ]
-        return self.db.get_weighted_choice("depth_style", choices)
+        return self.db.get_weighted_choice("depth_style", ELEMENT_CHOICES["depth_style"])
     
     def get_weighted_motiv_quality(self) -> str:
         """Gewichtete Auswahl für Motiv-Qualität"""
-        choices = [
-            "authentisch_warm", "professionell_vertrauensvoll", "einfuehlsam_menschlich",
-            "dynamisch_energetisch", "ruhig_beruhigend", "inspirierend_motivierend",
-            "vertrauensvoll_serioes", "freundlich_einladend", "modern_zeitgemaess"
-        ]
-        return self.db.get_weighted_choice("motiv_quality", choices)
+        return self.db.get_weighted_choice("motiv_quality", ELEMENT_CHOICES["motiv_quality"])
     
     def get_weighted_motiv_style(self) -> str:
         """Gewichtete Auswahl für Motiv-Style"""
-        choices = [
-            "natuerlich_candid", "documentary_stil", "studio_professional", 
-            "cinematisch_dramatisch", "kuenstlerisch_kreativ"
-        ]
-        return self.db.get_weighted_choice("motiv_style", choices)
+        return self.db.get_weighted_choice("motiv_style", ELEMENT_CHOICES["motiv_style"])
     
     def get_weighted_lighting_type(self) -> str:
         """Gewichtete Auswahl für Beleuchtung"""
-        choices = [
-            "natuerliches_tageslicht", "studio_beleuchtung", "dramatisches_licht", 
-            "sanftes_licht", "kontrastreiches_licht"
-        ]
-        return self.db.get_weighted_choice("lighting_type", choices)
+        return self.db.get_weighted_choice("lighting_type", ELEMENT_CHOICES["lighting_type"])
     
     def get_weighted_framing(self) -> str:
         """Gewichtete Auswahl für Framing"""
-        choices = [
-            "nahaufnahme", "halbtotale", "totale", "detailaufnahme", "gruppenaufnahme"
-        ]
-        return self.db.get_weighted_choice("framing", choices)
+        return self.db.get_weighted_choice("framing", ELEMENT_CHOICES["framing"])
     
     def generate_weighted_elements(self) -> Dict[str, str]:
         """Generiert alle Elemente mit gewichteter Auswahl"""
@@ -150,3 +156,14 @@ class WeightedElementGenerator:
             'lighting_type': self.get_weighted_lighting_type(),
             'framing': self.get_weighted_framing()
         }
+    
+    def generate_weighted_elements_batch(self, count: int) -> List[Dict[str, str]]:
+        """Generiert mehrere Element-Sets (Batch) mit einer Alias-Tabelle je Element-Typ"""
+        tables = {
+            element_type: self.db.get_alias_table(element_type, choices)
+            for element_type, choices in ELEMENT_CHOICES.items()
+        }
+        return [
+            {element_type: table.sample() for element_type, table in tables.items()}
+            for _ in range(count)
+        ]
@@ -13,12 +13,15 @@ from .loader import (
     load_layout_cached,
     list_available_layouts,
     get_layout_info,
-    validate_layout_file
+    validate_layout_file,
+    preload_layouts
 )
 
 from .engine import (
     layout_engine,
-    calculate_layout_coordinates_cached
+    calculate_layout_coordinates_cached,
+    thaw_layout,
+    invalidate
 )
 
 __all__ = [
@@ -28,10 +31,13 @@ __all__ = [
     'list_available_layouts',
     'get_layout_info',
     'validate_layout_file',
+    'preload_layouts',
     
     # Layout-Engine
     'layout_engine',
-    'calculate_layout_coordinates_cached'
+    'calculate_layout_coordinates_cached',
+    'thaw_layout',
+    'invalidate'
 ]
 
 __version__ = "1.0.0"
@@ -0,0 +1,41 @@
+"""
+Numerische Kernfunktionen der Layout-Engine
+
+Reine Arithmetik ohne Python-Objekte, damit sie mit Numba (falls installiert)
+nativ kompiliert werden können. Ohne Numba laufen sie als normale Python-Funktionen.
+"""
+
+from .._jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def calc_widths(ratio, canvas_width, min_text_width, max_text_width, gutter=60):
+    """
+    Berechnet Text- und Bild-Breiten basierend auf dem Ratio
+
+    Returns:
+        Tuple (text_width, image_width)
+    """
+    # Text-Breite aus dem Ratio: Rest nach Bild-Breite minus Abstand (Standard 60px)
+    text_width = canvas_width - int(ratio / 100 * canvas_width) - gutter
+
+    # Nur die Text-Breite wird begrenzt; die Bild-Breite folgt daraus in einem Schritt
+    # (eine Begrenzung der vorläufigen Bild-Breite würde ohnehin sofort überschrieben)
+    text_width = max(min_text_width, min(max_text_width, text_width))
+
+    return text_width, canvas_width - text_width - gutter
+
+
+@njit(cache=True)
+def split_motiv_geometry(ratio, canvas_height):
+    """
+    Berechnet Y-Koordinate und Höhe der Motivzone im Split-Layout
+
+    Höherer Slider-Wert = kleinere Y-Koordinate = mehr Bildfläche
+
+    Returns:
+        Tuple (motiv_y, motiv_height) als Floats
+    """
+    # Formel: Y = 540 + 200 * (100 - ratio) / 100 = 540 + (100 - ratio) * 2
+    motiv_y = 540 + (100 - ratio) * 2.0
+    return motiv_y, canvas_height - motiv_y
@@ -8,8 +8,11 @@ Dieser Engine berechnet die tatsächlichen Koordinaten basierend auf:
 """
 
 import math
-from typing import Dict, Any, Tuple, Optional, List
+import os
+from typing import Dict, Any, Tuple, Optional, List, Callable, Collection, FrozenSet
 from functools import lru_cache
+from types import MappingProxyType
+from dataclasses import dataclass, field
 from .schema import (
     ensure_numerical_zones, 
     validate_layout,
@@ -18,6 +21,426 @@ from .schema import (
     get_layout_zone_requirements,
     LayoutValidationError
 )
+from ._num import calc_widths, split_motiv_geometry
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Hero-Layout Positionen basierend auf Skizze 8 (Anteile x, y, width, height am Canvas)
+_HERO_ZONE_NAMES = (
+    'standort_block',      # Unten links
+    'logo_block',          # Unten rechts
+    'headline_block',      # Links, NOCH KLEINER
+    'subline_block',       # Unter Headline
+    'benefits_block',      # Unter Subline
+    'stellentitel_block',  # Ganz unten links
+    'cta_block',           # MITTIG RECHTS
+)
+_HERO_FRACTIONS = (
+    (0.05, 0.55, 0.37, 0.06),
+    (0.58, 0.55, 0.37, 0.06),
+    (0.05, 0.62, 0.25, 0.06),
+    (0.05, 0.70, 0.37, 0.06),
+    (0.05, 0.78, 0.37, 0.11),
+    (0.05, 0.90, 0.37, 0.09),
+    (0.70, 0.65, 0.20, 0.08),
+)
+
+# Skizze 9 Positionen - Dual Headline Layout (KEINE Benefits!)
+_STORYTELLING_ZONE_NAMES = (
+    'standort_block',      # Oben links
+    'headline_1_block',    # Erste Headline
+    'headline_2_block',    # Zweite Headline
+    'subline_block',       # Unter Headlines
+    'stellentitel_block',  # Stellentitel
+    'cta_block',           # CTA
+)
+_STORYTELLING_FRACTIONS = (
+    (0.05, 0.05, 0.45, 0.06),
+    (0.05, 0.15, 0.45, 0.08),
+    (0.05, 0.25, 0.45, 0.08),
+    (0.05, 0.35, 0.45, 0.06),
+    (0.05, 0.45, 0.45, 0.08),
+    (0.05, 0.55, 0.45, 0.08),
+)
+
+# Text-Zonen je Layout-Typ (einmalig angelegt statt Listen-Literal pro Aufruf)
+_TEXT_ZONES_VERTICAL_SPLIT = ('standort_block', 'headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block', 'stellentitel_block')  # vertical_split
+_TEXT_ZONES_SPLIT_STANDORT = ('standort_block', 'headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block')  # vertical_split_left, modern_split
+_TEXT_ZONES_SPLIT = ('headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block')  # horizontal_split, minimalist, portfolio
+_TEXT_ZONES_INFOGRAPHIC = ('headline_block', 'subline_block', 'infographic_block', 'cta_block')  # infographic
+_TEXT_ZONES_MAGAZINE = ('headline_block', 'subline_block', 'content_block', 'cta_block')  # magazine
+_TEXT_ZONES_CENTERED = ('standort_block', 'headline_block', 'subline_block', 'benefits_block', 'cta_block')  # centered_layout, diagonal_layout
+_TEXT_ZONES_ASYMMETRIC = ('standort_block', 'headline_block', 'subline_block', 'stellentitel_block', 'cta_block')  # asymmetric_layout (ohne Benefits)
+_TEXT_ZONES_GRID = ('standort_block', 'subline_block', 'stellentitel_block')  # grid_layout (OHNE Headline, OHNE CTA, OHNE Benefits)
+_TEXT_ZONES_SPLIT_LAYOUT = ('standort_block', 'headline_block', 'benefits_block', 'stellentitel_block', 'cta_block')  # split_layout
+
+# Veränderte Zonen je Layout als frozenset (Text-Zonen plus Motiv), für _copy_touched_zones
+_TOUCHED_HERO = frozenset(_HERO_ZONE_NAMES + ('motiv_area',))
+_TOUCHED_STORYTELLING = frozenset(_STORYTELLING_ZONE_NAMES + ('motiv_area',))
+_TOUCHED_SPLIT_LAYOUT = frozenset(_TEXT_ZONES_SPLIT_LAYOUT + ('motiv_area',))
+
+# Relative Positionen (Zone, x, y, width, height) der Container-Layouts, einmalig als Tupel angelegt
+# Centered/Grid: Anteile an der Container-Gruppe; Diagonal/Asymmetric/Split: Anteile am Canvas
+_CENTERED_POSITIONS = (
+    ('standort_block', 0.1, 0.05, 0.8, 0.08),
+    ('headline_block', 0.1, 0.15, 0.8, 0.15),
+    ('subline_block', 0.15, 0.35, 0.7, 0.1),
+    ('benefits_block', 0.15, 0.5, 0.7, 0.25),
+    ('cta_block', 0.25, 0.8, 0.5, 0.12),
+)
+# Standort oben rechts, Text weiter unten rechts, CTA weiter links
+_DIAGONAL_POSITIONS = (
+    ('standort_block', 0.65, 0.05, 0.3, 0.08),   # Oben rechts
+    ('headline_block', 0.45, 0.7, 0.4, 0.12),    # Weiter unten rechts
+    ('subline_block', 0.5, 0.8, 0.35, 0.1),      # Weiter unten rechts
+    ('benefits_block', 0.55, 0.9, 0.3, 0.08),    # Weiter unten rechts
+    ('cta_block', 0.05, 0.85, 0.25, 0.12),       # Weiter links
+)
+# Angepasst nach User-Feedback
+_ASYMMETRIC_POSITIONS = (
+    ('standort_block', 0.70, 0.05, 0.25, 0.06),      # Weiter nach rechts
+    ('headline_block', 0.30, 0.10, 0.56, 0.11),      # Weiter nach oben
+    ('subline_block', 0.35, 0.22, 0.46, 0.07),       # Weiter nach oben
+    ('stellentitel_block', 0.50, 0.50, 0.28, 0.09),  # Zwischen Subline und CTA
+    ('cta_block', 0.70, 0.85, 0.28, 0.09),           # Weiter nach rechts
+)
+# Standort oben links, Stellentitel/Subline unten links
+_GRID_POSITIONS = (
+    ('standort_block', 0.05, 0.05, 0.4, 0.12),       # Links oben
+    ('subline_block', 0.05, 0.7, 0.4, 0.12),         # Links unten
+    ('stellentitel_block', 0.05, 0.85, 0.4, 0.10),   # Links unten
+)
+# Obere Hälfte für Text, untere Hälfte für Motiv
+_SPLIT_LAYOUT_POSITIONS = (
+    ('standort_block', 0.05, 0.05, 0.4, 0.06),       # Oben links
+    ('headline_block', 0.05, 0.15, 0.6, 0.08),       # Unter dem Standort, breiter
+    ('benefits_block', 0.05, 0.25, 0.6, 0.20),       # Unter der Headline (links)
+    ('stellentitel_block', 0.05, 0.60, 0.4, 0.08),   # Unten links, über CTA
+    ('cta_block', 0.05, 0.85, 0.4, 0.08),            # Ganz unten links
+)
+
+
+
+def _position_table(names, fractions) -> Tuple[Tuple[str, ...], Tuple[Tuple[float, ...], ...], Any]:
+    """Legt Zonen-Namen, Anteile und (falls NumPy verfügbar) das Anteils-Array einer Positionstabelle ab"""
+    # float64 entspricht exakt der Python-Float-Arithmetik (identische int()-Ergebnisse)
+    fractions_np = np.array(fractions, dtype=np.float64) if NUMPY_AVAILABLE else None
+    return tuple(names), tuple(fractions), fractions_np
+
+
+def _split_positions(positions) -> Tuple[Tuple[str, ...], Tuple[Tuple[float, ...], ...]]:
+    """Zerlegt (Zone, x, y, width, height)-Tupel in Namen und Anteile"""
+    return tuple(p[0] for p in positions), tuple(p[1:] for p in positions)
+
+
+_POSITION_TABLES = {
+    'hero': _position_table(_HERO_ZONE_NAMES, _HERO_FRACTIONS),
+    'storytelling': _position_table(_STORYTELLING_ZONE_NAMES, _STORYTELLING_FRACTIONS),
+    'centered': _position_table(*_split_positions(_CENTERED_POSITIONS)),
+    'diagonal': _position_table(*_split_positions(_DIAGONAL_POSITIONS)),
+    'asymmetric': _position_table(*_split_positions(_ASYMMETRIC_POSITIONS)),
+    'grid': _position_table(*_split_positions(_GRID_POSITIONS)),
+    'split_layout': _position_table(*_split_positions(_SPLIT_LAYOUT_POSITIONS)),
+}
+
+
+def _fractions_to_pixels(fractions, fractions_np, canvas_width, canvas_height) -> List[List[int]]:
+    """Rechnet Anteils-Positionen (x, y, width, height) in Pixel um – vektorisiert, falls NumPy verfügbar"""
+    if fractions_np is not None:
+        scale = np.array((canvas_width, canvas_height, canvas_width, canvas_height), dtype=np.float64)
+        return (fractions_np * scale).astype(np.int64).tolist()
+    return [
+        [int(x * canvas_width), int(y * canvas_height), int(w * canvas_width), int(h * canvas_height)]
+        for x, y, w, h in fractions
+    ]
+
+
+@lru_cache(maxsize=64)
+def _scaled_positions(table: str, width: int, height: int) -> Tuple[Tuple[str, Tuple[int, int, int, int]], ...]:
+    """
+    Positionen einer Tabelle aus _POSITION_TABLES in Pixeln, gecacht je Bezugsgröße
+    
+    Bezugsgröße ist der Canvas bzw. bei Centered/Grid die Container-Gruppe.
+    Alle Zonen werden in einer NumPy-Operation umgerechnet (falls verfügbar).
+    """
+    names, fractions, fractions_np = _POSITION_TABLES[table]
+    pixels = _fractions_to_pixels(fractions, fractions_np, width, height)
+    return tuple(zip(names, map(tuple, pixels)))
+
+
+@lru_cache(maxsize=8)
+def _full_canvas_motiv(canvas_width: int, canvas_height: int) -> MappingProxyType:
+    """Geometrie eines Motivs über den ganzen Canvas (schreibgeschützt, gecacht je Canvas-Größe)"""
+    # Hintergrund-Motiv ist immer vollständig sichtbar
+    return MappingProxyType({'x': 0, 'y': 0, 'width': canvas_width, 'height': canvas_height, 'transparency': 1.0})
+
+
+def _canvas_dims(layout_dict: Dict[str, Any]) -> Tuple[int, int]:
+    """Liest Canvas-Breite und -Höhe aus dem Layout (Standard 1080x1080)"""
+    canvas = layout_dict.get('canvas')
+    if not canvas:
+        return 1080, 1080
+    return canvas.get('width', 1080), canvas.get('height', 1080)
+
+
+def _make_group_geometry(
+    base_container_width: int, min_container_width: int, max_container_width: int
+) -> Callable[[int, int, int], Tuple[int, int, int, int]]:
+    """
+    Erzeugt die Geometrie-Funktion der Container-Gruppe für einen Breitenbereich (Centered, Diagonal, Grid)
+    
+    Die Breitenkonstanten sind in der Closure gebunden; der Cache-Schlüssel ist nur (Canvas, Ratio).
+    """
+    @lru_cache(maxsize=256)
+    def group_geometry(canvas_width: int, canvas_height: int, image_text_ratio: int) -> Tuple[int, int, int, int]:
+        """
+        Größe und zentrierte Position der Container-Gruppe, gecacht je (Canvas, Ratio)
+        
+        Je höher das Ratio, desto größer die gesamte Gruppe.
+        
+        Returns:
+            Tuple (width, height, x, y)
+        """
+        ratio_factor = image_text_ratio / 100  # 0.3 bis 0.7
+        dynamic_container_width = int(base_container_width * (0.7 + ratio_factor * 0.6))  # 0.7 bis 1.3 Faktor
+        dynamic_container_width = _clip(dynamic_container_width, min_container_width, max_container_width)
+        dynamic_container_height = int(800 * (0.75 + ratio_factor * 0.5))  # 0.75 bis 1.25 Faktor, Basis 800
+        dynamic_container_height = _clip(dynamic_container_height, 600, 1000)
+        return (
+            dynamic_container_width,
+            dynamic_container_height,
+            (canvas_width - dynamic_container_width) // 2,
+            (canvas_height - dynamic_container_height) // 2,
+        )
+
+    return group_geometry
+
+
+# Container-Gruppen je Breitenbereich (Centered und Grid teilen sich Funktion und Cache)
+_STANDARD_GROUP_GEOMETRY = _make_group_geometry(500, 350, 700)
+_DIAGONAL_GROUP_GEOMETRY = _make_group_geometry(450, 300, 600)
+
+
+@lru_cache(maxsize=64)
+def _inverse_container_scale(image_text_ratio: int) -> float:
+    """Inverse Container-Skalierung (Asymmetric): 30% Ratio = 1.4x, 70% Ratio = 0.6x"""
+    ratio_factor = image_text_ratio / 100
+    container_scale = 1.4 - (ratio_factor - 0.3) * (1.4 - 0.6) / 0.4
+    return _clip(container_scale, 0.6, 1.4)
+
+
+@lru_cache(maxsize=256, typed=True)  # typed: 400 und 400.0 ergeben unterschiedliche Strings
+def _position_with_width(position: str, new_width: int) -> Optional[str]:
+    """
+    Ersetzt die Breite (drittes Feld) im Position-String "x,y,width,height"
+    
+    Gecacht, da sich bei gleichem Ratio-Slider dieselben (Position, Breite)-Paare wiederholen.
+    Gibt None zurück, wenn der String weniger als vier Felder hat.
+    """
+    # Nur die Breite per Slice ersetzen statt split/join
+    c1 = position.find(',')
+    if c1 < 0:
+        return None
+    c2 = position.find(',', c1 + 1)
+    if c2 < 0:
+        return None
+    c3 = position.find(',', c2 + 1)
+    if c3 < 0:
+        return None
+    return f"{position[:c2 + 1]}{new_width}{position[c3:]}"
+
+
+# Von validate_layout gesetzte Schlüssel; gelten nur für genau das validierte dict
+_VALIDATION_KEYS = ('__validated__', 'validation_status', 'validation_warnings')
+
+
+def _derived_layout(layout_dict: Dict[str, Any], **updates: Any) -> Dict[str, Any]:
+    """Neues Layout aus layout_dict und updates, ohne die Validierungs-Schlüssel der Vorlage"""
+    result = {**layout_dict, **updates}
+    for key in _VALIDATION_KEYS:
+        result.pop(key, None)
+    return result
+
+
+def _clip(value, lower, upper):
+    """Begrenzt value auf [lower, upper] – identisch zu max(lower, min(upper, value)), ohne zwei Builtin-Aufrufe"""
+    value = value if value < upper else upper
+    return value if value > lower else lower
+
+
+@dataclass(frozen=True)
+class LayoutSpec:
+    """Beschreibung eines Split-artigen Layouts für LayoutEngine._calculate_generic"""
+    description: str
+    text_zones: Tuple[str, ...]
+    margin: int
+    image_zone: Optional[str] = None
+    image_x: Optional[Callable[[int], int]] = None  # None: nur die Breite der Bild-Zone wird gesetzt
+    gutter: int = 60  # Abstand zwischen Text und Bild für die Breitenberechnung
+    text_after_image: bool = False
+    adaptive_position: bool = True
+    extended_values: bool = False
+    touched_zones: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Menge der veränderten Zonen für _copy_touched_zones (Text-Zonen plus Bild-Zone)
+        image_zones = (self.image_zone,) if self.image_zone else ()
+        object.__setattr__(self, 'touched_zones', frozenset(self.text_zones + image_zones))
+
+
+_LAYOUT_SPECS: Dict[str, LayoutSpec] = {
+    'vertical_split': LayoutSpec(
+        'Vertikale Aufteilung (Text links, Bild rechts)',
+        _TEXT_ZONES_VERTICAL_SPLIT, 80,
+        image_zone='image_motiv', image_x=lambda text_width: text_width + 60,  # 60px Abstand vom Text
+        extended_values=True
+    ),
+    'vertical_split_left': LayoutSpec(
+        'Vertikale Aufteilung (Motiv links, Text rechts)',
+        _TEXT_ZONES_SPLIT_STANDORT, 80,
+        image_zone='motiv_area', image_x=lambda text_width: 0,  # Motiv startet links
+        text_after_image=True
+    ),
+    'horizontal_split': LayoutSpec(
+        'Horizontale Aufteilung (Bild links, Text rechts)',
+        _TEXT_ZONES_SPLIT, 40,
+        image_zone='image_motiv', gutter=20  # 20px Abstand statt 60px
+    ),
+    'modern_split': LayoutSpec(
+        'Modernes Split-Layout',
+        _TEXT_ZONES_SPLIT_STANDORT, 80,
+        image_zone='image_motiv', image_x=lambda text_width: text_width + 60
+    ),
+    'minimalist': LayoutSpec(
+        'Minimalistisches Layout', _TEXT_ZONES_SPLIT, 40
+    ),
+    'portfolio': LayoutSpec(
+        'Portfolio-Layout', _TEXT_ZONES_SPLIT, 40,
+        adaptive_position=False
+    ),
+    'infographic': LayoutSpec(
+        'Infographic-Layout', _TEXT_ZONES_INFOGRAPHIC, 40
+    ),
+    'magazine': LayoutSpec(
+        'Magazine-Layout', _TEXT_ZONES_MAGAZINE, 40
+    ),
+}
+
+
+def _spec_handler(layout_type: str) -> Callable[..., Dict[str, Any]]:
+    """Erzeugt eine Berechnungsmethode, die an _calculate_generic mit der passenden Spec delegiert"""
+    spec = _LAYOUT_SPECS[layout_type]
+
+    def handler(self, *params):
+        return self._calculate_generic(spec, *params)
+
+    handler.__doc__ = f"Berechnet Koordinaten für {spec.description}"
+    return handler
+
+
+# Container-Styling für sichtbare Grid-Container (background_opacity wird pro Aufruf gesetzt)
+_GRID_CONTAINER_STYLE = MappingProxyType({
+    'background_color': '#FFFFFF',
+    'background_opacity': None,
+    'border_radius': 12,
+    'border_color': '#E0E0E0',
+    'border_width': 1,
+    'shadow_color': '#000000',
+    'shadow_opacity': 0.1,
+    'shadow_blur': 8,
+    'shadow_offset_x': 0,
+    'shadow_offset_y': 2
+})
+
+
+@dataclass(frozen=True)
+class ContainerLayoutSpec:
+    """Beschreibung eines Container-Layouts mit Hintergrund-Motiv für LayoutEngine._calculate_container_layout"""
+    description: str
+    positions: str  # Schlüssel in _POSITION_TABLES
+    text_zones: Tuple[str, ...]
+    group_geometry: Optional[Callable[[int, int, int], Tuple[int, int, int, int]]] = None  # aus _make_group_geometry
+    group_anchor: bool = False  # Positionen relativ zur zentrierten Container-Gruppe statt zum Canvas
+    inverse_scale: bool = False  # Container schrumpfen mit steigendem Ratio
+    clamp_to_canvas: bool = False
+    container_style: Optional[MappingProxyType] = None  # Vorlage für sichtbare Container (background_opacity je Aufruf)
+    extra_values: Tuple[Tuple[str, Any], ...] = ()
+    touched_zones: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Menge der veränderten Zonen für _copy_touched_zones (Text-Zonen plus Hintergrund-Motiv)
+        object.__setattr__(self, 'touched_zones', frozenset(self.text_zones + ('motiv_area',)))
+
+
+_CONTAINER_LAYOUT_SPECS: Dict[str, ContainerLayoutSpec] = {
+    'centered_layout': ContainerLayoutSpec(
+        'zentriertes Layout mit Hintergrund-Motiv und sichtbaren Containern',
+        'centered', _TEXT_ZONES_CENTERED,
+        group_geometry=_STANDARD_GROUP_GEOMETRY, group_anchor=True
+    ),
+    'diagonal_layout': ContainerLayoutSpec(
+        'diagonales Layout mit Hintergrund-Motiv und diagonal angeordneten Containern',
+        'diagonal', _TEXT_ZONES_CENTERED,
+        group_geometry=_DIAGONAL_GROUP_GEOMETRY, clamp_to_canvas=True,
+        extra_values=(('layout_style', 'diagonal_arrangement'),)
+    ),
+    'asymmetric_layout': ContainerLayoutSpec(
+        'asymmetrisches Layout mit Hintergrund-Motiv und inverser Slider-Logik',
+        'asymmetric', _TEXT_ZONES_ASYMMETRIC,
+        inverse_scale=True, clamp_to_canvas=True,
+        extra_values=(('layout_style', 'asymmetric_arrangement'), ('inverse_logic', True))
+    ),
+    'grid_layout': ContainerLayoutSpec(
+        'Grid Layout mit Hintergrund-Motiv und sichtbaren Containern (ohne Headline)',
+        'grid', _TEXT_ZONES_GRID,
+        group_geometry=_STANDARD_GROUP_GEOMETRY, group_anchor=True, container_style=_GRID_CONTAINER_STYLE,
+        extra_values=(('layout_style', 'grid_arrangement'), ('no_headline', True))
+    ),
+}
+
+
+@dataclass(frozen=True)
+class TransparencyTarget:
+    """Felder eines berechneten Layouts, die allein vom Transparenz-Slider abhängen (für update_transparency)"""
+    zones: Tuple[str, ...]
+    zone_transparency: bool = True  # Zone erhält 'transparency' = 0.0-1.0
+    style_key: Optional[str] = None  # zusätzlich/alternativ ein Feld in container_style
+    raw_value: bool = False  # calculated_values['container_transparency'] enthält den Slider-Wert statt 0.0-1.0
+
+
+_TRANSPARENCY_TARGETS: Dict[str, TransparencyTarget] = {
+    **{
+        layout_type: TransparencyTarget(spec.text_zones)
+        for layout_type, spec in _LAYOUT_SPECS.items()
+    },
+    **{
+        layout_type: TransparencyTarget(
+            spec.text_zones, style_key='background_opacity' if spec.container_style is not None else None
+        )
+        for layout_type, spec in _CONTAINER_LAYOUT_SPECS.items()
+    },
+    'hero_layout': TransparencyTarget(_HERO_ZONE_NAMES, raw_value=True),
+    'storytelling_layout': TransparencyTarget(
+        _STORYTELLING_ZONE_NAMES, zone_transparency=False, style_key='opacity', raw_value=True
+    ),
+    'split_layout': TransparencyTarget(_TEXT_ZONES_SPLIT_LAYOUT, raw_value=True),
+}
+
+
+def _container_handler(layout_type: str) -> Callable[..., Dict[str, Any]]:
+    """Erzeugt eine Berechnungsmethode, die an _calculate_container_layout mit der passenden Spec delegiert"""
+    spec = _CONTAINER_LAYOUT_SPECS[layout_type]
+
+    def handler(self, *params):
+        return self._calculate_container_layout(spec, *params)
+
+    handler.__doc__ = f"Berechnet Koordinaten für {spec.description}"
+    return handler
 
 
 class LayoutEngine:
@@ -25,16 +448,25 @@ class LayoutEngine:
     Engine für die dynamische Berechnung von Layout-Koordinaten
     """
     
-    def __init__(self):
-        # Canvas-Werte werden aus dem Layout geladen
-        self.canvas_width = None
-        self.canvas_height = None
-        # Erhöhte Mindestbreiten für bessere Lesbarkeit
-        self.min_text_width = 250  # Erhöht von 300
-        self.max_text_width = 800
-        self.min_image_width = 150
-        self.max_image_width = 900
-        
+    # Zustandslos: Canvas-Maße werden pro Aufruf weitergereicht, Breitengrenzen sind Klassenkonstanten
+    __slots__ = ()
+    
+    # Erhöhte Mindestbreiten für bessere Lesbarkeit (klassenweit, Grundlage für den Breiten-Cache)
+    min_text_width = 250  # Erhöht von 300
+    max_text_width = 800
+    min_image_width = 150
+    max_image_width = 900
+    
+    # Unveränderlicher Basis-Style der Storytelling-Container ('opacity' wird pro Aufruf gesetzt)
+    _STORYTELLING_BASE_STYLE = MappingProxyType({
+        'background_color': '#FFFFFF',
+        'opacity': 1.0,
+        'border_radius': 16,
+        'shadow': '0 4px 8px rgba(0,0,0,0.1)',
+        'border': 'none',
+        'outline': 'none'
+    })
+    
     def calculate_layout_coordinates(
         self, 
         layout_dict: Dict[str, Any],
@@ -68,10 +500,8 @@ class LayoutEngine:
         Returns:
             Layout-Dictionary mit berechneten Koordinaten und erweiterten Slider-Werten
         """
-        # Lade Canvas-Dimensionen aus dem Layout
-        canvas = layout_dict.get('canvas', {})
-        self.canvas_width = canvas.get('width', 1080)
-        self.canvas_height = canvas.get('height', 1080)
+        # Lade Canvas-Dimensionen aus dem Layout (einmalig, als Parameter weitergereicht)
+        canvas_width, canvas_height = _canvas_dims(layout_dict)
         
         # Validiere erweiterte Slider-Werte
         image_text_ratio = self._validate_ratio(image_text_ratio)
@@ -85,66 +515,77 @@ class LayoutEngine:
         elevation_level = self._validate_elevation_level(elevation_level)
         
         # Berechne tatsächliche Breiten basierend auf dem Ratio
-        text_width, image_width = self._calculate_widths(image_text_ratio, self.canvas_width)
+        text_width, image_width = self._calculate_widths(image_text_ratio, canvas_width)
         
         # Bestimme Layout-Typ und führe entsprechende Berechnung durch
         layout_type = layout_dict.get('layout_type', 'vertical_split')
         
         # Erweiterte Parameter für alle Layout-Funktionen
-        extended_params = (layout_dict, text_width, image_width, container_transparency, image_text_ratio,
+        extended_params = (layout_dict, canvas_width, canvas_height, text_width, image_width, container_transparency,
+                          self._norm_transparency(container_transparency), image_text_ratio,
                           element_spacing, container_padding, shadow_intensity, grain_amount, 
                           tint_strength, glow_intensity, elevation_level)
         
-        if layout_type == 'vertical_split':
-            result = self._calculate_vertical_split(*extended_params)
-        elif layout_type == 'vertical_split_left':
-            result = self._calculate_vertical_split_left(*extended_params)
-        elif layout_type == 'horizontal_split':
-            result = self._calculate_horizontal_split(*extended_params)
-        elif layout_type == 'modern_split':
-            result = self._calculate_modern_split(*extended_params)
-        elif layout_type == 'minimalist':
-            result = self._calculate_minimalist_layout(*extended_params)
-        elif layout_type == 'hero_layout':
-            result = self._calculate_hero_layout(*extended_params)
-        elif layout_type == 'portfolio':
-            result = self._calculate_portfolio_layout(*extended_params)
-        elif layout_type == 'storytelling_layout':
-            result = self._calculate_storytelling_layout(*extended_params)
-        elif layout_type == 'infographic':
-            result = self._calculate_infographic_layout(*extended_params)
-        elif layout_type == 'magazine':
-            result = self._calculate_magazine_layout(*extended_params)
-        elif layout_type == 'centered_layout':
-            result = self._calculate_centered_layout(*extended_params)
-        elif layout_type == 'diagonal_layout':
-            result = self._calculate_diagonal_layout(*extended_params)
-        elif layout_type == 'asymmetric_layout':
-            result = self._calculate_asymmetric_layout(*extended_params)
-        elif layout_type == 'grid_layout':
-            result = self._calculate_grid_layout(*extended_params)
-        elif layout_type == 'split_layout':
-            result = self._calculate_split_layout(*extended_params)
-        else:
-            # Fallback: Verwende vertikales Split
-            result = self._calculate_vertical_split(*extended_params)
+        # Dispatch-Tabelle statt if/elif-Kette; unbekannte Typen fallen auf vertikales Split zurück
+        handler = LayoutEngine._LAYOUT_DISPATCH.get(layout_type, LayoutEngine._calculate_vertical_split)
+        result = handler(self, *extended_params)
         
         return result
     
-    def _validate_ratio(self, ratio) -> int:
+    def update_transparency(self, calculated_layout: Dict[str, Any], container_transparency: int = 80) -> Dict[str, Any]:
+        """
+        Setzt nur die transparenzabhängigen Felder eines bereits berechneten Layouts neu
+        
+        Für Änderungen allein am Transparenz-Slider: Das Ergebnis entspricht
+        calculate_layout_coordinates mit dem neuen Wert (übrige Slider unverändert),
+        ohne die Geometrie neu zu berechnen. Das übergebene Layout wird nicht verändert.
+        
+        Args:
+            calculated_layout: Ergebnis von calculate_layout_coordinates
+            container_transparency: Neuer Slider-Wert 10-90
+            
+        Returns:
+            Layout-Dictionary mit aktualisierter Transparenz
+        """
+        transparency = self._validate_transparency(container_transparency)
+        t_norm = self._norm_transparency(transparency)
+        
+        # Unbekannte Typen wurden wie vertikales Split berechnet
+        layout_type = calculated_layout.get('layout_type', 'vertical_split')
+        target = _TRANSPARENCY_TARGETS.get(layout_type) or _TRANSPARENCY_TARGETS['vertical_split']
+        
+        zones = self._copy_touched_zones(calculated_layout, target.zones)
+        style_key = target.style_key
+        for zone_name in target.zones:
+            zone_data = zones.get(zone_name)
+            if zone_data is None:
+                continue
+            if target.zone_transparency:
+                zone_data['transparency'] = t_norm
+            if style_key is not None:
+                # Eigene Kopie des Styles, das Ausgangs-Layout bleibt unverändert
+                container_style = dict(zone_data['container_style'])
+                container_style[style_key] = t_norm
+                zone_data['container_style'] = container_style
+        
+        calculated_values = dict(calculated_layout.get('calculated_values', {}))
+        calculated_values['container_transparency'] = transparency if target.raw_value else t_norm
+        
+        return _derived_layout(calculated_layout, zones=zones, calculated_values=calculated_values)
+    
+    @staticmethod
+    def _validate_ratio(ratio) -> int:
         """Validiert den image_text_ratio Slider-Wert (erweitert auf 55-85)"""
+        # Schnellpfad für den Normalfall (int vom Slider)
+        if type(ratio) is int:
+            return _clip(ratio, 55, 85)
         # Konvertiere zu int falls String
         if isinstance(ratio, str):
             try:
                 ratio = int(ratio)
             except ValueError:
                 ratio = 70  # Standardwert (erhöht von 50)
-        
-        if ratio < 55:
-            return 55
-        elif ratio > 85:
-            return 85
-        return ratio
+        return _clip(ratio, 55, 85)
     
     def _update_zone_position_for_adaptive_typography(self, zone_data: Dict[str, Any], new_width: int) -> None:
         """
@@ -154,97 +595,116 @@ class LayoutEngine:
             zone_data: Die Zone-Daten
             new_width: Neue Breite der Zone
         """
-        original_position = zone_data.get('position', '')
-        if original_position and ',' in original_position:
-            parts = original_position.split(',')
-            if len(parts) >= 4:
-                # Aktualisiere nur die Breite im Position-String
-                parts[2] = str(new_width)
-                updated_position = ','.join(parts)
-                zone_data['position'] = updated_position
+        position = zone_data.get('position', '')
+        if not position or not isinstance(position, str):
+            return
+        new_position = _position_with_width(position, new_width)
+        if new_position is not None:
+            zone_data['position'] = new_position
+    
+    @staticmethod
+    def _copy_touched_zones(layout_dict: Dict[str, Any], touched_zones: Collection[str]) -> Dict[str, Any]:
+        """
+        Baut das Zonen-Dictionary neu auf und kopiert nur die Zonen, die verändert werden
+        
+        Unberührte Zonen werden geteilt; das Layout des Aufrufers wird nicht mehr mutiert.
+        touched_zones ist im Normalfall ein vorberechnetes frozenset (ein Hash-Lookup je Zone).
+        """
+        return {
+            zone_name: (
+                dict(zone_data)
+                if zone_name in touched_zones and isinstance(zone_data, dict)
+                else zone_data
+            )
+            for zone_name, zone_data in layout_dict.get('zones', {}).items()
+        }
     
     def _update_text_zones_adaptive(
         self, 
         zones: Dict[str, Any], 
-        text_zones: List[str], 
+        text_zones: Tuple[str, ...], 
         text_width: int, 
         margin: int, 
-        transparency: int
+        t_norm: float,
+        update_position: bool = True
     ) -> None:
         """
         Aktualisiert Text-Zonen mit adaptiver Typografie-Unterstützung
         
         Args:
             zones: Dictionary mit allen Zonen
-            text_zones: Liste der Text-Zonen-Namen
+            text_zones: Tupel der Text-Zonen-Namen
             text_width: Verfügbare Text-Breite
             margin: Margin für die Zonen
-            transparency: Transparenz-Wert
+            t_norm: Normierte Transparenz (0.0-1.0)
+            update_position: Ob der Position-String mitgeführt wird
         """
+        max_width = text_width - margin
+        update_zone_position = self._update_zone_position_for_adaptive_typography
         for zone_name in text_zones:
-            if zone_name in zones:
+            original_zone = zones.get(zone_name)
+            if original_zone is not None:
                 # Behalte ursprüngliche x, y, height, z Werte
-                original_zone = zones[zone_name]
-                new_width = min(text_width - margin, original_zone.get('width', 400))
+                new_width = min(max_width, original_zone.get('width', 400))
                 
                 # Aktualisiere Position-String für adaptive Typografie-Berechnung
-                self._update_zone_position_for_adaptive_typography(original_zone, new_width)
+                if update_position:
+                    update_zone_position(original_zone, new_width)
                 
-                zones[zone_name].update({
-                    'width': new_width,
-                    'transparency': transparency / 100
-                })
+                original_zone['width'] = new_width
+                original_zone['transparency'] = t_norm
     
-    def _validate_transparency(self, transparency) -> int:
+    @staticmethod
+    def _validate_transparency(transparency) -> int:
         """Validiert container_transparency (erweitert auf 10-90)"""
+        # Schnellpfad für den Normalfall (int vom Slider)
+        if type(transparency) is int:
+            return _clip(transparency, 10, 90)
         # Konvertiere zu int falls String
         if isinstance(transparency, str):
             try:
                 transparency = int(transparency)
             except ValueError:
                 transparency = 80  # Standardwert
-        
-        if transparency < 10:
-            return 10
-        elif transparency > 90:
-            return 90
-        return transparency
+        return _clip(transparency, 10, 90)
     
-    def _calculate_widths(self, ratio: int, canvas_width: int = 1080) -> Tuple[int, int]:
+    @staticmethod
+    @lru_cache(maxsize=101)
+    def _norm_transparency(transparency: int) -> float:
+        """Normiert container_transparency auf 0.0-1.0 (einmal pro Aufruf, gecacht)"""
+        return transparency / 100
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _calculate_widths(ratio: int, canvas_width: int = 1080, gutter: int = 60) -> Tuple[int, int]:
         """
-        Berechnet Text- und Bild-Breiten basierend auf dem Ratio
+        Berechnet Text- und Bild-Breiten basierend auf dem Ratio (gecacht, reine Arithmetik)
         
         Args:
-            ratio: Slider-Wert 30-70
+            ratio: Slider-Wert 55-85
             canvas_width: Canvas-Breite aus dem Layout
+            gutter: Abstand zwischen Text und Bild in Pixeln
             
         Returns:
             Tuple (text_width, image_width)
         """
-        # Konvertiere Ratio zu Dezimal (30 -> 0.3, 70 -> 0.7)
-        ratio_decimal = ratio / 100
-        
-        # Berechne Bild-Breite (ratio_decimal * Canvas-Breite)
-        image_width = int(ratio_decimal * canvas_width)
-        
-        # Text-Breite ist der Rest minus Abstand
-        text_width = canvas_width - image_width - 60  # 60px Abstand
-        
-        # Validiere Mindest- und Maximalbreiten
-        text_width = max(self.min_text_width, min(self.max_text_width, text_width))
-        image_width = max(self.min_image_width, min(self.max_image_width, image_width))
-        
-        # Passe Bild-Breite an, falls Text-Breite geändert wurde
-        image_width = canvas_width - text_width - 60
-        
-        return text_width, image_width
+        # Arithmetik im (ggf. Numba-kompilierten) Kernel, Ergebnis über lru_cache wiederverwendet
+        return calc_widths(
+            ratio, canvas_width,
+            LayoutEngine.min_text_width, LayoutEngine.max_text_width,
+            gutter
+        )
     
-    def _calculate_vertical_split(
-        self, 
+    def _calculate_generic(
+        self,
+        spec: 'LayoutSpec',
         layout_dict: Dict[str, Any], 
+        canvas_width: int,
+        canvas_height: int,
         text_width: int, 
         image_width: int, 
         transparency: int,
+        t_norm: float,
         image_text_ratio: int = 70,
         element_spacing: int = 24,
         container_padding: int = 24,
@@ -255,249 +715,73 @@ class LayoutEngine:
         elevation_level: int = 1
     ) -> Dict[str, Any]:
         """
-        Berechnet Koordinaten für vertikale Aufteilung (Text links, Bild rechts)
-        """
-        result = layout_dict.copy()
-        
-        # Berechne Positionen für alle Zonen
-        zones = result.get('zones', {})
-        
-        # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['standort_block', 'headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block', 'stellentitel_block']
-        
-        # Verwende Hilfsfunktion für adaptive Typografie
-        self._update_text_zones_adaptive(zones, text_zones, text_width, 80, transparency)
-        
-        # Aktualisiere nur die Bild-Zone
-        if 'image_motiv' in zones:
-            original_zone = zones['image_motiv']
-            zones['image_motiv'].update({
-                'x': text_width + 60,  # 60px Abstand vom Text
-                'width': image_width
-            })
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
+        Gemeinsame Berechnung für Split-artige Layouts, gesteuert über eine LayoutSpec
         
-        # Füge berechnete Werte hinzu (erweitert)
-        result['calculated_values'] = {
-            'text_width': text_width,
-            'image_width': image_width,
-            'container_transparency': transparency / 100,
-            'image_text_ratio': image_text_ratio,
-            'element_spacing': element_spacing,
-            'container_padding': container_padding,
-            'shadow_intensity': shadow_intensity,
-            'grain_amount': grain_amount,
-            'tint_strength': tint_strength,
-            'glow_intensity': glow_intensity,
-            'elevation_level': elevation_level
-        }
-        
-        return result
-    
-    def _calculate_vertical_split_left(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int,
-        image_text_ratio: int = 50
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für vertikale Aufteilung (Motiv links, Text rechts)
+        Text-Zonen erhalten die verfügbare Breite (minus Margin), optional wird die
+        Bild-Zone neben dem Text platziert bzw. der Text rechts neben das Motiv gesetzt.
         """
-        result = layout_dict.copy()
+        image_zone = spec.image_zone
+        zones = self._copy_touched_zones(layout_dict, spec.touched_zones)
         
-        # Berechne Positionen für alle Zonen
-        zones = result.get('zones', {})
+        # Breiten mit abweichendem Abstand neu aus dem Ratio berechnen (gecacht)
+        if spec.gutter != 60:
+            text_width, image_width = self._calculate_widths(image_text_ratio, canvas_width, spec.gutter)
         
         # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['standort_block', 'headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block']
-        
-        # Verwende Hilfsfunktion für adaptive Typografie
-        self._update_text_zones_adaptive(zones, text_zones, text_width, 80, transparency)
+        self._update_text_zones_adaptive(
+            zones, spec.text_zones, text_width, spec.margin, t_norm, spec.adaptive_position
+        )
         
-        # Aktualisiere nur die Bild-Zone (Motiv links)
-        if 'motiv_area' in zones:
-            original_zone = zones['motiv_area']
-            zones['motiv_area'].update({
-                'x': 0,  # Motiv startet links
-                'width': image_width
-            })
-        
-        # Aktualisiere Text-Positionen (Text rechts)
-        for zone_name in text_zones:
-            if zone_name in zones:
-                zones[zone_name].update({
-                    'x': image_width + 60  # 60px Abstand vom Motiv
-                })
+        # Aktualisiere nur die Bild-Zone
+        if image_zone:
+            motiv_zone = zones.get(image_zone)
+            if motiv_zone is not None:
+                if spec.image_x is not None:
+                    motiv_zone['x'] = spec.image_x(text_width)
+                motiv_zone['width'] = image_width
+        
+        # Text rechts neben dem Motiv (60px Abstand)
+        if spec.text_after_image:
+            for zone_name in spec.text_zones:
+                original_zone = zones.get(zone_name)
+                if original_zone is not None:
+                    original_zone['x'] = image_width + 60
         
         # Aktualisiere das Layout
-        result['zones'] = zones
+        result = _derived_layout(layout_dict, zones=zones)
         
         # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
+        calculated_values = {
             'text_width': text_width,
             'image_width': image_width,
-            'container_transparency': transparency / 100,
+            'container_transparency': t_norm,
             'image_text_ratio': image_text_ratio
         }
-        
-        return result
-    
-    def _calculate_horizontal_split(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int,
-        image_text_ratio: int = 50
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für horizontale Aufteilung (Bild links, Text rechts)
-        """
-        result = layout_dict.copy()
-        
-        # Bei horizontaler Aufteilung ist das Verhältnis umgekehrt
-        # 30% Ratio = 70% Bild, 30% Text
-        # 70% Ratio = 30% Bild, 70% Text
-        
-        # Berechne tatsächliche Breiten
-        actual_image_width = int((100 - transparency) / 100 * self.canvas_width)
-        actual_text_width = self.canvas_width - actual_image_width - 20  # 20px Abstand
-        
-        # Validiere Breiten
-        actual_text_width = max(self.min_text_width, min(self.max_text_width, actual_text_width))
-        actual_image_width = max(self.min_image_width, min(self.max_image_width, actual_image_width))
-        
-        zones = result.get('zones', {})
-        
-        # Aktualisiere nur die Bild-Zone
-        if 'image_motiv' in zones:
-            original_zone = zones['image_motiv']
-            zones['image_motiv'].update({
-                'width': actual_image_width
+        if spec.extended_values:
+            calculated_values.update({
+                'element_spacing': element_spacing,
+                'container_padding': container_padding,
+                'shadow_intensity': shadow_intensity,
+                'grain_amount': grain_amount,
+                'tint_strength': tint_strength,
+                'glow_intensity': glow_intensity,
+                'elevation_level': elevation_level
             })
-        
-        # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block']
-        
-        # Verwende Hilfsfunktion für adaptive Typografie
-        self._update_text_zones_adaptive(zones, text_zones, actual_text_width, 40, transparency)
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
-            'text_width': actual_text_width,
-            'image_width': actual_image_width,
-            'container_transparency': transparency / 100,
-            'image_text_ratio': image_text_ratio  # Korrigierter Slider-Wert
-        }
-        
-        return result
-    
-    def _calculate_modern_split(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für modernes Split-Layout
-        """
-        result = layout_dict.copy()
-        
-        zones = result.get('zones', {})
-        
-        # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['standort_block', 'headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block']
-        
-        for zone_name in text_zones:
-            if zone_name in zones:
-                # Behalte ursprüngliche x, y, height, z Werte
-                original_zone = zones[zone_name]
-                new_width = min(text_width - 80, original_zone.get('width', 400))  # 80px Margins
-                
-                # Aktualisiere Position-String für adaptive Typografie-Berechnung
-                original_position = original_zone.get('position', '')
-                if original_position and ',' in original_position:
-                    parts = original_position.split(',')
-                    if len(parts) >= 4:
-                        # Aktualisiere nur die Breite im Position-String
-                        parts[2] = str(new_width)
-                        updated_position = ','.join(parts)
-                        zones[zone_name]['position'] = updated_position
-                
-                zones[zone_name].update({
-                    'width': new_width,
-                    'transparency': transparency / 100
-                })
-        
-        # Aktualisiere nur die Bild-Zone
-        if 'image_motiv' in zones:
-            original_zone = zones['image_motiv']
-            zones['image_motiv'].update({
-                'x': text_width + 60,  # 60px Abstand vom Text
-                'width': image_width
-            })
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
-            'text_width': text_width,
-            'image_width': image_width,
-            'container_transparency': transparency / 100,
-            'image_text_ratio': transparency
-        }
-        
-        return result
-    
-    def _calculate_minimalist_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für minimalistisches Layout
-        """
-        result = layout_dict.copy()
-        
-        zones = result.get('zones', {})
-        
-        # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block']
-        
-        # Verwende Hilfsfunktion für adaptive Typografie
-        self._update_text_zones_adaptive(zones, text_zones, text_width, 40, transparency)
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
-            'text_width': text_width,
-            'image_width': image_width,
-            'container_transparency': transparency / 100,
-            'image_text_ratio': transparency
-        }
+        result['calculated_values'] = calculated_values
         
         return result
     
     def _calculate_hero_layout(
         self, 
         layout_dict: Dict[str, Any], 
+        canvas_width: int,
+        canvas_height: int,
         text_width: int, 
         image_width: int, 
         transparency: int,
-        image_text_ratio: int = 50
+        t_norm: float,
+        image_text_ratio: int = 50,
+        *_extended_params: int
     ) -> Dict[str, Any]:
         """
         Berechnet Koordinaten für Hero-Layout (Skizze 8)
@@ -506,80 +790,49 @@ class LayoutEngine:
         - CTA rechts oben, kleiner
         - Benefits statt Subline
         """
-        result = layout_dict.copy()
-        zones = result.get('zones', {}).copy()
-        calculated_values = {}
+        # Eigene Kopien nur der veränderten Zonen, danach direkte Zuweisung
+        zones = self._copy_touched_zones(layout_dict, _TOUCHED_HERO)
         
-        # Hero-Layout Positionen basierend auf Skizze 8 (korrigiert für unteren Bereich)
-        hero_positions = {
-            'standort_block': {'x': 0.05, 'y': 0.55, 'width': 0.37, 'height': 0.06},      # Unten links
-            'logo_block': {'x': 0.58, 'y': 0.55, 'width': 0.37, 'height': 0.06},          # Unten rechts
-            'headline_block': {'x': 0.05, 'y': 0.62, 'width': 0.25, 'height': 0.06},      # Links, NOCH KLEINER
-            'subline_block': {'x': 0.05, 'y': 0.70, 'width': 0.37, 'height': 0.06},       # Unter Headline
-            'benefits_block': {'x': 0.05, 'y': 0.78, 'width': 0.37, 'height': 0.11},      # Unter Subline
-            'stellentitel_block': {'x': 0.05, 'y': 0.90, 'width': 0.37, 'height': 0.09},  # Ganz unten links
-            'cta_block': {'x': 0.70, 'y': 0.65, 'width': 0.20, 'height': 0.08}            # MITTIG RECHTS
-        }
-        
-        # Text-Zonen für Hero Layout
-        text_zones = ['standort_block', 'logo_block', 'headline_block', 'subline_block', 'benefits_block', 'stellentitel_block', 'cta_block']
-        
-        # Aktualisiere Text-Zonen mit Hero-Positionen
-        for zone_name in text_zones:
-            if zone_name in zones and zone_name in hero_positions:
-                original_zone = zones[zone_name]
-                pos = hero_positions[zone_name]
-                
-                # Berechne absolute Koordinaten
-                x = int(pos['x'] * self.canvas_width)
-                y = int(pos['y'] * self.canvas_height)
-                width = int(pos['width'] * self.canvas_width)
-                height = int(pos['height'] * self.canvas_height)
-                
+        # Aktualisiere Text-Zonen mit Hero-Positionen (Skizze 8, je Canvas-Größe vorberechnet)
+        for zone_name, (x, y, width, height) in _scaled_positions('hero', canvas_width, canvas_height):
+            zone_data = zones.get(zone_name)
+            if zone_data is not None:
                 # Nur Geometrie + Transparenz, Styling erfolgt im Resolver-Post-Step
-                zones[zone_name] = {
-                    **original_zone,
-                    'x': x,
-                    'y': y,
-                    'width': width,
-                    'height': height,
-                    'transparency': transparency / 100
-                }
+                zone_data['x'] = x
+                zone_data['y'] = y
+                zone_data['width'] = width
+                zone_data['height'] = height
+                zone_data['transparency'] = t_norm
         
         # Berechne dynamische Y-Koordinate für Motivzone basierend auf Slider
         # Höherer Slider-Wert = kleinere Y-Koordinate = mehr Bildfläche
-        base_motiv_y = 540  # Standard: Mitte des Canvas
-        motiv_y_range = 200  # Bereich von 340 bis 740
-        
         # Slider-Logik: 30% = 340px (wenig Bild), 70% = 740px (viel Bild)
-        # Formel: Y = 340 + (ratio - 30) * (740 - 340) / (70 - 30)
-        dynamic_motiv_y = 340 + (image_text_ratio - 30) * (740 - 340) / (70 - 30)
-        dynamic_motiv_y = max(340, min(740, dynamic_motiv_y))  # Begrenze auf sinnvolle Werte
+        # Formel: Y = 340 + (ratio - 30) * (740 - 340) / (70 - 30) = 340 + (ratio - 30) * 10
+        # _validate_ratio klemmt auf 55-85, daher greift nur noch die obere Grenze (ab 70%)
+        dynamic_motiv_y = min(740, 340 + (image_text_ratio - 30) * 10.0)
         
         # Berechne Motiv-Höhe basierend auf Y-Koordinate
-        dynamic_motiv_height = self.canvas_height - dynamic_motiv_y
+        dynamic_motiv_height = canvas_height - dynamic_motiv_y
         
         # Motiv-Zone mit dynamischer Y-Koordinate (bedeckt kompletten oberen Bereich)
-        if 'motiv_area' in zones:
-            zones['motiv_area'] = {
-                **zones['motiv_area'],
-                'x': 0,
-                'y': 0,  # Motiv startet immer oben (Y=0)
-                'width': self.canvas_width,
-                'height': int(dynamic_motiv_y),  # Höhe bis zur dynamischen Y-Koordinate
-                'transparency': 1.0
-            }
+        motiv_zone = zones.get('motiv_area')
+        if motiv_zone is not None:
+            motiv_zone['x'] = 0
+            motiv_zone['y'] = 0  # Motiv startet immer oben (Y=0)
+            motiv_zone['width'] = canvas_width
+            motiv_zone['height'] = int(dynamic_motiv_y)  # Höhe bis zur dynamischen Y-Koordinate
+            motiv_zone['transparency'] = 1.0
         
         # Berechne Werte für semantische Beschreibung
-        calculated_values.update({
+        calculated_values = {
             'image_text_ratio': image_text_ratio,
             'container_transparency': transparency,
             'dynamic_motiv_y': dynamic_motiv_y,
             'dynamic_motiv_height': dynamic_motiv_height,
-            'motiv_y_percent': round(dynamic_motiv_y / self.canvas_height * 100, 1),
+            'motiv_y_percent': round(dynamic_motiv_y / canvas_height * 100, 1),
             'layout_style': 'hero_arrangement',
             'hero_logic': 'higher_slider_smaller_y'
-        })
+        }
         
         return {
             'zones': zones,
@@ -587,55 +840,17 @@ class LayoutEngine:
             'layout_type': 'hero_layout'
         }
     
-    def _calculate_portfolio_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für Portfolio-Layout
-        """
-        result = layout_dict.copy()
-        
-        zones = result.get('zones', {})
-        
-        # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['headline_block', 'subline_block', 'benefits_block', 'company_block', 'cta_block']
-        
-        for zone_name in text_zones:
-            if zone_name in zones:
-                # Behalte ursprüngliche x, y, height, z Werte
-                original_zone = zones[zone_name]
-                new_width = min(text_width - 40, original_zone.get('width', 400))  # 40px Margins
-                
-                zones[zone_name].update({
-                    'width': new_width,
-                    'transparency': transparency / 100
-                })
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
-            'text_width': text_width,
-            'image_width': image_width,
-            'container_transparency': transparency / 100,
-            'image_text_ratio': transparency
-        }
-        
-        return result
-    
-
     def _calculate_storytelling_layout(
         self, 
         layout_dict: Dict[str, Any], 
+        canvas_width: int,
+        canvas_height: int,
         text_width: int, 
         image_width: int, 
         transparency: int,
-        image_text_ratio: int = 50
+        t_norm: float,
+        image_text_ratio: int = 50,
+        *_extended_params: int
     ) -> Dict[str, Any]:
         """
         Berechnet Koordinaten für Skizze 9 - Dual Headline Layout
@@ -644,72 +859,32 @@ class LayoutEngine:
         - Motiv als Vollbild-Hintergrund
         - Alle Textelemente in eigenen Containern
         """
-        result = layout_dict.copy()
-        zones = result.get('zones', {}).copy()
-        calculated_values = {}
-
-        # Skizze 9 Positionen - Dual Headline Layout
-        storytelling_positions = {
-            'standort_block': {'x': 0.05, 'y': 0.05, 'width': 0.45, 'height': 0.06},      # Oben links
-            'headline_1_block': {'x': 0.05, 'y': 0.15, 'width': 0.45, 'height': 0.08},    # Erste Headline
-            'headline_2_block': {'x': 0.05, 'y': 0.25, 'width': 0.45, 'height': 0.08},    # Zweite Headline
-            'subline_block': {'x': 0.05, 'y': 0.35, 'width': 0.45, 'height': 0.06},       # Unter Headlines
-            'stellentitel_block': {'x': 0.05, 'y': 0.45, 'width': 0.45, 'height': 0.08},  # Stellentitel
-            'cta_block': {'x': 0.05, 'y': 0.55, 'width': 0.45, 'height': 0.08}            # CTA
-        }
-
-        # Text-Zonen für Skizze 9 (KEINE Benefits!)
-        text_zones = ['standort_block', 'headline_1_block', 'headline_2_block', 'subline_block', 'stellentitel_block', 'cta_block']
+        # Eigene Kopien nur der veränderten Zonen, danach direkte Zuweisung
+        zones = self._copy_touched_zones(layout_dict, _TOUCHED_STORYTELLING)
 
-        # Aktualisiere Text-Zonen mit Skizze 9 Positionen
-        for zone_name in text_zones:
-            if zone_name in zones and zone_name in storytelling_positions:
-                original_zone = zones[zone_name]
-                pos = storytelling_positions[zone_name]
-
-                # Berechne absolute Koordinaten
-                x = int(pos['x'] * self.canvas_width)
-                y = int(pos['y'] * self.canvas_height)
-                width = int(pos['width'] * self.canvas_width)
-                height = int(pos['height'] * self.canvas_height)
-
-                # Container-Style für sichtbare Container
-                container_style = {
-                    'background_color': '#FFFFFF',
-                    'opacity': transparency / 100,
-                    'border_radius': 16,
-                    'shadow': '0 4px 8px rgba(0,0,0,0.1)',
-                    'border': 'none',
-                    'outline': 'none'
-                }
-
-                zones[zone_name] = {
-                    **original_zone,
-                    'x': x,
-                    'y': y,
-                    'width': width,
-                    'height': height,
-                    'container_style': container_style
-                }
+        # Aktualisiere Text-Zonen mit Skizze 9 Positionen (je Canvas-Größe vorberechnet)
+        for zone_name, (x, y, width, height) in _scaled_positions('storytelling', canvas_width, canvas_height):
+            original_zone = zones.get(zone_name)
+            if original_zone is not None:
+                original_zone['x'] = x
+                original_zone['y'] = y
+                original_zone['width'] = width
+                original_zone['height'] = height
+                # Container-Style für sichtbare Container (nur die Opacity variiert)
+                original_zone['container_style'] = {**self._STORYTELLING_BASE_STYLE, 'opacity': t_norm}
 
         # Motiv-Zone als Vollbild-Hintergrund
-        if 'motiv_area' in zones:
-            zones['motiv_area'] = {
-                **zones['motiv_area'],
-                'x': 0,
-                'y': 0,
-                'width': self.canvas_width,
-                'height': self.canvas_height,
-                'transparency': 1.0
-            }
+        motiv_zone = zones.get('motiv_area')
+        if motiv_zone is not None:
+            motiv_zone.update(_full_canvas_motiv(canvas_width, canvas_height))
 
         # Berechne Werte für semantische Beschreibung
-        calculated_values.update({
+        calculated_values = {
             'image_text_ratio': image_text_ratio,
             'container_transparency': transparency,
             'layout_style': 'dual_headline_arrangement',
             'storytelling_logic': 'full_background_motiv'
-        })
+        }
 
         return {
             'zones': zones,
@@ -719,565 +894,168 @@ class LayoutEngine:
         }
 
 
-    def _calculate_infographic_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für Infographic-Layout
-        """
-        result = layout_dict.copy()
-        
-        zones = result.get('zones', {})
-        
-        # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['headline_block', 'subline_block', 'infographic_block', 'cta_block']
-        
-        # Verwende Hilfsfunktion für adaptive Typografie
-        self._update_text_zones_adaptive(zones, text_zones, text_width, 40, transparency)
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
-            'text_width': text_width,
-            'image_width': image_width,
-            'container_transparency': transparency / 100,
-            'image_text_ratio': transparency
-        }
-        
-        return result
-
-
-    def _calculate_magazine_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für Magazine-Layout
-        """
-        result = layout_dict.copy()
-        
-        zones = result.get('zones', {})
-        
-        # Aktualisiere nur die Breiten der Text-Zonen, behalte ursprüngliche Positionen
-        text_zones = ['headline_block', 'subline_block', 'content_block', 'cta_block']
-        
-        # Verwende Hilfsfunktion für adaptive Typografie
-        self._update_text_zones_adaptive(zones, text_zones, text_width, 40, transparency)
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
-            'text_width': text_width,
-            'image_width': image_width,
-            'container_transparency': transparency / 100,
-            'image_text_ratio': transparency
-        }
-        
-        return result
-
-    def _calculate_centered_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
+    def _calculate_container_layout(
+        self,
+        spec: 'ContainerLayoutSpec',
+        layout_dict: Dict[str, Any],
+        canvas_width: int,
+        canvas_height: int,
+        text_width: int,
+        image_width: int,
         transparency: int,
-        image_text_ratio: int = 50
+        t_norm: float,
+        image_text_ratio: int = 50,
+        *_extended_params: int
     ) -> Dict[str, Any]:
         """
-        Berechnet Koordinaten für zentriertes Layout mit Hintergrund-Motiv und sichtbaren Containern
+        Gemeinsame Berechnung für Container-Layouts mit Hintergrund-Motiv (Centered, Diagonal, Asymmetric, Grid)
         
-        Bei Hintergrund-Motiven:
-        - 30% Ratio = Kleinere Container-Gruppe, mehr Hintergrund-Motiv sichtbar
-        - 70% Ratio = Größere Container-Gruppe, weniger Hintergrund-Motiv sichtbar
+        Das Motiv ist der gesamte Hintergrund, das Ratio steuert die Größe der Container:
+        - Container-Gruppe: Je höher das Ratio, desto größer die Gruppe (weniger Motiv sichtbar)
+        - Inverse Skalierung: Je höher das Ratio, desto kleiner die Container (mehr Motiv sichtbar)
         - Container-Transparenz steuert die Sichtbarkeit der Container
         """
-        result = layout_dict.copy()
-        zones = result.get('zones', {})
-        
-        # Bei zentrierten Layouts ist das Motiv der gesamte Hintergrund
-        # Das Verhältnis steuert die Größe der gesamten Container-Gruppe
-        
-        # Berechne Container-Gruppen-Größe basierend auf dem Ratio
-        # 30% = kleinere Container-Gruppe (mehr Motiv sichtbar)
-        # 70% = größere Container-Gruppe (weniger Motiv sichtbar)
-        ratio_factor = image_text_ratio / 100  # 0.3 bis 0.7
-        
-        # Container-Gruppen-Breite: Je höher das Ratio, desto breiter die gesamte Gruppe
-        base_container_width = 500  # Basis-Breite für Container-Gruppe
-        min_container_width = 350   # Minimale Breite
-        max_container_width = 700   # Maximale Breite
-        
-        # Berechne dynamische Container-Gruppen-Breite
-        dynamic_container_width = int(base_container_width * (0.7 + ratio_factor * 0.6))  # 0.7 bis 1.3 Faktor
-        dynamic_container_width = max(min_container_width, min(max_container_width, dynamic_container_width))
-        
-        # Container-Gruppen-Höhe: Je höher das Ratio, desto höher die gesamte Gruppe
-        base_container_height = 800  # Basis-Höhe für Container-Gruppe
-        min_container_height = 600   # Minimale Höhe
-        max_container_height = 1000  # Maximale Höhe
-        
-        dynamic_container_height = int(base_container_height * (0.75 + ratio_factor * 0.5))  # 0.75 bis 1.25 Faktor
-        dynamic_container_height = max(min_container_height, min(max_container_height, dynamic_container_height))
-        
-        # Zentriere die Container-Gruppe
-        container_group_x = (self.canvas_width - dynamic_container_width) // 2
-        container_group_y = (self.canvas_height - dynamic_container_height) // 2
-        
-        # Text-Zonen für zentriertes Layout
-        text_zones = ['standort_block', 'headline_block', 'subline_block', 'benefits_block', 'cta_block']
+        zones = self._copy_touched_zones(layout_dict, spec.touched_zones)
+        calculated_values = {}
         
-        # Berechne relative Positionen innerhalb der Container-Gruppe
-        relative_positions = {
-            'standort_block': {'x': 0.1, 'y': 0.05, 'width': 0.8, 'height': 0.08},
-            'headline_block': {'x': 0.1, 'y': 0.15, 'width': 0.8, 'height': 0.15},
-            'subline_block': {'x': 0.15, 'y': 0.35, 'width': 0.7, 'height': 0.1},
-            'benefits_block': {'x': 0.15, 'y': 0.5, 'width': 0.7, 'height': 0.25},
-            'cta_block': {'x': 0.25, 'y': 0.8, 'width': 0.5, 'height': 0.12}
-        }
+        ref_width, ref_height = canvas_width, canvas_height
+        offset_x = offset_y = 0
+        
+        group_geometry = spec.group_geometry
+        if group_geometry is not None:
+            # Container-Gruppen-Geometrie ist eine reine Funktion von Canvas und Ratio (gecacht)
+            dynamic_container_width, dynamic_container_height, group_x, group_y = group_geometry(
+                canvas_width, canvas_height, image_text_ratio
+            )
+            calculated_values['container_group_width'] = dynamic_container_width
+            calculated_values['container_group_height'] = dynamic_container_height
+            
+            if spec.group_anchor:
+                # Zentrierte Container-Gruppe, Positionen sind relativ zur Gruppe
+                offset_x, offset_y = group_x, group_y
+                ref_width, ref_height = dynamic_container_width, dynamic_container_height
+                calculated_values['container_group_x'] = offset_x
+                calculated_values['container_group_y'] = offset_y
+        
+        if spec.inverse_scale:
+            container_scale = _inverse_container_scale(image_text_ratio)
+            calculated_values['container_scale'] = container_scale
+        
+        # Container-Styling aus der Vorlage, Opazität einmal pro Aufruf eingesetzt
+        container_style = None
+        if spec.container_style is not None:
+            container_style = dict(spec.container_style)
+            container_style['background_opacity'] = t_norm
+        
+        # Spec-Flags und Hilfsmethode einmal lokal binden (keine Attribut-Lookups pro Zone)
+        inverse_scale = spec.inverse_scale
+        clamp_to_canvas = spec.clamp_to_canvas
+        update_position = self._update_zone_position_for_adaptive_typography
         
         # Aktualisiere Text-Zonen mit sichtbaren Containern
-        for zone_name in text_zones:
-            if zone_name in zones and zone_name in relative_positions:
-                original_zone = zones[zone_name]
-                rel_pos = relative_positions[zone_name]
-                
-                # Berechne absolute Positionen basierend auf Container-Gruppe
-                new_x = container_group_x + int(rel_pos['x'] * dynamic_container_width)
-                new_y = container_group_y + int(rel_pos['y'] * dynamic_container_height)
-                new_width = int(rel_pos['width'] * dynamic_container_width)
-                new_height = int(rel_pos['height'] * dynamic_container_height)
-                
-                # Aktualisiere Position-String für adaptive Typografie
-                self._update_zone_position_for_adaptive_typography(original_zone, new_width)
-                
-                # Nur Geometrie + Transparenz, Styling erfolgt im Resolver-Post-Step
-                zones[zone_name].update({
-                    'x': new_x,
-                    'y': new_y,
-                    'width': new_width,
-                    'height': new_height,
-                    'transparency': transparency / 100
-                })
-        
-        # Hintergrund-Motiv bleibt unverändert (ganzer Canvas)
-        if 'motiv_area' in zones:
-            zones['motiv_area'].update({
-                'x': 0,
-                'y': 0,
-                'width': self.canvas_width,
-                'height': self.canvas_height,
-                'transparency': 1.0  # Hintergrund-Motiv ist immer vollständig sichtbar
-            })
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-
-        # Füge berechnete Werte hinzu (ohne Style-Kennzeichnung)
-        result['calculated_values'] = {
-            'container_group_width': dynamic_container_width,
-            'container_group_height': dynamic_container_height,
-            'container_group_x': container_group_x,
-            'container_group_y': container_group_y,
-            'image_width': self.canvas_width,  # Motiv ist der gesamte Hintergrund
-            'container_transparency': transparency / 100,
-            'image_text_ratio': image_text_ratio,
-            'background_motiv_visible': 1.0
-        }
-        
-        return result
-
-    def _calculate_diagonal_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int,
-        image_text_ratio: int = 50
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für diagonales Layout mit Hintergrund-Motiv und diagonal angeordneten Containern
-        
-        Bei Diagonal-Layouts:
-        - 30% Ratio = Kleinere Container-Gruppe, mehr Hintergrund-Motiv sichtbar
-        - 70% Ratio = Größere Container-Gruppe, weniger Hintergrund-Motiv sichtbar
-        - Container sind diagonal angeordnet (von oben-links nach unten-rechts)
-        """
-        result = layout_dict.copy()
-        zones = result.get('zones', {})
-        
-        # Bei diagonalen Layouts ist das Motiv der gesamte Hintergrund
-        # Das Verhältnis steuert die Größe der diagonalen Container-Gruppe
-        
-        # Berechne Container-Gruppen-Größe basierend auf dem Ratio
-        ratio_factor = image_text_ratio / 100  # 0.3 bis 0.7
-        
-        # Container-Gruppen-Breite: Je höher das Ratio, desto breiter die gesamte Gruppe
-        base_container_width = 450  # Basis-Breite für Container-Gruppe
-        min_container_width = 300   # Minimale Breite
-        max_container_width = 600   # Maximale Breite
-        
-        # Berechne dynamische Container-Gruppen-Breite
-        dynamic_container_width = int(base_container_width * (0.7 + ratio_factor * 0.6))  # 0.7 bis 1.3 Faktor
-        dynamic_container_width = max(min_container_width, min(max_container_width, dynamic_container_width))
-        
-        # Container-Gruppen-Höhe: Je höher das Ratio, desto höher die gesamte Gruppe
-        base_container_height = 800  # Basis-Höhe für Container-Gruppe
-        min_container_height = 600   # Minimale Höhe
-        max_container_height = 1000  # Maximale Höhe
-        
-        dynamic_container_height = int(base_container_height * (0.75 + ratio_factor * 0.5))  # 0.75 bis 1.25 Faktor
-        dynamic_container_height = max(min_container_height, min(max_container_height, dynamic_container_height))
-        
-        # Text-Zonen für diagonales Layout
-        text_zones = ['standort_block', 'headline_block', 'subline_block', 'benefits_block', 'cta_block']
-        
-        # Berechne diagonale Positionen (Standort oben rechts, Text weiter unten rechts, CTA weiter links)
-        diagonal_positions = {
-            'standort_block': {'x': 0.65, 'y': 0.05, 'width': 0.3, 'height': 0.08},  # Oben rechts
-            'headline_block': {'x': 0.45, 'y': 0.7, 'width': 0.4, 'height': 0.12},   # Weiter unten rechts
-            'subline_block': {'x': 0.5, 'y': 0.8, 'width': 0.35, 'height': 0.1},     # Weiter unten rechts
-            'benefits_block': {'x': 0.55, 'y': 0.9, 'width': 0.3, 'height': 0.08},   # Weiter unten rechts
-            'cta_block': {'x': 0.05, 'y': 0.85, 'width': 0.25, 'height': 0.12}        # Weiter links
-        }
-        
-        # Aktualisiere Text-Zonen mit diagonalen sichtbaren Containern
-        for zone_name in text_zones:
-            if zone_name in zones and zone_name in diagonal_positions:
-                original_zone = zones[zone_name]
-                rel_pos = diagonal_positions[zone_name]
-                
-                # Berechne absolute Positionen basierend auf Canvas
-                # Neue diagonale Anordnung: Standort oben rechts, Text unten rechts, CTA unten links
-                new_x = int(rel_pos['x'] * self.canvas_width)
-                new_y = int(rel_pos['y'] * self.canvas_height)
-                new_width = int(rel_pos['width'] * self.canvas_width)
-                new_height = int(rel_pos['height'] * self.canvas_height)
-                
-                # Stelle sicher, dass Container nicht über Canvas hinausgehen
-                new_x = max(20, min(new_x, self.canvas_width - new_width - 20))
-                new_y = max(20, min(new_y, self.canvas_height - new_height - 20))
-                
-                # Aktualisiere Position-String für adaptive Typografie
-                self._update_zone_position_for_adaptive_typography(original_zone, new_width)
-                
-                # Nur Geometrie + Transparenz, Styling erfolgt im Resolver-Post-Step
-                zones[zone_name].update({
-                    'x': new_x,
-                    'y': new_y,
-                    'width': new_width,
-                    'height': new_height,
-                    'transparency': transparency / 100
-                })
-        
-        # Hintergrund-Motiv bleibt unverändert (ganzer Canvas)
-        if 'motiv_area' in zones:
-            zones['motiv_area'].update({
-                'x': 0,
-                'y': 0,
-                'width': self.canvas_width,
-                'height': self.canvas_height,
-                'transparency': 1.0  # Hintergrund-Motiv ist immer vollständig sichtbar
-            })
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu (ohne Style-Kennzeichnung)
-        result['calculated_values'] = {
-            'container_group_width': dynamic_container_width,
-            'container_group_height': dynamic_container_height,
-            'image_width': self.canvas_width,  # Motiv ist der gesamte Hintergrund
-            'container_transparency': transparency / 100,
-            'image_text_ratio': image_text_ratio,
-            'background_motiv_visible': 1.0,  # Hintergrund-Motiv ist immer sichtbar
-            'layout_style': 'diagonal_arrangement'  # Kennzeichnung für diagonale Anordnung
-        }
-        
-        return result
-
-    def _calculate_asymmetric_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int,
-        image_text_ratio: int = 50
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für asymmetrisches Layout mit Hintergrund-Motiv und inverser Slider-Logik
-        
-        INVERSE LOGIK: Kleinere Motivzone (Slider) = Größere Container-Elemente
-        - 30% Ratio = Größere Container (weniger Motiv sichtbar)
-        - 70% Ratio = Kleinere Container (mehr Motiv sichtbar)
-        """
-        result = layout_dict.copy()
-        zones = result.get('zones', {})
-        
-        # Bei asymmetrischen Layouts ist das Motiv der gesamte Hintergrund
-        # INVERSE LOGIK: Je höher das Ratio, desto kleiner die Container
-        
-        # Berechne Container-Größe basierend auf dem Ratio (INVERSE LOGIK)
-        ratio_factor = image_text_ratio / 100  # 0.3 bis 0.7
-        
-        # Container-Größe: Je höher das Ratio, desto kleiner die Container (INVERSE)
-        base_container_scale = 1.0  # Basis-Skalierung
-        min_scale = 0.6   # Minimale Skalierung (70% Ratio)
-        max_scale = 1.4   # Maximale Skalierung (30% Ratio)
-        
-        # Berechne inverse Skalierung: 30% Ratio = 1.4x, 70% Ratio = 0.6x
-        inverse_scale = max_scale - (ratio_factor - 0.3) * (max_scale - min_scale) / 0.4
-        inverse_scale = max(min_scale, min(max_scale, inverse_scale))
-        
-        # Text-Zonen für asymmetrisches Layout (ohne Benefits)
-        text_zones = ['standort_block', 'headline_block', 'subline_block', 'stellentitel_block', 'cta_block']
-        
-        # Berechne asymmetrische Positionen (angepasst nach User-Feedback)
-        asymmetric_positions = {
-            'standort_block': {'x': 0.70, 'y': 0.05, 'width': 0.25, 'height': 0.06},  # Weiter nach rechts
-            'headline_block': {'x': 0.30, 'y': 0.10, 'width': 0.56, 'height': 0.11},  # Weiter nach oben
-            'subline_block': {'x': 0.35, 'y': 0.22, 'width': 0.46, 'height': 0.07},   # Weiter nach oben
-            'stellentitel_block': {'x': 0.50, 'y': 0.50, 'width': 0.28, 'height': 0.09}, # Zwischen Subline und CTA
-            'cta_block': {'x': 0.70, 'y': 0.85, 'width': 0.28, 'height': 0.09}         # Weiter nach rechts
-        }
-        
-        # Aktualisiere Text-Zonen mit asymmetrischen sichtbaren Containern
-        for zone_name in text_zones:
-            if zone_name in zones and zone_name in asymmetric_positions:
-                original_zone = zones[zone_name]
-                rel_pos = asymmetric_positions[zone_name]
-                
-                # Berechne absolute Positionen basierend auf Canvas
-                base_x = int(rel_pos['x'] * self.canvas_width)
-                base_y = int(rel_pos['y'] * self.canvas_height)
-                base_width = int(rel_pos['width'] * self.canvas_width)
-                base_height = int(rel_pos['height'] * self.canvas_height)
-                
-                # Wende inverse Skalierung an
-                new_width = int(base_width * inverse_scale)
-                new_height = int(base_height * inverse_scale)
-                
-                # Zentriere die Container nach Skalierung
-                new_x = base_x + (base_width - new_width) // 2
-                new_y = base_y + (base_height - new_height) // 2
-                
-                # Stelle sicher, dass Container nicht über Canvas hinausgehen
-                new_x = max(20, min(new_x, self.canvas_width - new_width - 20))
-                new_y = max(20, min(new_y, self.canvas_height - new_height - 20))
-                
-                # Aktualisiere Position-String für adaptive Typografie
-                self._update_zone_position_for_adaptive_typography(original_zone, new_width)
-                
-                # Nur Geometrie + Transparenz, Styling erfolgt im Resolver-Post-Step
-                zones[zone_name].update({
-                    'x': new_x,
-                    'y': new_y,
-                    'width': new_width,
-                    'height': new_height,
-                    'transparency': transparency / 100
-                })
-        
-        # Hintergrund-Motiv bleibt unverändert (ganzer Canvas)
-        if 'motiv_area' in zones:
-            zones['motiv_area'].update({
-                'x': 0,
-                'y': 0,
-                'width': self.canvas_width,
-                'height': self.canvas_height,
-                'transparency': 1.0  # Hintergrund-Motiv ist immer vollständig sichtbar
-            })
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
-        
-        # Füge berechnete Werte hinzu (ohne Style-Kennzeichnung)
-        result['calculated_values'] = {
-            'container_scale': inverse_scale,
-            'image_width': self.canvas_width,  # Motiv ist der gesamte Hintergrund
-            'container_transparency': transparency / 100,
-            'image_text_ratio': image_text_ratio,
-            'background_motiv_visible': 1.0,  # Hintergrund-Motiv ist immer sichtbar
-            'layout_style': 'asymmetric_arrangement',  # Kennzeichnung für asymmetrische Anordnung
-            'inverse_logic': True  # Kennzeichnung für inverse Slider-Logik
-        }
-        
-        return result
-
-    def _calculate_grid_layout(
-        self, 
-        layout_dict: Dict[str, Any], 
-        text_width: int, 
-        image_width: int, 
-        transparency: int,
-        image_text_ratio: int = 50
-    ) -> Dict[str, Any]:
-        """
-        Berechnet Koordinaten für Grid Layout mit Hintergrund-Motiv und sichtbaren Containern
-        
-        Bei Grid Layouts:
-        - 30% Ratio = Kleinere Container-Gruppe, mehr Hintergrund-Motiv sichtbar
-        - 70% Ratio = Größere Container-Gruppe, weniger Hintergrund-Motiv sichtbar
-        - Grid-basierte Anordnung ohne Headline
-        """
-        result = layout_dict.copy()
-        zones = result.get('zones', {})
-        
-        # Bei Grid Layouts ist das Motiv der gesamte Hintergrund
-        # Das Verhältnis steuert die Größe der Grid-Container-Gruppe
-        
-        # Berechne Container-Gruppen-Größe basierend auf dem Ratio
-        ratio_factor = image_text_ratio / 100  # 0.3 bis 0.7
-        
-        # Container-Gruppen-Breite: Je höher das Ratio, desto breiter die gesamte Gruppe
-        base_container_width = 500  # Basis-Breite für Container-Gruppe
-        min_container_width = 350   # Minimale Breite
-        max_container_width = 700   # Maximale Breite
-        
-        # Berechne dynamische Container-Gruppen-Breite
-        dynamic_container_width = int(base_container_width * (0.7 + ratio_factor * 0.6))  # 0.7 bis 1.3 Faktor
-        dynamic_container_width = max(min_container_width, min(max_container_width, dynamic_container_width))
-        
-        # Container-Gruppen-Höhe: Je höher das Ratio, desto höher die gesamte Gruppe
-        base_container_height = 800  # Basis-Höhe für Container-Gruppe
-        min_container_height = 600   # Minimale Höhe
-        max_container_height = 1000  # Maximale Höhe
-        
-        dynamic_container_height = int(base_container_height * (0.75 + ratio_factor * 0.5))  # 0.75 bis 1.25 Faktor
-        dynamic_container_height = max(min_container_height, min(max_container_height, dynamic_container_height))
-        
-        # Zentriere die Container-Gruppe
-        container_group_x = (self.canvas_width - dynamic_container_width) // 2
-        container_group_y = (self.canvas_height - dynamic_container_height) // 2
-        
-        # Text-Zonen für Grid Layout (OHNE Headline, OHNE CTA, OHNE Benefits)
-        text_zones = ['standort_block', 'subline_block', 'stellentitel_block']
-        
-        # Berechne Grid-Positionen (Standort oben links, Stellentitel/Subline unten links)
-        grid_positions = {
-            'standort_block': {'x': 0.05, 'y': 0.05, 'width': 0.4, 'height': 0.12},      # Links oben
-            'subline_block': {'x': 0.05, 'y': 0.7, 'width': 0.4, 'height': 0.12},        # Links unten
-            'stellentitel_block': {'x': 0.05, 'y': 0.85, 'width': 0.4, 'height': 0.10}   # Links unten
-        }
-        
-        # Aktualisiere Text-Zonen mit Grid sichtbaren Containern
-        for zone_name in text_zones:
-            if zone_name in zones and zone_name in grid_positions:
-                original_zone = zones[zone_name]
-                rel_pos = grid_positions[zone_name]
-                
-                # Berechne absolute Positionen basierend auf Container-Gruppe
-                new_x = container_group_x + int(rel_pos['x'] * dynamic_container_width)
-                new_y = container_group_y + int(rel_pos['y'] * dynamic_container_height)
-                new_width = int(rel_pos['width'] * dynamic_container_width)
-                new_height = int(rel_pos['height'] * dynamic_container_height)
-                
-                # Aktualisiere Position-String für adaptive Typografie
-                self._update_zone_position_for_adaptive_typography(original_zone, new_width)
-                
-                # Container-Styling für sichtbare Container
-                zones[zone_name].update({
-                    'x': new_x,
-                    'y': new_y,
-                    'width': new_width,
-                    'height': new_height,
-                    'transparency': transparency / 100,
-                    'container_style': {
-                        'background_color': '#FFFFFF',
-                        'background_opacity': transparency / 100,
-                        'border_radius': 12,
-                        'border_color': '#E0E0E0',
-                        'border_width': 1,
-                        'shadow_color': '#000000',
-                        'shadow_opacity': 0.1,
-                        'shadow_blur': 8,
-                        'shadow_offset_x': 0,
-                        'shadow_offset_y': 2
-                    }
-                })
+        for zone_name, (new_x, new_y, new_width, new_height) in _scaled_positions(spec.positions, ref_width, ref_height):
+            zone = zones.get(zone_name)
+            if zone is None:
+                continue
+            
+            if inverse_scale:
+                # Skaliere und zentriere die Container auf ihrer Basis-Position
+                base_width, base_height = new_width, new_height
+                new_width = int(base_width * container_scale)
+                new_height = int(base_height * container_scale)
+                new_x += (base_width - new_width) // 2
+                new_y += (base_height - new_height) // 2
+            else:
+                new_x += offset_x
+                new_y += offset_y
+            
+            if clamp_to_canvas:
+                # Stelle sicher, dass Container nicht über Canvas hinausgehen (inline wie _clip)
+                max_x = canvas_width - new_width - 20
+                max_y = canvas_height - new_height - 20
+                new_x = new_x if new_x < max_x else max_x
+                new_x = new_x if new_x > 20 else 20
+                new_y = new_y if new_y < max_y else max_y
+                new_y = new_y if new_y > 20 else 20
+            
+            # Aktualisiere Position-String für adaptive Typografie
+            update_position(zone, new_width)
+            
+            # Nur Geometrie + Transparenz, Styling erfolgt im Resolver-Post-Step
+            zone['x'] = new_x
+            zone['y'] = new_y
+            zone['width'] = new_width
+            zone['height'] = new_height
+            zone['transparency'] = t_norm
+            if container_style is not None:
+                # Eigene Kopie je Zone, da der Style-Resolver container_style in place normalisiert
+                zone['container_style'] = dict(container_style)
         
         # Hintergrund-Motiv bleibt unverändert (ganzer Canvas)
-        if 'motiv_area' in zones:
-            zones['motiv_area'].update({
-                'x': 0,
-                'y': 0,
-                'width': self.canvas_width,
-                'height': self.canvas_height,
-                'transparency': 1.0  # Hintergrund-Motiv ist immer vollständig sichtbar
-            })
-        
-        # Aktualisiere das Layout
-        result['zones'] = zones
+        motiv_zone = zones.get('motiv_area')
+        if motiv_zone is not None:
+            motiv_zone.update(_full_canvas_motiv(canvas_width, canvas_height))
         
         # Füge berechnete Werte hinzu
-        result['calculated_values'] = {
-            'container_group_width': dynamic_container_width,
-            'container_group_height': dynamic_container_height,
-            'container_group_x': container_group_x,
-            'container_group_y': container_group_y,
-            'image_width': self.canvas_width,  # Motiv ist der gesamte Hintergrund
-            'container_transparency': transparency / 100,
-            'image_text_ratio': image_text_ratio,
-            'background_motiv_visible': 1.0,
-            'layout_style': 'grid_arrangement',
-            'no_headline': True  # Kennzeichnung dass keine Headline vorhanden ist
-        }
+        calculated_values['image_width'] = canvas_width  # Motiv ist der gesamte Hintergrund
+        calculated_values['container_transparency'] = t_norm
+        calculated_values['image_text_ratio'] = image_text_ratio
+        calculated_values['background_motiv_visible'] = 1.0  # Hintergrund-Motiv ist immer sichtbar
+        calculated_values.update(spec.extra_values)
         
-        return result
-
+        return _derived_layout(layout_dict, zones=zones, calculated_values=calculated_values)
 
     def apply_transparency_effects(self, layout_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         Wendet Transparenz-Effekte auf alle Container an
         """
-        result = layout_dict.copy()
-        zones = result.get('zones', {})
-        
-        transparency_handling = result.get('layout_engine', {}).get('transparency_handling', {})
-        apply_to_zones = transparency_handling.get('apply_to_zones', [])
+        transparency_handling = layout_dict.get('layout_engine', {}).get('transparency_handling', {})
+        # Einmal als frozenset: Hash-Lookup beim Kopieren, doppelte Einträge fallen weg
+        apply_to_zones = frozenset(transparency_handling.get('apply_to_zones', ()))
         fallback_opacity = transparency_handling.get('fallback_opacity', 0.9)
         
-        for zone_name, zone_data in zones.items():
-            if zone_name in apply_to_zones:
-                # Konvertiere Transparenz von 0-100 zu 0.0-1.0
-                transparency = zone_data.get('transparency', fallback_opacity)
-                if isinstance(transparency, (int, float)) and transparency > 1:
-                    transparency = transparency / 100
-
-                # Validiere Transparenz
-                transparency = max(0.1, min(1.0, transparency))
-                zones[zone_name]['transparency'] = transparency
-
-                # Wenn bereits container_style Hintergrund-Opacity vorhanden ist,
-                # keine zusaetzlichen Felder (opacity/alpha) mehr setzen.
-                cs = zone_data.get('container_style', {}) if isinstance(zone_data, dict) else {}
+        # Nur die betroffenen Zonen kopieren; die Zonen des Aufrufers bleiben unverändert
+        zones = self._copy_touched_zones(layout_dict, apply_to_zones)
+        
+        # Nur Zonen besuchen, die konfiguriert und im Layout vorhanden sind
+        for zone_name in apply_to_zones.intersection(zones):
+            zone_data = zones[zone_name]
+            if zone_data is None:
+                continue
+            
+            # Konvertiere Transparenz von 0-100 zu 0.0-1.0 (nicht-numerische Werte scheitern wie bisher beim Klemmen)
+            transparency = zone_data.get('transparency', fallback_opacity)
+            if transparency > 1:
+                transparency = transparency / 100
+            
+            # Validiere Transparenz
+            transparency = _clip(transparency, 0.1, 1.0)
+            zone_data['transparency'] = transparency
+            
+            # Wenn bereits container_style Hintergrund-Opacity vorhanden ist,
+            # keine zusaetzlichen Felder (opacity/alpha) mehr setzen.
+            cs = zone_data.get('container_style')
+            if isinstance(cs, dict):
+                background = cs.get('background')
+                has_bg_opacity = 'background_opacity' in cs or (isinstance(background, dict) and 'opacity' in background)
+            else:
                 has_bg_opacity = False
-                if isinstance(cs, dict):
-                    if 'background_opacity' in cs:
-                        has_bg_opacity = True
-                    elif 'background' in cs and isinstance(cs.get('background'), dict) and 'opacity' in cs['background']:
-                        has_bg_opacity = True
-                if not has_bg_opacity:
-                    # Legacy-Kompatibilitaet: Nur falls kein Resolver aktiv war
-                    zones[zone_name]['opacity'] = transparency
-                    zones[zone_name]['alpha'] = transparency
+            if not has_bg_opacity:
+                # Legacy-Kompatibilitaet: Nur falls kein Resolver aktiv war
+                zone_data['opacity'] = transparency
+                zone_data['alpha'] = transparency
         
-        result['zones'] = zones
-        return result
+        # Ergebnis in einem Schritt aufbauen statt Kopie plus Neuzuweisung
+        return _derived_layout(layout_dict, zones=zones)
     
     def validate_layout(self, layout_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validiert das Layout und setzt __validated__ Flag
         
+        Bereits von dieser Methode validierte Layouts (Flag und Status gesetzt) werden
+        unverändert zurückgegeben, ohne das Schema erneut zu durchlaufen. Wer ein
+        validiertes Layout danach selbst verändert, ruft vorher invalidate() auf.
+        
         Args:
             layout_dict: Layout-Dictionary
             
@@ -1287,10 +1065,15 @@ class LayoutEngine:
         Raises:
             LayoutValidationError: Bei Validierungsfehlern
         """
+        # Schnellpfad: erneute Validierung desselben Layouts (z.B. bei Re-Renders) überspringen
+        if layout_dict.get('__validated__') is True and 'validation_status' in layout_dict:
+            return layout_dict
+        
         result = layout_dict.copy()
         
-        # Verwende das neue Schema für strikte Validierung
-        errors = validate_layout_strict(result)
+        # Ein Durchlauf über das Schema liefert Fehler und Warnungen zugleich
+        validation = validate_layout_with_warnings(result)
+        errors = validation['errors']
         
         if errors:
             # Layout ist ungültig - werfe Exception
@@ -1303,93 +1086,56 @@ class LayoutEngine:
         result['__validated__'] = True
         result['validation_status'] = 'valid'
         
-        # Füge zusätzliche Warnungen hinzu (nicht blockierend)
-        warnings = self._generate_additional_warnings(result)
+        # Füge Warnungen hinzu (nicht blockierend)
+        warnings = validation['warnings']
         if warnings:
             result['validation_warnings'] = warnings
             result['validation_status'] = 'warnings'
         
         return result
     
-    def _generate_additional_warnings(self, layout_dict: Dict[str, Any]) -> List[str]:
-        """Generiert zusätzliche Warnungen (nicht blockierend)"""
-        # Da wir jetzt feste Koordinaten verwenden, brauchen wir keine Warnungen mehr
-        return []
-
-
-    def _calculate_split_layout(self, layout_dict, text_width, image_width, container_transparency, image_text_ratio):
+    def _calculate_split_layout(self, layout_dict, canvas_width, canvas_height, text_width, image_width, container_transparency, t_norm, image_text_ratio, *_extended_params):
         """Berechnet Split-Layout: Obere Hälfte Layout, untere Hälfte Motiv mit dynamischer Y-Koordinate"""
-        zones = layout_dict.get('zones', {}).copy()
-        calculated_values = {}
-        
-        # Berechne dynamische Y-Koordinate für Motivzone basierend auf Slider
-        # Höherer Slider-Wert = kleinere Y-Koordinate = mehr Bildfläche
-        base_motiv_y = 540  # Standard: Mitte des Canvas
-        motiv_y_range = 200  # Bereich von 340 bis 740
+        # Eigene Kopien nur der veränderten Zonen, danach direkte Zuweisung
+        zones = self._copy_touched_zones(layout_dict, _TOUCHED_SPLIT_LAYOUT)
         
+        # Berechne dynamische Y-Koordinate und Höhe der Motivzone basierend auf Slider
         # Slider-Logik: 0% = Y=740 (wenig Bild), 100% = Y=340 (viel Bild)
-        dynamic_motiv_y = base_motiv_y + (motiv_y_range * (100 - image_text_ratio) / 100)
-        dynamic_motiv_y = max(340, min(740, dynamic_motiv_y))  # Begrenze auf sinnvolle Werte
-        
-        # Berechne Motiv-Höhe basierend auf Y-Koordinate
-        dynamic_motiv_height = self.canvas_height - dynamic_motiv_y
-        
-        # Text-Zonen für Split Layout
-        text_zones = ['standort_block', 'headline_block', 'benefits_block', 'stellentitel_block', 'cta_block']
-        
-        # Split-Positionen (obere Hälfte für Text, untere Hälfte für Motiv)
-        # Alle Elemente in eigenen Containern, verteilt in der oberen Hälfte
-        split_positions = {
-            'standort_block': {'x': 0.05, 'y': 0.05, 'width': 0.4, 'height': 0.06},      # Oben links
-            'headline_block': {'x': 0.05, 'y': 0.15, 'width': 0.6, 'height': 0.08},      # Unter dem Standort, breiter
-            'benefits_block': {'x': 0.05, 'y': 0.25, 'width': 0.6, 'height': 0.20},      # Unter der Headline (links)
-            'stellentitel_block': {'x': 0.05, 'y': 0.60, 'width': 0.4, 'height': 0.08},  # Unten links, über CTA
-            'cta_block': {'x': 0.05, 'y': 0.85, 'width': 0.4, 'height': 0.08}            # Ganz unten links
-        }
+        # Bei auf 55-85 geklemmtem Ratio liegt Y immer in 570-630, eine Begrenzung entfällt
+        dynamic_motiv_y, dynamic_motiv_height = split_motiv_geometry(image_text_ratio, canvas_height)
         
         # Aktualisiere Text-Zonen mit Split-Positionen
-        for zone_name in text_zones:
-            if zone_name in zones and zone_name in split_positions:
-                original_zone = zones[zone_name]
-                pos = split_positions[zone_name]
-                
-                # Berechne absolute Koordinaten
-                x = int(pos['x'] * self.canvas_width)
-                y = int(pos['y'] * self.canvas_height)
-                width = int(pos['width'] * self.canvas_width)
-                height = int(pos['height'] * self.canvas_height)
+        # Alle Elemente in eigenen Containern, verteilt in der oberen Hälfte
+        for zone_name, (x, y, width, height) in _scaled_positions('split_layout', canvas_width, canvas_height):
+            original_zone = zones.get(zone_name)
+            if original_zone is not None:
                 
                 # Nur Geometrie, Styling erfolgt im Resolver-Post-Step
-                zones[zone_name] = {
-                    **original_zone,
-                    'x': x,
-                    'y': y,
-                    'width': width,
-                    'height': height,
-                    'transparency': container_transparency / 100
-                }
+                original_zone['x'] = x
+                original_zone['y'] = y
+                original_zone['width'] = width
+                original_zone['height'] = height
+                original_zone['transparency'] = t_norm
         
         # Aktualisiere Motiv-Zone mit dynamischer Y-Koordinate
-        if 'motiv_area' in zones:
-            zones['motiv_area'] = {
-                **zones['motiv_area'],
-                'x': 0,
-                'y': int(dynamic_motiv_y),
-                'width': self.canvas_width,
-                'height': int(dynamic_motiv_height),
-                'transparency': 1.0  # Vollständiger Hintergrund
-            }
+        motiv_zone = zones.get('motiv_area')
+        if motiv_zone is not None:
+            motiv_zone['x'] = 0
+            motiv_zone['y'] = int(dynamic_motiv_y)
+            motiv_zone['width'] = canvas_width
+            motiv_zone['height'] = int(dynamic_motiv_height)
+            motiv_zone['transparency'] = 1.0  # Vollständiger Hintergrund
         
         # Berechne Werte für semantische Beschreibung
-        calculated_values.update({
+        calculated_values = {
             'image_text_ratio': image_text_ratio,
             'container_transparency': container_transparency,
             'dynamic_motiv_y': dynamic_motiv_y,
             'dynamic_motiv_height': dynamic_motiv_height,
-            'motiv_y_percent': round(dynamic_motiv_y / self.canvas_height * 100, 1),
+            'motiv_y_percent': round(dynamic_motiv_y / canvas_height * 100, 1),
             'layout_style': 'split_arrangement',
             'split_logic': 'higher_slider_smaller_y'
-        })
+        }
         
         return {
             'zones': zones,
@@ -1399,38 +1145,103 @@ class LayoutEngine:
 
     def _validate_element_spacing(self, value: int) -> int:
         """Validiert element_spacing (12-56)"""
-        return max(12, min(56, value))
+        return _clip(value, 12, 56)
     
     def _validate_container_padding(self, value: int) -> int:
         """Validiert container_padding (16-40)"""
-        return max(16, min(40, value))
+        return _clip(value, 16, 40)
     
     def _validate_shadow_intensity(self, value: int) -> int:
         """Validiert shadow_intensity (0-70)"""
-        return max(0, min(70, value))
+        return _clip(value, 0, 70)
     
     def _validate_grain_amount(self, value: int) -> int:
         """Validiert grain_amount (0-25)"""
-        return max(0, min(25, value))
+        return _clip(value, 0, 25)
     
     def _validate_tint_strength(self, value: int) -> int:
         """Validiert tint_strength (0-20)"""
-        return max(0, min(20, value))
+        return _clip(value, 0, 20)
     
     def _validate_glow_intensity(self, value: int) -> int:
         """Validiert glow_intensity (0-30)"""
-        return max(0, min(30, value))
+        return _clip(value, 0, 30)
     
     def _validate_elevation_level(self, value: int) -> int:
         """Validiert elevation_level (0-3)"""
-        return max(0, min(3, value))
+        return _clip(value, 0, 3)
+
+    # Split-artige Layouts über den gemeinsamen Template-Pfad (siehe _LAYOUT_SPECS)
+    _calculate_vertical_split = _spec_handler('vertical_split')
+    _calculate_vertical_split_left = _spec_handler('vertical_split_left')
+    _calculate_horizontal_split = _spec_handler('horizontal_split')
+    _calculate_modern_split = _spec_handler('modern_split')
+    _calculate_minimalist_layout = _spec_handler('minimalist')
+    _calculate_portfolio_layout = _spec_handler('portfolio')
+    _calculate_infographic_layout = _spec_handler('infographic')
+    _calculate_magazine_layout = _spec_handler('magazine')
+    _calculate_centered_layout = _container_handler('centered_layout')
+    _calculate_diagonal_layout = _container_handler('diagonal_layout')
+    _calculate_asymmetric_layout = _container_handler('asymmetric_layout')
+    _calculate_grid_layout = _container_handler('grid_layout')
+
+    # Layout-Typ -> Berechnungsfunktion (ungebundene Funktionen, einheitliche Signatur)
+    _LAYOUT_DISPATCH: Dict[str, Callable[..., Dict[str, Any]]] = {
+        'vertical_split': _calculate_vertical_split,
+        'vertical_split_left': _calculate_vertical_split_left,
+        'horizontal_split': _calculate_horizontal_split,
+        'modern_split': _calculate_modern_split,
+        'minimalist': _calculate_minimalist_layout,
+        'hero_layout': _calculate_hero_layout,
+        'portfolio': _calculate_portfolio_layout,
+        'storytelling_layout': _calculate_storytelling_layout,
+        'infographic': _calculate_infographic_layout,
+        'magazine': _calculate_magazine_layout,
+        'centered_layout': _calculate_centered_layout,
+        'diagonal_layout': _calculate_diagonal_layout,
+        'asymmetric_layout': _calculate_asymmetric_layout,
+        'grid_layout': _calculate_grid_layout,
+        'split_layout': _calculate_split_layout,
+    }
 
 
 # Globale Instanz des Layout-Engines
 layout_engine = LayoutEngine()
 
 
-@lru_cache(maxsize=32)
+def invalidate(layout_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Entfernt den Validierungsstatus eines Layouts (in place)
+    
+    Für Aufrufer, die ein bereits validiertes Layout nachträglich verändern: der
+    nächste validate_layout-Aufruf durchläuft das Schema dann wieder vollständig.
+    
+    Returns:
+        Dasselbe Layout-Dictionary (für verkettete Aufrufe)
+    """
+    for key in _VALIDATION_KEYS:
+        layout_dict.pop(key, None)
+    return layout_dict
+
+
+def _freeze(value: Any) -> Any:
+    """Wandelt verschachtelte dicts/Listen rekursiv in MappingProxyType/Tupel um (schreibgeschützt)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw_layout(value: Any) -> Any:
+    """Erzeugt aus einem eingefrorenen Layout wieder eine veränderbare Kopie aus dicts/Listen"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw_layout(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_layout(item) for item in value]
+    return value
+
+
 def calculate_layout_coordinates_cached(
     layout_id: str,
     image_text_ratio: int = 50,
@@ -1438,16 +1249,51 @@ def calculate_layout_coordinates_cached(
 ) -> Dict[str, Any]:
     """
     Gecachte Version der Koordinatenberechnung
+    
+    Lädt das Layout aus input_config/layouts/ und berechnet die Koordinaten einmal je
+    (layout_id, Ratio, Transparenz). Slider-Werte werden vor dem Cache-Lookup auf den
+    gültigen Bereich geklemmt (wie in calculate_layout_coordinates), damit gleichwertige
+    Eingaben denselben Eintrag treffen.
+    
+    Die mtime der Layout-Datei ist Teil des Cache-Schlüssels (wie bei load_layout_cached),
+    Änderungen an der YAML-Datei werden also sofort wirksam.
+    
+    Der Cache hält das Ergebnis schreibgeschützt; jeder Aufruf erhält daraus eine eigene,
+    veränderbare dict-Kopie (z.B. für apply_design_styles), ohne den Cache zu berühren.
     """
-    # Diese Funktion würde normalerweise das Layout laden und dann berechnen
-    # Für den Moment geben wir ein Dummy-Layout zurück
-    return {
-        'layout_id': layout_id,
-        'calculated_values': {
-            'text_width': 400,
-            'image_width': 620,
-            'container_transparency': container_transparency / 100,
-            'image_text_ratio': image_text_ratio
-        },
-        'validation_status': 'valid'
-    }
+    # Lokaler Import: der Loader importiert seinerseits die Engine
+    from .loader import _layout_file_path
+    
+    try:
+        mtime_ns = os.stat(_layout_file_path(layout_id)).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None  # Der Loader meldet den Fehler; Exceptions werden nicht gecacht
+    
+    return thaw_layout(_calculate_layout_coordinates_cached(
+        layout_id,
+        layout_engine._validate_ratio(image_text_ratio),
+        layout_engine._validate_transparency(container_transparency),
+        mtime_ns
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _calculate_layout_coordinates_cached(
+    layout_id: str,
+    image_text_ratio: int,
+    container_transparency: int,
+    mtime_ns: Optional[int]
+) -> MappingProxyType:
+    """Cache-Eintrag je (layout_id, geklemmtes Ratio, geklemmte Transparenz, Datei-mtime)"""
+    # Lokaler Import: der Loader importiert seinerseits die Engine
+    from .loader import _load_from_separate_file
+    
+    layout_dict = ensure_numerical_zones(_load_from_separate_file(layout_id))
+    return _freeze(layout_engine.calculate_layout_coordinates(
+        layout_dict, image_text_ratio, container_transparency
+    ))
+
+
+# Cache-Steuerung wie bei einer direkt dekorierten Funktion
+calculate_layout_coordinates_cached.cache_info = _calculate_layout_coordinates_cached.cache_info
+calculate_layout_coordinates_cached.cache_clear = _calculate_layout_coordinates_cached.cache_clear
@@ -6,8 +6,10 @@ Lädt YAML-Layouts und berechnet dynamische Koordinaten basierend auf:
 - container_transparency Slider (0-100%)
 """
 
+import copy
 import yaml
 import os
+import sys
 from typing import Dict, Any, Union, Optional
 from functools import lru_cache
 from .engine import layout_engine
@@ -21,6 +23,13 @@ try:
 except Exception:
     FORBIDDEN_ZONE_KEYS, FORBIDDEN_TOPLEVEL_KEYS = set(), set()
 
+# libyaml-Parser (C) falls verfügbar, sonst der reine Python-SafeLoader.
+# Dateien werden binär geöffnet: der Loader erkennt UTF-8 (inkl. BOM) selbst und dekodiert intern
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Verzeichnis der Einzel-Layouts (relativ zum Arbeitsverzeichnis)
+_LAYOUTS_DIR = "input_config/layouts"
+
 
 def load_layout(
     layout_id: str, 
@@ -51,9 +60,11 @@ def load_layout(
     layout_dict = _load_from_separate_file(layout_id)
     
     logger = logging.getLogger(__name__)
-    logger.debug("Layout geladen: %s", layout_dict.get('name'))
-    logger.debug("Canvas: %s", layout_dict.get('canvas'))
-    logger.debug("Zonen: %s", list(layout_dict.get('zones', {}).keys()))
+    # Debug-Ausgaben (inkl. Zonen-Liste) nur aufbauen, wenn DEBUG tatsächlich aktiv ist
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Layout geladen: %s", layout_dict.get('name'))
+        logger.debug("Canvas: %s", layout_dict.get('canvas'))
+        logger.debug("Zonen: %s", list(layout_dict.get('zones', {}).keys()))
     
     # Konvertiere position-Strings zu numerischen Koordinaten
     layout_dict = ensure_numerical_zones(layout_dict)
@@ -94,7 +105,6 @@ def load_layout(
     try:
         # Defensive Warnung: Templates sollten keine verbotenen Felder enthalten
         zones = final_layout.get('zones', {})
-        logger = logging.getLogger(__name__)
         for zname, z in zones.items():
             if isinstance(z, dict):
                 illegal = [k for k in z.keys() if k in FORBIDDEN_ZONE_KEYS]
@@ -117,11 +127,14 @@ def load_layout(
 
 def _load_from_central_yaml(layout_id: str, yaml_path: str) -> Dict[str, Any]:
     """Lädt ein Layout aus der zentralen YAML-Datei"""
-    if not os.path.exists(yaml_path):
+    # Ein open() statt exists() + open(): fehlende Datei über die Exception erkennen
+    try:
+        file = open(yaml_path, 'rb')
+    except FileNotFoundError:
         raise FileNotFoundError(f"Layout-Datei nicht gefunden: {yaml_path}")
     
-    with open(yaml_path, 'r', encoding='utf-8') as file:
-        data = yaml.safe_load(file)
+    with file:
+        data = yaml.load(file, Loader=_YAML_LOADER)
     
     if 'layouts' not in data:
         raise KeyError(f"Keine 'layouts' Sektion in {yaml_path} gefunden")
@@ -132,89 +145,178 @@ def _load_from_central_yaml(layout_id: str, yaml_path: str) -> Dict[str, Any]:
     return data['layouts'][layout_id]
 
 
+def preload_layouts(layout_dir: str = _LAYOUTS_DIR) -> int:
+    """
+    Parst alle Layout-Dateien eines Verzeichnisses vorab in den Parse-Cache
+    
+    Optional, z.B. beim App-Start; load_layout parst sonst jede Datei beim ersten Zugriff.
+    Fehlerhafte Dateien werden übersprungen; sie melden sich erst beim eigentlichen Laden.
+    
+    Args:
+        layout_dir: Verzeichnis mit den Layout-YAML-Dateien
+        
+    Returns:
+        Anzahl der vorgeparsten Dateien
+    """
+    count = 0
+    try:
+        entries = list(os.scandir(layout_dir))
+    except FileNotFoundError:
+        return 0
+    
+    for entry in entries:
+        if not entry.name.endswith('.yaml') or not entry.is_file():
+            continue
+        try:
+            _parse_layout_file(os.path.abspath(entry.path), entry.stat().st_mtime_ns)
+            count += 1
+        except (OSError, yaml.YAMLError):
+            continue
+    return count
+
+
+def _layout_file_path(layout_id: str) -> str:
+    """Konstruiert den Dateipfad basierend auf der Layout-ID"""
+    return f"{_LAYOUTS_DIR}/{layout_id}.yaml"
+
+
 def _load_from_separate_file(layout_id: str) -> Dict[str, Any]:
     """Lädt ein Layout aus einer separaten YAML-Datei"""
-    # Konstruiere den Dateipfad basierend auf der Layout-ID
-    layout_file = f"input_config/layouts/{layout_id}.yaml"
+    layout_file = _layout_file_path(layout_id)
     
-    if not os.path.exists(layout_file):
+    try:
+        mtime_ns = os.stat(layout_file).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Layout-Datei nicht gefunden: {layout_file}")
     
-    with open(layout_file, 'r', encoding='utf-8') as file:
-        return yaml.safe_load(file)
+    # Geparster Baum wird je (absoluter Pfad, mtime) wiederverwendet; Aufrufer erhalten eine eigene Kopie
+    return _clone_parsed_layout(_parse_layout_file(os.path.abspath(layout_file), mtime_ns))
+
+
+def _clone_parsed_layout(layout_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Kopiert ein gecachtes Layout für den Aufrufer
+    
+    Nur der Zonen-Baum wird tief kopiert (Engine und Style-Resolver verändern Zonen);
+    Metadaten wie canvas, validation und layout_engine werden geteilt und nur gelesen.
+    """
+    if not isinstance(layout_dict, dict):
+        return copy.deepcopy(layout_dict)
+    clone = layout_dict.copy()
+    if 'zones' in clone:
+        clone['zones'] = copy.deepcopy(clone['zones'])
+    return clone
+
+
+@lru_cache(maxsize=64)
+def _parse_layout_file(layout_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parst eine Layout-Datei (gecacht, mtime_ns im Schlüssel invalidiert bei Dateiänderung)
+    
+    Aufrufer übergeben den absoluten Pfad, damit Einträge auch nach einem Wechsel des
+    Arbeitsverzeichnisses passen. Das Ergebnis ist geteilt und darf nicht verändert werden.
+    """
+    with open(layout_file, 'rb') as file:
+        return _intern_zone_keys(yaml.load(file, Loader=_YAML_LOADER))
+
+
+def _intern_zone_keys(layout_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Interniert Zonen-Namen und die Feld-Schlüssel der Zonen ('x', 'width', 'position', ...)
+    
+    Aus YAML geladene Schlüssel sind nicht interniert; die Literale in der Layout-Engine
+    (Zonen-Tupel, Feldnamen) schon. Nach dem Internieren greift beim Dict-Lookup der
+    Identitätsvergleich.
+    """
+    zones = layout_dict.get('zones') if isinstance(layout_dict, dict) else None
+    if isinstance(zones, dict):
+        layout_dict['zones'] = {
+            (sys.intern(zone_name) if type(zone_name) is str else zone_name): (
+                {sys.intern(k) if type(k) is str else k: v for k, v in zone_data.items()}
+                if isinstance(zone_data, dict) else zone_data
+            )
+            for zone_name, zone_data in zones.items()
+        }
+    return layout_dict
+
+
+# Standard-Layout für vertikale Aufteilung (valides Schema), einmal beim Import aufgebaut;
+# layout_id und name werden je Aufruf ergänzt
+_DEFAULT_LAYOUT_TEMPLATE: Dict[str, Any] = {
+    'layout_type': 'dynamic_vertical_split',
+    'complexity': 'medium',
+    'canvas': {
+        'width': 1080,
+        'height': 1080
+    },
+    'zones': {
+        'headline_block': {
+            'x': 40, 'y': 40, 'width': 400, 'height': 80, 'z': 1,
+            'content_type': 'text_elements',
+            'description': 'Hauptheadline in Primärfarbe'
+        },
+        'subline_block': {
+            'x': 40, 'y': 140, 'width': 400, 'height': 80, 'z': 1,
+            'content_type': 'text_elements', 
+            'description': 'Subline in Sekundärfarbe'
+        },
+        'benefits_block': {
+            'x': 40, 'y': 240, 'width': 400, 'height': 200, 'z': 1,
+            'content_type': 'text_elements',
+            'description': 'Benefits-Liste in Primärfarbe'
+        },
+        'cta_block': {
+            'x': 40, 'y': 460, 'width': 400, 'height': 100, 'z': 1,
+            'content_type': 'text_elements',
+            'description': 'CTA-Button in Akzentfarbe'
+        },
+        'company_block': {
+            'x': 40, 'y': 580, 'width': 400, 'height': 60, 'z': 1,
+            'content_type': 'text_elements',
+            'description': 'Firmenname in Primärfarbe'
+        },
+        'standort_block': {
+            'x': 40, 'y': 660, 'width': 400, 'height': 60, 'z': 1,
+            'content_type': 'text_elements',
+            'description': 'Standort in Sekundärfarbe'
+        },
+        'image_motiv': {
+            'x': 500, 'y': 40, 'width': 540, 'height': 680, 'z': 0,
+            'content_type': 'image_motiv',
+            'description': 'Motiv-Bild rechts'
+        }
+    },
+    'validation': {
+        'minimums': {
+            'text_area_width': 300,
+            'image_area_width': 200,
+            'container_transparency': 0.3
+        },
+        'maximums': {
+            'text_area_width': 800,
+            'image_area_width': 900,
+            'container_transparency': 0.9
+        }
+    },
+    'layout_engine': {
+        'transparency_handling': {
+            'apply_to_zones': ['headline_block', 'subline_block', 'benefits_block', 'cta_block', 'company_block', 'standort_block'],
+            'fallback_opacity': 0.8
+        }
+    }
+}
 
 
 def _get_default_layout(layout_id: str) -> Dict[str, Any]:
     """Gibt ein Standard-Layout zurück, falls das gewünschte nicht gefunden wird"""
-    # Standard-Layout für vertikale Aufteilung (valides Schema)
+    # Eigene tiefe Kopie der Vorlage, damit Aufrufer sie nicht verändern
     return {
         'layout_id': layout_id,
         'name': f"Standard {layout_id}",
-        'layout_type': 'dynamic_vertical_split',
-        'complexity': 'medium',
-        'canvas': {
-            'width': 1080,
-            'height': 1080
-        },
-        'zones': {
-            'headline_block': {
-                'x': 40, 'y': 40, 'width': 400, 'height': 80, 'z': 1,
-                'content_type': 'text_elements',
-                'description': 'Hauptheadline in Primärfarbe'
-            },
-            'subline_block': {
-                'x': 40, 'y': 140, 'width': 400, 'height': 80, 'z': 1,
-                'content_type': 'text_elements', 
-                'description': 'Subline in Sekundärfarbe'
-            },
-            'benefits_block': {
-                'x': 40, 'y': 240, 'width': 400, 'height': 200, 'z': 1,
-                'content_type': 'text_elements',
-                'description': 'Benefits-Liste in Primärfarbe'
-            },
-            'cta_block': {
-                'x': 40, 'y': 460, 'width': 400, 'height': 100, 'z': 1,
-                'content_type': 'text_elements',
-                'description': 'CTA-Button in Akzentfarbe'
-            },
-            'company_block': {
-                'x': 40, 'y': 580, 'width': 400, 'height': 60, 'z': 1,
-                'content_type': 'text_elements',
-                'description': 'Firmenname in Primärfarbe'
-            },
-            'standort_block': {
-                'x': 40, 'y': 660, 'width': 400, 'height': 60, 'z': 1,
-                'content_type': 'text_elements',
-                'description': 'Standort in Sekundärfarbe'
-            },
-            'image_motiv': {
-                'x': 500, 'y': 40, 'width': 540, 'height': 680, 'z': 0,
-                'content_type': 'image_motiv',
-                'description': 'Motiv-Bild rechts'
-            }
-        },
-        'validation': {
-            'minimums': {
-                'text_area_width': 300,
-                'image_area_width': 200,
-                'container_transparency': 0.3
-            },
-            'maximums': {
-                'text_area_width': 800,
-                'image_area_width': 900,
-                'container_transparency': 0.9
-            }
-        },
-        'layout_engine': {
-            'transparency_handling': {
-                'apply_to_zones': ['headline_block', 'subline_block', 'benefits_block', 'cta_block', 'company_block', 'standort_block'],
-                'fallback_opacity': 0.8
-            }
-        }
+        **copy.deepcopy(_DEFAULT_LAYOUT_TEMPLATE)
     }
 
 
-# @lru_cache(maxsize=32)  # Temporär deaktiviert für Entwicklung
 def load_layout_cached(
     layout_id: str, 
     image_text_ratio: int = 50,
@@ -223,14 +325,39 @@ def load_layout_cached(
     """
     Gecachte Version des Layout-Loaders
     
+    Slider-Werte werden wie in der Layout-Engine geklemmt, sodass gleichwertige Eingaben
+    denselben Cache-Eintrag teilen. Die mtime der Layout-Datei ist Teil des Schlüssels,
+    Änderungen an der YAML-Datei werden also sofort wirksam.
+    
     Args:
         layout_id: ID des zu ladenden Layouts
         image_text_ratio: Slider-Wert 30-70
         container_transparency: Slider-Wert 0-100
         
     Returns:
-        Gecachtes Layout-Dictionary
+        Gecachtes Layout-Dictionary (eigene Kopie je Aufruf)
     """
+    try:
+        mtime_ns = os.stat(_layout_file_path(layout_id)).st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None  # load_layout meldet den Fehler; Exceptions werden nicht gecacht
+    
+    return copy.deepcopy(_load_layout_cached(
+        layout_id,
+        layout_engine._validate_ratio(image_text_ratio),
+        layout_engine._validate_transparency(container_transparency),
+        mtime_ns
+    ))
+
+
+@lru_cache(maxsize=512)
+def _load_layout_cached(
+    layout_id: str,
+    image_text_ratio: int,
+    container_transparency: int,
+    mtime_ns: Optional[int]
+) -> Dict[str, Any]:
+    """Gecachter Kern von load_layout_cached (Ergebnis geteilt, nicht verändern)"""
     return load_layout(
         layout_id, 
         image_text_ratio=image_text_ratio,
@@ -249,8 +376,8 @@ def list_available_layouts(yaml_path: str = "input_config/layout_index.yaml") ->
         Dictionary mit allen verfügbaren Layouts
     """
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as file:
-            data = yaml.safe_load(file)
+        with open(yaml_path, 'rb') as file:
+            data = yaml.load(file, Loader=_YAML_LOADER)
         return data
     except FileNotFoundError:
         print(f"Layout-Index nicht gefunden: {yaml_path}")
@@ -288,12 +415,15 @@ def validate_layout_file(layout_id: str, yaml_path: str = "input_config/layouts/
     """
     layout_file = os.path.join(yaml_path, f"{layout_id}.yaml")
     
-    if not os.path.exists(layout_file):
+    try:
+        mtime_ns = os.stat(layout_file).st_mtime_ns
+    except FileNotFoundError:
         return False
     
     try:
-        with open(layout_file, 'r', encoding='utf-8') as file:
-            yaml.safe_load(file)
+        # Nutzt den Parse-Cache: unveränderte Dateien werden nicht erneut geparst,
+        # und ein folgendes load_layout findet den Baum bereits vor
+        _parse_layout_file(os.path.abspath(layout_file), mtime_ns)
         return True
     except yaml.YAMLError:
         return False
@@ -97,6 +97,19 @@ DEFAULT_REQUIREMENTS = {
     "optional": ["logo_area", "cta_block", "benefits_block", "company_block", "standort_block", "motiv_block"]
 }
 
+# Einmal beim Import vorberechnete Lookups für is_zone_required / get_expected_zones_for_layout
+_REQUIRED_ZONES = {
+    layout_type: frozenset(requirements["required"])
+    for layout_type, requirements in LAYOUT_TYPE_REQUIREMENTS.items()
+}
+_DEFAULT_REQUIRED_ZONES = frozenset(DEFAULT_REQUIREMENTS["required"])
+
+_EXPECTED_ZONES = {
+    layout_type: tuple(requirements["required"] + requirements["optional"])
+    for layout_type, requirements in LAYOUT_TYPE_REQUIREMENTS.items()
+}
+_DEFAULT_EXPECTED_ZONES = tuple(DEFAULT_REQUIREMENTS["required"] + DEFAULT_REQUIREMENTS["optional"])
+
 
 def validate_layout(layout: dict) -> List[dict]:
     """
@@ -113,141 +126,6 @@ def validate_layout(layout: dict) -> List[dict]:
     return []
 
 
-def _validate_zone_flexible(zone_name: str, zone_data: dict, canvas: dict) -> List[dict]:
-    """Validiert eine einzelne Zone (flexibel für Platzhalter)"""
-    errors = []
-    
-    # Prüfe ob Zone ein Dictionary ist
-    if not isinstance(zone_data, dict):
-        errors.append({
-            "code": "invalid_zone_structure",
-            "path": f"zones.{zone_name}",
-            "msg": f"Zone '{zone_name}' must be a dictionary"
-        })
-        return errors
-    
-    # Prüfe ob Zone eine position hat (kann Platzhalter sein)
-    if 'position' in zone_data:
-        position = zone_data['position']
-        if isinstance(position, str):
-            # Platzhalter sind erlaubt
-            if position.startswith('{') and position.endswith('}'):
-                # Platzhalter - keine weiteren Validierungen
-                pass
-            else:
-                # Versuche als Koordinaten zu parsen
-                coords = convert_position_string_to_coords(position)
-                if not coords:
-                    errors.append({
-                        "code": "invalid_position_format",
-                        "path": f"zones.{zone_name}.position",
-                        "value": position,
-                        "msg": f"Zone '{zone_name}' position must be valid coordinates or placeholder"
-                    })
-    
-    # Prüfe Z-Index
-    if 'z' in zone_data and not isinstance(zone_data['z'], int):
-        errors.append({
-            "code": "invalid_z_index",
-            "path": f"zones.{zone_name}.z",
-            "value": zone_data['z'],
-            "msg": f"Zone '{zone_name}' z-index must be integer"
-        })
-    
-    return errors
-
-
-def _validate_zone(zone_name: str, zone_data: dict, canvas: dict) -> List[dict]:
-    """Validiert eine einzelne Zone (strikt für numerische Koordinaten)"""
-    errors = []
-    
-    # Prüfe ob Zone numerische Koordinaten hat
-    required_coords = ['x', 'y', 'width', 'height']
-    for coord in required_coords:
-        if coord not in zone_data:
-            errors.append({
-                "code": "missing_coordinate",
-                "path": f"zones.{zone_name}.{coord}",
-                "msg": f"Zone '{zone_name}' missing coordinate '{coord}'"
-            })
-        elif not isinstance(zone_data[coord], int):
-            errors.append({
-                "code": "invalid_coordinate_type",
-                "path": f"zones.{zone_name}.{coord}",
-                "value": zone_data[coord],
-                "msg": f"Zone '{zone_name}' coordinate '{coord}' must be integer"
-            })
-    
-    # Prüfe Koordinaten-Werte
-    if all(coord in zone_data and isinstance(zone_data[coord], int) for coord in required_coords):
-        x, y, width, height = zone_data['x'], zone_data['y'], zone_data['width'], zone_data['height']
-        
-        # Negative Koordinaten
-        if x < 0:
-            errors.append({
-                "code": "negative_x_coordinate",
-                "path": f"zones.{zone_name}.x",
-                "value": x,
-                "msg": f"Zone '{zone_name}' x coordinate cannot be negative"
-            })
-        
-        if y < 0:
-            errors.append({
-                "code": "negative_y_coordinate",
-                "path": f"zones.{zone_name}.y", 
-                "value": y,
-                "msg": f"Zone '{zone_name}' y coordinate cannot be negative"
-            })
-        
-        # Ungültige Dimensionen
-        if width <= 0:
-            errors.append({
-                "code": "invalid_width",
-                "path": f"zones.{zone_name}.width",
-                "value": width,
-                "msg": f"Zone '{zone_name}' width must be positive"
-            })
-        
-        if height <= 0:
-            errors.append({
-                "code": "invalid_height",
-                "path": f"zones.{zone_name}.height",
-                "value": height,
-                "msg": f"Zone '{zone_name}' height must be positive"
-            })
-        
-        # Außerhalb Canvas
-        canvas_width = canvas.get('width', 0)
-        canvas_height = canvas.get('height', 0)
-        
-        if x + width > canvas_width:
-            errors.append({
-                "code": "zone_outside_canvas_x",
-                "path": f"zones.{zone_name}",
-                "value": f"x={x}, width={width}, canvas_width={canvas_width}",
-                "msg": f"Zone '{zone_name}' extends beyond canvas width"
-            })
-        
-        if y + height > canvas_height:
-            errors.append({
-                "code": "zone_outside_canvas_y",
-                "path": f"zones.{zone_name}",
-                "value": f"y={y}, height={height}, canvas_height={canvas_height}",
-                "msg": f"Zone '{zone_name}' extends beyond canvas height"
-            })
-    
-    # Z-Index Validierung
-    if 'z' in zone_data and not isinstance(zone_data['z'], int):
-        errors.append({
-            "code": "invalid_z_index",
-            "path": f"zones.{zone_name}.z",
-            "value": zone_data['z'],
-            "msg": f"Zone '{zone_name}' z-index must be integer"
-        })
-    
-    return errors
-
-
 def convert_position_string_to_coords(position: str) -> Optional[Dict[str, int]]:
     """
     Konvertiert einen position-String zu numerischen Koordinaten
@@ -290,10 +168,10 @@ def ensure_numerical_zones(layout_dict: Dict[str, Any]) -> Dict[str, Any]:
         layout_dict: Layout-Dictionary (enthält zones und andere Metadaten)
         
     Returns:
-        Layout-Dictionary mit numerischen Koordinaten für alle Zonen
+        Dasselbe Layout-Dictionary (keine Kopie; der Aufrufer bleibt Eigentümer)
     """
     # Da wir jetzt feste Koordinaten verwenden, geben wir das Layout unverändert zurück
-    return layout_dict.copy()
+    return layout_dict
 
 
 def get_layout_zone_requirements(layout_type: str) -> Dict[str, List[str]]:
@@ -320,8 +198,7 @@ def is_zone_required(layout_type: str, zone_name: str) -> bool:
     Returns:
         True wenn Zone erforderlich ist, False wenn optional
     """
-    requirements = get_layout_zone_requirements(layout_type)
-    return zone_name in requirements["required"]
+    return zone_name in _REQUIRED_ZONES.get(layout_type, _DEFAULT_REQUIRED_ZONES)
 
 
 def get_expected_zones_for_layout(layout_type: str) -> List[str]:
@@ -334,8 +211,8 @@ def get_expected_zones_for_layout(layout_type: str) -> List[str]:
     Returns:
         Liste aller erwarteten Zonen (erforderliche + optionale)
     """
-    requirements = get_layout_zone_requirements(layout_type)
-    return requirements["required"] + requirements["optional"]
+    # Neue Liste je Aufruf, die vorberechnete Reihenfolge bleibt unverändert
+    return list(_EXPECTED_ZONES.get(layout_type, _DEFAULT_EXPECTED_ZONES))
 
 
 def filter_validation_errors(validation_results: List[dict], include_warnings: bool = True) -> Dict[str, List[dict]]:
@@ -379,9 +256,8 @@ def validate_layout_strict(layout: dict) -> List[dict]:
     Returns:
         Liste der Validierungsfehler (leer = valide)
     """
-    all_results = validate_layout(layout)
-    filtered = filter_validation_errors(all_results, include_warnings=False)
-    return filtered['errors']
+    # validate_layout liefert derzeit keine Ergebnisse, das Filtern entfällt
+    return []
 
 
 def validate_layout_with_warnings(layout: dict) -> Dict[str, List[dict]]:
@@ -394,5 +270,5 @@ def validate_layout_with_warnings(layout: dict) -> Dict[str, List[dict]]:
     Returns:
         Dictionary mit 'errors' und 'warnings'
     """
-    all_results = validate_layout(layout)
-    return filter_validation_errors(all_results, include_warnings=True)
+    # validate_layout liefert derzeit keine Ergebnisse, das Filtern entfällt
+    return {'errors': [], 'warnings': []}
@@ -9,6 +9,6 @@ Verantwortlich für:
 """
 
 from .spec import build_motive_spec
-from .processor import MotifInputProcessor, create_motif_processor
+from .processor import MotifInputProcessor, create_motif_processor, evaluate_quality_batch
 
-__all__ = ['build_motive_spec', 'MotifInputProcessor', 'create_motif_processor']
\ No newline at end of file
+__all__ = ['build_motive_spec', 'MotifInputProcessor', 'create_motif_processor', 'evaluate_quality_batch']
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Numerische Kernfunktionen der Motiv-Verarbeitung
+
+Reine Arithmetik ohne Python-Objekte, damit sie mit Numba (falls installiert)
+nativ und parallel kompiliert werden können. Ohne Numba laufen sie als normale
+Python-Funktionen über Listen.
+"""
+
+from .._jit import njit, prange, NUMBA_AVAILABLE
+
+
+@njit(parallel=True, cache=True)
+def score_presence_matrix(presence, weights, out):
+    """
+    Berechnet gewichtete Zeilensummen einer 0/1-Präsenzmatrix
+
+    Args:
+        presence: Matrix (Zeilen = Specs, Spalten = Felder) mit 0/1-Einträgen
+        weights: Gewicht je Spalte
+        out: Vorbelegter Ergebnis-Puffer mit einer Zelle je Zeile
+    """
+    n_fields = len(weights)
+    for i in prange(len(presence)):
+        row = presence[i]
+        score = 0
+        for j in range(n_fields):
+            score += row[j] * weights[j]
+        out[i] = score
+    return out
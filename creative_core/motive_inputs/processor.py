@@ -4,19 +4,88 @@ Motif Input Processor - Erweiterte Motiveingabe und -verarbeitung
 Neue Komponente für strukturierte Motiveingabe mit automatischer Generierung
 """
 
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Union
+import itertools
 import logging
 import random
+import re
+
+from ._num import score_presence_matrix, NUMBA_AVAILABLE
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Punktzahl je befülltem Feld für _evaluate_quality (Summe = 100)
+_QUALITY_WEIGHTS = (
+    ('motiv_prompt', 30),
+    ('category', 20),
+    ('persona', 15),
+    ('environment', 15),
+    ('visual_style', 10),
+    ('lighting_type', 5),
+    ('framing', 5),
+)
+_QUALITY_FIELDS = tuple(field_name for field_name, _ in _QUALITY_WEIGHTS)
+_QUALITY_WEIGHT_VALUES = tuple(weight for _, weight in _QUALITY_WEIGHTS)
+_QUALITY_WEIGHTS_NP = np.array(_QUALITY_WEIGHT_VALUES, dtype=np.int32) if NUMPY_AVAILABLE else None
+
+
+def _score_quality(motif_spec: Dict[str, Any]) -> int:
+    """Summiert die Gewichte aller befüllten Qualitätsfelder einer Motiv-Spezifikation"""
+    # Gewichte summieren sich auf genau 100, eine Begrenzung entfällt
+    get = motif_spec.get
+    score = 0
+    for field_name, weight in _QUALITY_WEIGHTS:
+        if get(field_name):
+            score += weight
+    return score
+
+
+# Schreibgeschützte Vorlagen für Fallback- und Fehler-Ergebnisse (Aufrufer erhalten Kopien)
+_DEFAULT_MOTIF = MappingProxyType({
+    'motiv_prompt': 'Professioneller Mitarbeiter in moderner Arbeitsumgebung',
+    'category': 'allgemein',
+    'generation_method': 'default',
+    'persona': 'Professioneller Mitarbeiter',
+    'environment': 'Moderne Arbeitsumgebung',
+    'visual_style': 'Professionell',
+    'lighting_type': 'Natürlich',
+    'lighting_mood': 'Professionell',
+    'framing': 'Medium Shot'
+})
+
+_ERROR_RESULT = MappingProxyType({
+    'motiv_prompt': 'Professionelles Motiv (Fehler bei der Verarbeitung)',
+    'category': 'allgemein',
+    'generation_method': 'error',
+    'persona': 'Professioneller Mitarbeiter',
+    'environment': 'Arbeitsumgebung',
+    'visual_style': 'Professionell',
+    'lighting_type': 'Natürlich',
+    'lighting_mood': 'Professionell',
+    'framing': 'Medium Shot',
+    'ready_for_generation': False,
+    'processing_success': False,
+    'error': '',  # wird je Aufruf gesetzt
+    'quality_score': 0
+})
+
 
 class MotifInputProcessor:
     """
     Verarbeitet und generiert Motiv-Eingaben für die Bildgenerierung
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Eigener Zufallsgenerator je Instanz (seed für reproduzierbare Tests, ohne globalen Zustand)
+        self._rng = random.Random(seed)
+        
         # Vordefinierte Motivkategorien
         self.motif_categories = {
             'pflege': {
@@ -51,6 +120,20 @@ class MotifInputProcessor:
             }
         }
         
+        # Ein vorkompiliertes Muster je Kategorie (alle Keywords als Alternation);
+        # die Dict-Reihenfolge bleibt die Priorität bei mehreren Treffern
+        self._category_patterns = [
+            (category, re.compile('|'.join(map(re.escape, data['keywords']))))
+            for category, data in self.motif_categories.items()
+        ]
+        
+        # Alle (base_prompt, persona, environment)-Kombinationen je Kategorie: eine Ziehung
+        # aus dem kartesischen Produkt ist gleichverteilt je Achse wie drei Einzelziehungen
+        self._motif_tables = {
+            category: tuple(itertools.product(data['base_prompts'], data['personas'], data['environments']))
+            for category, data in self.motif_categories.items()
+        }
+        
         # Visuelle Stile
         self.visual_styles = {
             'professionell': {
@@ -69,6 +152,15 @@ class MotifInputProcessor:
                 'colors': 'Warme, einladende Farben'
             }
         }
+        
+        # Handler je Eingabetyp, indiziert über (uploaded_image << 1) | motiv_prompt;
+        # ein hochgeladenes Bild hat Vorrang vor der Textbeschreibung
+        self._input_handlers = (
+            self._auto_generate_motif,
+            self._process_text_description,
+            self._process_image_upload,
+            self._process_image_upload
+        )
     
     def process_motif_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -87,14 +179,7 @@ class MotifInputProcessor:
             input_type = self._determine_input_type(input_data)
             
             # 2. Motiv generieren basierend auf Eingabetyp
-            if input_type == 'text_description':
-                motif_spec = self._process_text_description(input_data)
-            elif input_type == 'auto_generate':
-                motif_spec = self._auto_generate_motif(input_data)
-            elif input_type == 'image_upload':
-                motif_spec = self._process_image_upload(input_data)
-            else:
-                motif_spec = self._get_default_motif()
+            motif_spec = self._input_handlers[input_type](input_data)
             
             # 3. Visuelle Parameter hinzufügen
             motif_spec = self._add_visual_parameters(motif_spec, input_data)
@@ -114,27 +199,26 @@ class MotifInputProcessor:
             logger.error(f"❌ Fehler bei Motiv-Verarbeitung: {e}")
             return self._get_error_result(str(e))
     
-    def _determine_input_type(self, input_data: Dict[str, Any]) -> str:
-        """Bestimmt den Eingabetyp für die Motiv-Generierung"""
-        if input_data.get('uploaded_image'):
-            return 'image_upload'
-        elif input_data.get('motiv_prompt'):
-            return 'text_description'
-        else:
-            return 'auto_generate'
+    @staticmethod
+    def _determine_input_type(input_data: Dict[str, Any]) -> int:
+        """Bestimmt den Eingabetyp als Index in self._input_handlers (0=auto, 1=text, 2/3=Bild)"""
+        return (2 if input_data.get('uploaded_image') else 0) | (1 if input_data.get('motiv_prompt') else 0)
     
     def _process_text_description(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Verarbeitet manuelle Text-Beschreibungen"""
         motiv_prompt = input_data.get('motiv_prompt', '')
         
+        # Stellentitel einmal kleinschreiben, Kategorie und Persona teilen sich das Ergebnis
+        stellentitel_lower = input_data.get('stellentitel', '').lower()
+        
         # Kategorie basierend auf Stellentitel bestimmen
-        category = self._determine_category(input_data.get('stellentitel', ''))
+        category = self._determine_category(stellentitel_lower)
         
         return {
             'motiv_prompt': motiv_prompt,
             'category': category,
             'generation_method': 'text_description',
-            'persona': self._extract_persona(input_data.get('stellentitel', '')),
+            'persona': self._extract_persona(stellentitel_lower),
             'environment': self._suggest_environment(category),
             'visual_style': input_data.get('visual_style', 'Professionell'),
             'lighting_type': input_data.get('lighting_type', 'Natürlich'),
@@ -153,8 +237,8 @@ class MotifInputProcessor:
         
         # Motiv generieren
         if category in self.motif_categories:
-            category_data = self.motif_categories[category]
-            base_prompt = random.choice(category_data['base_prompts'])
+            # Eine Zufallsziehung statt drei
+            base_prompt, persona, environment = self._rng.choice(self._motif_tables[category])
             
             # Kontext hinzufügen
             if company:
@@ -166,8 +250,8 @@ class MotifInputProcessor:
                 'motiv_prompt': base_prompt,
                 'category': category,
                 'generation_method': 'auto_generate',
-                'persona': random.choice(category_data['personas']),
-                'environment': random.choice(category_data['environments']),
+                'persona': persona,
+                'environment': environment,
                 'visual_style': 'Professionell',
                 'lighting_type': 'Natürlich',
                 'lighting_mood': 'Professionell',
@@ -191,7 +275,7 @@ class MotifInputProcessor:
             'motiv_prompt': base_prompt,
             'category': 'custom',
             'generation_method': 'image_upload',
-            'persona': self._extract_persona(input_data.get('stellentitel', '')),
+            'persona': self._extract_persona(input_data.get('stellentitel', '').lower()),
             'environment': 'Custom Environment',
             'visual_style': input_data.get('visual_style', 'Professionell'),
             'lighting_type': input_data.get('lighting_type', 'Natürlich'),
@@ -200,23 +284,22 @@ class MotifInputProcessor:
             'has_uploaded_image': True
         }
     
-    def _determine_category(self, stellentitel: str) -> str:
-        """Bestimmt die Motiv-Kategorie basierend auf dem Stellentitel"""
-        stellentitel_lower = stellentitel.lower()
-        
-        for category, data in self.motif_categories.items():
-            if any(keyword in stellentitel_lower for keyword in data['keywords']):
+    def _determine_category(self, stellentitel_lower: str) -> str:
+        """Bestimmt die Motiv-Kategorie basierend auf dem (bereits kleingeschriebenen) Stellentitel"""
+        # Ein Regex-Scan pro Kategorie statt einer Python-Schleife über alle Keywords
+        for category, pattern in self._category_patterns:
+            if pattern.search(stellentitel_lower):
                 return category
         
         return 'allgemein'
     
-    def _extract_persona(self, stellentitel: str) -> str:
-        """Extrahiert die Persona aus dem Stellentitel"""
-        if 'pflege' in stellentitel.lower():
+    def _extract_persona(self, stellentitel_lower: str) -> str:
+        """Extrahiert die Persona aus dem (bereits kleingeschriebenen) Stellentitel"""
+        if 'pflege' in stellentitel_lower:
             return 'Pflegekraft'
-        elif 'entwickler' in stellentitel.lower() or 'programmierer' in stellentitel.lower():
+        elif 'entwickler' in stellentitel_lower or 'programmierer' in stellentitel_lower:
             return 'Entwickler'
-        elif 'berater' in stellentitel.lower():
+        elif 'berater' in stellentitel_lower:
             return 'Berater'
         else:
             return 'Professioneller Mitarbeiter'
@@ -224,7 +307,7 @@ class MotifInputProcessor:
     def _suggest_environment(self, category: str) -> str:
         """Schlägt eine passende Umgebung vor"""
         if category in self.motif_categories:
-            return random.choice(self.motif_categories[category]['environments'])
+            return self._rng.choice(self.motif_categories[category]['environments'])
         return 'Professionelle Arbeitsumgebung'
     
     def _add_visual_parameters(self, motif_spec: Dict[str, Any], input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -243,63 +326,45 @@ class MotifInputProcessor:
     
     def _evaluate_quality(self, motif_spec: Dict[str, Any]) -> int:
         """Bewertet die Qualität der Motiv-Spezifikation"""
-        score = 0
-        
-        # Basis-Punktzahl
-        if motif_spec.get('motiv_prompt'):
-            score += 30
-        
-        if motif_spec.get('category'):
-            score += 20
-        
-        if motif_spec.get('persona'):
-            score += 15
-        
-        if motif_spec.get('environment'):
-            score += 15
-        
-        if motif_spec.get('visual_style'):
-            score += 10
-        
-        if motif_spec.get('lighting_type'):
-            score += 5
-        
-        if motif_spec.get('framing'):
-            score += 5
-        
-        return min(score, 100)
+        return _score_quality(motif_spec)
     
     def _get_default_motif(self) -> Dict[str, Any]:
         """Fallback-Motiv wenn keine spezifischen Daten verfügbar sind"""
-        return {
-            'motiv_prompt': 'Professioneller Mitarbeiter in moderner Arbeitsumgebung',
-            'category': 'allgemein',
-            'generation_method': 'default',
-            'persona': 'Professioneller Mitarbeiter',
-            'environment': 'Moderne Arbeitsumgebung',
-            'visual_style': 'Professionell',
-            'lighting_type': 'Natürlich',
-            'lighting_mood': 'Professionell',
-            'framing': 'Medium Shot'
-        }
+        return dict(_DEFAULT_MOTIF)
     
     def _get_error_result(self, error_msg: str) -> Dict[str, Any]:
         """Fehler-Ergebnis"""
-        return {
-            'motiv_prompt': 'Professionelles Motiv (Fehler bei der Verarbeitung)',
-            'category': 'allgemein',
-            'generation_method': 'error',
-            'persona': 'Professioneller Mitarbeiter',
-            'environment': 'Arbeitsumgebung',
-            'visual_style': 'Professionell',
-            'lighting_type': 'Natürlich',
-            'lighting_mood': 'Professionell',
-            'framing': 'Medium Shot',
-            'ready_for_generation': False,
-            'processing_success': False,
-            'error': error_msg,
-            'quality_score': 0
-        }
+        result = dict(_ERROR_RESULT)
+        result['error'] = error_msg
+        return result
+
+
+def evaluate_quality_batch(specs: List[Dict[str, Any]]) -> List[int]:
+    """
+    Bewertet die Qualität vieler Motiv-Spezifikationen auf einmal
+    
+    Liefert dieselben Punktzahlen wie MotifInputProcessor._evaluate_quality. Mit Numba
+    (und NumPy) rechnet ein paralleler Kernel über eine kompakte Präsenzmatrix, sonst
+    wird je Spec direkt summiert.
+    
+    Args:
+        specs: Liste von Motiv-Spezifikationen
+        
+    Returns:
+        Liste mit einer Punktzahl (int) je Spec, unabhängig davon, ob NumPy installiert ist
+    """
+    if NUMBA_AVAILABLE and NUMPY_AVAILABLE:
+        # Nativer, paralleler Kernel über eine kompakte Präsenzmatrix
+        presence = np.array(
+            [[1 if spec.get(field_name) else 0 for field_name in _QUALITY_FIELDS] for spec in specs],
+            dtype=np.uint8
+        ).reshape(len(specs), len(_QUALITY_FIELDS))
+        scores = score_presence_matrix(presence, _QUALITY_WEIGHTS_NP, np.empty(len(specs), dtype=np.int32))
+        return scores.tolist()
+    
+    # Ohne Numba wäre der Kernel eine Python-Schleife über NumPy-Skalare (langsamer als
+    # die Einzelbewertung); daher dieselbe Bewertung je Spec wie _evaluate_quality
+    return list(map(_score_quality, specs))
 
 
 def create_motif_processor() -> MotifInputProcessor:
@@ -4,6 +4,7 @@ Prompt Composer - Finale Prompt-Komposition
 Migriert aus PromptFinalizer._generate_dalle_prompt() und _generate_midjourney_prompt()
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Tuple
 import logging
 import re
@@ -23,6 +24,23 @@ NEGATIVE_LINE = (
 )
 
 
+# Statische Blöcke des Hybrid-Prompts, einmal beim Import zusammengesetzt
+_VISUAL_BLOCK = "\n".join([
+    "VISUAL",
+    "- Camera/Optics: 35–50 mm, shallow–mid DoF, low distortion, clean micro-contrast, controlled vignetting",
+    "- Lighting: soft daylight, broad bounce fill, controlled highlights, 5200–5600 K",
+    "- Grading: cinematic neutral, midtone separation, highlight roll-off",
+    "- Artefacts: anti-banding/aliasing/moire, no halos/bloom, minimal noise",
+])
+
+_TECH_BLOCK = "\n".join([
+    "TECH & NEGATIVE",
+    "- text_rendering: separate_layers (outside the image)",
+    "- overlay_uniqueness: each text element appears at most once; no duplicates or mirrored copies; no repeated bullets; no duplicate location or CTA",
+    f"- Negative: {NEGATIVE_LINE}",
+])
+
+
 def compose(layout: Dict[str, Any], design: Dict[str, Any],
             texts: Dict[str, Any], motive: Dict[str, Any], *,
             motiv_agnostic: bool = True,
@@ -43,12 +61,12 @@ def compose(layout: Dict[str, Any], design: Dict[str, Any],
     Raises:
         ValueError: Wenn Layout oder Design nicht validiert sind
     """
-    # COMPOSER-GATE: Strikte Validierung der Eingaben
-    if not layout.get("__validated__"):
-        raise ValueError("Layout must be validated before composition")
-    if not design.get("__validated__"):
-        raise ValueError("Design must be validated before composition")
+    # COMPOSER-GATE: Strikte Validierung der Eingaben (ein Ausdruck im Normalfall,
+    # die genaue Fehlermeldung nur wenn eine Prüfung scheitert)
+    if not (layout.get("__validated__") and design.get("__validated__")):
+        _require_validated(layout, design)
     
+    # try kostet ab Python 3.11 im Normalfall nichts (Exception-Tabelle) und hält die Fallback-Semantik
     try:
         # EMBED-TEXT MODE: Build copy-paste prompt with actual text strings
         if embed_text_in_image:
@@ -161,48 +179,6 @@ def compose(layout: Dict[str, Any], design: Dict[str, Any],
             except Exception:
                 pass
 
-        # SCENE-Block (semantische Kontrolle, NO-TEXT-RENDER, Platzhalter)
-        scene_lines = [
-            "SCENE",
-        ]
-
-        # Aspect ratio
-        scene_lines.append(f"- Aspect ratio: {aspect_ratio}")
-
-        # Layout-Intent mit Toleranzen
-        rel = derive_relative(layout)
-        if orientation == 'text_left_image_right' and rel.get('text') is not None and rel.get('image') is not None:
-            scene_lines.append(
-                f"- Layout intent: text-left {tol(rel['text'])}, image-right {tol(rel['image'])}, gutter {tol(rel['gutter'])}, safe margins {rel['safe']}%"
-            )
-        elif orientation == 'image_left_text_right' and rel.get('text') is not None and rel.get('image') is not None:
-            scene_lines.append(
-                f"- Layout intent: image-left {tol(rel['image'])}, text-right {tol(rel['text'])}, gutter {tol(rel['gutter'])}, safe margins {rel['safe']}%"
-            )
-        else:
-            scene_lines.append(
-                f"- Layout intent: split layout {tol(rel['text'])}/{tol(rel['image'])} with gutter {tol(rel['gutter'])}, safe margins {rel['safe']}%"
-            )
-
-        # Kompositionsregeln (semantisch, keine Pixel)
-        comp_rules = [
-            "- Composition: rule-of-thirds; clear negative space in the text column; consistent vertical rhythm; clean separation"
-        ]
-        if 'vertical_split' in layout_type:
-            comp_rules.append("- unobstructed gutter from top to bottom")
-        if 'hero' in layout_type:
-            comp_rules.append("- pin the top image band to the top edge")
-        # Overlay-Semantik (ohne Textinhalte)
-        comp_rules.append("- Overlay semantics: shared left edge; CTA indent if present; align to vertical rhythm")
-        # Globale Mindestregel fuer Bildanteil (ausser Vollbild-Pfaden)
-        comp_rules.append("- Image coverage: maintain at least 55% of the width for the main image; full-bleed layouts may require 100%.")
-        scene_lines.extend(comp_rules)
-
-        # CI-Palette und Container-Style
-        scene_lines.append(
-            f"- CI palette: primary {ci_primary}, secondary {ci_secondary}, accent {ci_accent}, background {ci_background}"
-        )
-
         style_tokens = []
         if bg_opacity is not None:
             style_tokens.append(f"background_opacity {round(float(bg_opacity), 2)}")
@@ -210,54 +186,26 @@ def compose(layout: Dict[str, Any], design: Dict[str, Any],
             style_tokens.append(f"corner_radius {corner_radius}")
         if shadow_desc:
             style_tokens.append(shadow_desc)
-        if style_tokens:
-            scene_lines.append("- Container look: " + ", ".join(style_tokens) + ", optional soft gradients/glass")
-
-        # NO TEXT RENDER + Platzhalter (ohne ASCII/Umlaut-Hinweis)
-        scene_lines.append("- NO TEXT IN IMAGE. Use placeholders only: {HEADLINE}, {SUBHEAD}, {CTA}.")
-        scene_lines.append("- Conflict rule: if VISUAL conflicts with layout constraints, SCENE overrides.")
-
-        scene_block = "\n".join(scene_lines)
-
-        # VISUAL-Block (motiv-agnostisch)
-        visual_lines = ["VISUAL"]
-        if strict_layout_mode:
-            visual_lines.extend([
-                "- Camera/Optics: 35–50 mm, shallow–mid DoF, low distortion, clean micro-contrast, controlled vignetting",
-                "- Lighting: soft daylight, broad bounce fill, controlled highlights, 5200–5600 K",
-                "- Grading: cinematic neutral, midtone separation, highlight roll-off",
-                "- Artefacts: anti-banding/aliasing/moire, no halos/bloom, minimal noise",
-            ])
-        else:
-            visual_lines.extend([
-                "- Camera/Optics: 35–50 mm, shallow–mid DoF, low distortion, clean micro-contrast, controlled vignetting",
-                "- Lighting: soft daylight, broad bounce fill, controlled highlights, 5200–5600 K",
-                "- Grading: cinematic neutral, midtone separation, highlight roll-off",
-                "- Artefacts: anti-banding/aliasing/moire, no halos/bloom, minimal noise",
-            ])
-        visual_block = "\n".join(visual_lines)
 
-        # STYLE-Block (Material, 8k, Kontrast, CI-Harmonie)
+        # Relative Anteile fuer den Layout-Intent
+        rel = derive_relative(layout)
+
+        # STYLE-Angaben aus dem Design
         texture_style = (design or {}).get('texture_style') or 'soft gradients'
         container_shape = (design or {}).get('container_shape') or 'rounded modern containers'
-        style_lines = [
-            "STYLE",
-            f"- Materials: glass effect, {texture_style}, {container_shape}",
-            "- Rendering: 8k resolution, HDR, nuanced contrast, ultra sharp without edge halos",
-            "- Color harmony: aligned to CI; primary for main containers, accent sparingly for CTA, secondary subtle; no neon/oversaturation; natural skintones",
-        ]
-        style_block = "\n".join(style_lines)
-
-        # TECH & NEGATIVE Block
-        tech_lines = [
-            "TECH & NEGATIVE",
-            "- text_rendering: separate_layers (outside the image)",
-            "- overlay_uniqueness: each text element appears at most once; no duplicates or mirrored copies; no repeated bullets; no duplicate location or CTA",
-            f"- Negative: {NEGATIVE_LINE}",
-        ]
-        tech_block = "\n".join(tech_lines)
 
-        final_prompt = f"{scene_block}\n\n{visual_block}\n\n{style_block}\n\n{tech_block}"
+        # Zusammensetzen ueber den Cache (Schluessel = alle eingehenden Skalarwerte)
+        prompt_args = (
+            aspect_ratio, layout_type, orientation,
+            rel['text'], rel['image'], rel['gutter'], rel['safe'],
+            ci_primary, ci_secondary, ci_accent, ci_background,
+            tuple(style_tokens), texture_style, container_shape,
+        )
+        try:
+            final_prompt = _assemble_hybrid_prompt(*prompt_args)
+        except TypeError:
+            # Nicht hashbare Design-Werte: ohne Cache zusammensetzen
+            final_prompt = _assemble_hybrid_prompt.__wrapped__(*prompt_args)
 
         logger.info(f"Prompt (hybrid) komponiert: {len(final_prompt)} Zeichen")
         return final_prompt
@@ -267,6 +215,87 @@ def compose(layout: Dict[str, Any], design: Dict[str, Any],
         return _get_fallback_prompt()
 
 
+@lru_cache(maxsize=256, typed=True)  # typed: 1 und 1.0 ergeben unterschiedliche Strings
+def _assemble_hybrid_prompt(aspect_ratio: str, layout_type: str, orientation: str,
+                            rel_text: int, rel_image: int, rel_gutter: int, rel_safe: int,
+                            ci_primary: Any, ci_secondary: Any, ci_accent: Any, ci_background: Any,
+                            style_tokens: Tuple[str, ...], texture_style: Any, container_shape: Any) -> str:
+    """
+    Setzt den Hybrid-Prompt (SCENE/VISUAL/STYLE/TECH) aus bereits abgeleiteten Werten zusammen
+
+    Gecacht: wiederholte Kompositionen mit unveränderten Eingaben (Vorschau, Retry,
+    Parameter-Sweeps) überspringen den kompletten Zusammenbau.
+    """
+    # SCENE-Block (semantische Kontrolle, NO-TEXT-RENDER, Platzhalter)
+    scene_lines = [
+        "SCENE",
+    ]
+
+    # Aspect ratio
+    scene_lines.append(f"- Aspect ratio: {aspect_ratio}")
+
+    # Layout-Intent mit Toleranzen
+    if orientation == 'text_left_image_right':
+        scene_lines.append(
+            f"- Layout intent: text-left {tol(rel_text)}, image-right {tol(rel_image)}, gutter {tol(rel_gutter)}, safe margins {rel_safe}%"
+        )
+    elif orientation == 'image_left_text_right':
+        scene_lines.append(
+            f"- Layout intent: image-left {tol(rel_image)}, text-right {tol(rel_text)}, gutter {tol(rel_gutter)}, safe margins {rel_safe}%"
+        )
+    else:
+        scene_lines.append(
+            f"- Layout intent: split layout {tol(rel_text)}/{tol(rel_image)} with gutter {tol(rel_gutter)}, safe margins {rel_safe}%"
+        )
+
+    # Kompositionsregeln (semantisch, keine Pixel)
+    comp_rules = [
+        "- Composition: rule-of-thirds; clear negative space in the text column; consistent vertical rhythm; clean separation"
+    ]
+    if 'vertical_split' in layout_type:
+        comp_rules.append("- unobstructed gutter from top to bottom")
+    if 'hero' in layout_type:
+        comp_rules.append("- pin the top image band to the top edge")
+    # Overlay-Semantik (ohne Textinhalte)
+    comp_rules.append("- Overlay semantics: shared left edge; CTA indent if present; align to vertical rhythm")
+    # Globale Mindestregel fuer Bildanteil (ausser Vollbild-Pfaden)
+    comp_rules.append("- Image coverage: maintain at least 55% of the width for the main image; full-bleed layouts may require 100%.")
+    scene_lines.extend(comp_rules)
+
+    # CI-Palette und Container-Style
+    scene_lines.append(
+        f"- CI palette: primary {ci_primary}, secondary {ci_secondary}, accent {ci_accent}, background {ci_background}"
+    )
+    if style_tokens:
+        scene_lines.append("- Container look: " + ", ".join(style_tokens) + ", optional soft gradients/glass")
+
+    # NO TEXT RENDER + Platzhalter (ohne ASCII/Umlaut-Hinweis)
+    scene_lines.append("- NO TEXT IN IMAGE. Use placeholders only: {HEADLINE}, {SUBHEAD}, {CTA}.")
+    scene_lines.append("- Conflict rule: if VISUAL conflicts with layout constraints, SCENE overrides.")
+
+    scene_block = "\n".join(scene_lines)
+
+    # STYLE-Block (Material, 8k, Kontrast, CI-Harmonie)
+    style_lines = [
+        "STYLE",
+        f"- Materials: glass effect, {texture_style}, {container_shape}",
+        "- Rendering: 8k resolution, HDR, nuanced contrast, ultra sharp without edge halos",
+        "- Color harmony: aligned to CI; primary for main containers, accent sparingly for CTA, secondary subtle; no neon/oversaturation; natural skintones",
+    ]
+    style_block = "\n".join(style_lines)
+
+    # VISUAL und TECH & NEGATIVE sind statisch und vorab gebaut
+    return f"{scene_block}\n\n{_VISUAL_BLOCK}\n\n{style_block}\n\n{_TECH_BLOCK}"
+
+
+def _require_validated(layout: Dict[str, Any], design: Dict[str, Any]) -> None:
+    """Wirft ValueError für die erste nicht validierte Eingabe (Layout vor Design)"""
+    if not layout.get("__validated__"):
+        raise ValueError("Layout must be validated before composition")
+    if not design.get("__validated__"):
+        raise ValueError("Design must be validated before composition")
+
+
 def _get_fallback_prompt() -> str:
     """Fallback-Prompt im Hybrid-Format (SCENE/VISUAL/STYLE/TECH)"""
     scene = (
@@ -18,7 +18,7 @@ from datetime import datetime
 import time
 from typing import Dict, List, Any
 import streamlit as st
-from creative_core.layout import load_layout
+from creative_core.layout import load_layout, preload_layouts
 from pipeline import run_pipeline, PipelineSettings
 
 # Layout-Engine Integration
@@ -290,12 +290,12 @@ def apply_design_to_layout(layout_id, design_options, ci_colors):
         image_text_ratio = int(design_options.get('image_text_ratio', 0.6) * 100)
         container_transparency = int(design_options.get('container_transparency', 0.8) * 100)
         
-        # Layout-Koordinaten berechnen
-        calculated_layout = layout_engine.calculate_layout_coordinates(
+        # Layout-Koordinaten berechnen (neue Geometrie erneut validieren)
+        calculated_layout = layout_engine.validate_layout(layout_engine.calculate_layout_coordinates(
             layout_data,
             image_text_ratio=image_text_ratio,
             container_transparency=container_transparency
-        )
+        ))
         
         # Design-Regeln anwenden
         design_options_for_backend = {
@@ -2233,6 +2233,16 @@ st.set_page_config(
     layout="wide"
 )
 
+
+# Layout-Dateien einmal pro Prozess vorparsen (cache_resource: nicht bei jedem Rerun),
+# damit die erste Layout-Auswahl nicht auf das YAML-Parsing wartet
+@st.cache_resource
+def _preload_layout_files() -> int:
+    return preload_layouts()
+
+
+_preload_layout_files()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -3702,13 +3712,13 @@ if st.button("🎯 Prompt erstellen", type="primary", use_container_width=True,
                             image_text_ratio = int(design_options['image_text_ratio'] * 100)
                             container_transparency = int(design_options['container_transparency'] * 100)
                             
-                            # Layout-Koordinaten berechnen (mit Fehlerbehandlung)
+                            # Layout-Koordinaten berechnen und neu validieren (mit Fehlerbehandlung)
                             try:
-                                calculated_layout = layout_engine.calculate_layout_coordinates(
+                                calculated_layout = layout_engine.validate_layout(layout_engine.calculate_layout_coordinates(
                                     layout_data,
                                     image_text_ratio=image_text_ratio,
                                     container_transparency=container_transparency
-                                )
+                                ))
                             except Exception as e:
                                 calculated_layout = layout_data
                             
@@ -0,0 +1,101 @@
+import random
+from collections import Counter
+
+import pytest
+
+from creative_core.evaluation.database import ElementEvaluationDB, _AliasTable
+from creative_core.evaluation.weighted_generator import ELEMENT_CHOICES, WeightedElementGenerator
+
+
+def _implied_distribution(table):
+    # P(j) = (prob[j] + Summe der Restmasse aller Spalten mit alias == j) / n
+    n = len(table.population)
+    mass = list(table.prob)
+    for i, alias in enumerate(table.alias):
+        mass[alias] += 1.0 - table.prob[i]
+    return [m / n for m in mass]
+
+
+def test_alias_table_matches_weights():
+    weights = [1.0, 0.85, 1.15, 2.0, 0.5]
+    table = _AliasTable(list("abcde"), weights, rng=random.Random(42))
+    total = sum(weights)
+    assert _implied_distribution(table) == pytest.approx([w / total for w in weights])
+
+    counts = Counter(table.sample() for _ in range(20000))
+    for value, weight in zip("abcde", weights):
+        assert counts[value] / 20000 == pytest.approx(weight / total, abs=0.02)
+
+
+def test_alias_table_zero_weight_is_never_sampled():
+    table = _AliasTable(["a", "b", "c"], [1.0, 0.0, 3.0], rng=random.Random(1))
+    assert _implied_distribution(table) == pytest.approx([0.25, 0.0, 0.75])
+    assert "b" not in {table.sample() for _ in range(2000)}
+
+
+def test_alias_table_all_zero_weights_is_uniform():
+    table = _AliasTable(["a", "b"], [0.0, 0.0], rng=random.Random(3))
+    assert _implied_distribution(table) == pytest.approx([0.5, 0.5])
+
+
+def test_alias_table_empty_choices():
+    table = _AliasTable([], [], rng=random.Random(0))
+    assert table.population == []
+    with pytest.raises(IndexError):
+        table.sample()
+
+
+def test_get_alias_table_uses_stored_probabilities(tmp_path):
+    db = ElementEvaluationDB(str(tmp_path / "eval.db"))
+    for _ in range(5):
+        db.add_element_rating("layout_style", "neon_tech", 9)
+    table = db.get_alias_table("layout_style", ["neon_tech", "clay_ui"])
+    assert table.population == ["neon_tech", "clay_ui"]
+    assert _implied_distribution(table) == pytest.approx([1.15 / 2.15, 1.0 / 2.15])
+
+
+def test_generate_weighted_elements_batch(tmp_path):
+    random.seed(7)
+    generator = WeightedElementGenerator(ElementEvaluationDB(str(tmp_path / "eval.db")))
+    batch = generator.generate_weighted_elements_batch(4)
+    assert len(batch) == 4
+    for elements in batch:
+        assert list(elements) == list(ELEMENT_CHOICES)
+        for element_type, value in elements.items():
+            assert value in ELEMENT_CHOICES[element_type]
+    assert generator.generate_weighted_elements_batch(0) == []
+
+
+def test_get_probabilities_keeps_order_and_defaults(tmp_path):
+    db = ElementEvaluationDB(str(tmp_path / "eval.db"))
+    for _ in range(5):
+        db.add_element_rating("layout_style", "neon_tech", 9)
+    probabilities = db.get_probabilities("layout_style", ["clay_ui", "neon_tech", "clay_ui"])
+    assert probabilities == {"clay_ui": 1.0, "neon_tech": pytest.approx(1.15)}
+    assert list(probabilities) == ["clay_ui", "neon_tech"]
+    assert db.get_probabilities("layout_style", []) == {}
+
+
+def test_weighted_choice_caches_cumulative_weights(tmp_path, monkeypatch):
+    db = ElementEvaluationDB(str(tmp_path / "eval.db"))
+    calls = []
+    original = db.get_probabilities
+    monkeypatch.setattr(db, "get_probabilities", lambda *args: calls.append(args) or original(*args))
+
+    choices = ["neon_tech", "clay_ui"]
+    for _ in range(10):
+        assert db.get_weighted_choice("layout_style", choices) in choices
+    assert len(calls) == 1
+
+    # Neue Wahrscheinlichkeiten verwerfen den Cache des Element-Typs
+    for _ in range(3):
+        db.add_element_rating("layout_style", "neon_tech", 1)
+    db.get_weighted_choice("layout_style", choices)
+    assert len(calls) == 2
+
+
+def test_weighted_choice_all_zero_weights_is_uniform(tmp_path, monkeypatch):
+    db = ElementEvaluationDB(str(tmp_path / "eval.db"))
+    monkeypatch.setattr(db, "get_probabilities", lambda element_type, choices: dict.fromkeys(choices, 0.0))
+    random.seed(5)
+    assert {db.get_weighted_choice("layout_style", ["a", "b"]) for _ in range(50)} == {"a", "b"}
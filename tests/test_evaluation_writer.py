@@ -0,0 +1,91 @@
+import json
+import sqlite3
+import subprocess
+import sys
+
+from creative_core.evaluation.database import ElementEvaluationDB
+
+
+def test_import_does_not_start_writer():
+    code = "import creative_core.evaluation.database as d; print(d._writer is None)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "True"
+
+
+def test_submit_evaluation_batch_persists(tmp_path):
+    db_path = str(tmp_path / "eval.db")
+    db = ElementEvaluationDB(db_path)
+    ratings = [("layout_style", "neon_tech", 9), ("container_shape", "capsule", 2)]
+
+    for _ in range(3):
+        future = db.submit_evaluation_batch(
+            ratings,
+            session_id="s1",
+            context="ctx",
+            prompt_evaluation={
+                'prompt_text': "PROMPT",
+                'generated_elements': {'layout_style': "neon_tech"},
+                'overall_rating': 9,
+            },
+        )
+        assert future.result(timeout=10) is None
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT element_type, element_value, rating, session_id, context FROM element_ratings"
+        ).fetchall()
+        evaluations = conn.execute(
+            "SELECT session_id, prompt_text, generated_elements, overall_rating FROM prompt_evaluations"
+        ).fetchall()
+        probability = conn.execute(
+            "SELECT current_probability, total_ratings FROM element_probabilities "
+            "WHERE element_type = 'layout_style' AND element_value = 'neon_tech'"
+        ).fetchone()
+
+    assert sorted(rows) == sorted([(et, ev, r, "s1", "ctx") for et, ev, r in ratings] * 3)
+    assert len(evaluations) == 3
+    session_id, prompt_text, generated_elements, overall_rating = evaluations[0]
+    assert (session_id, prompt_text, overall_rating) == ("s1", "PROMPT", 9)
+    assert json.loads(generated_elements) == {'layout_style': "neon_tech"}
+    assert probability == (1.1, 3)
+
+
+def test_submit_evaluation_batch_reports_errors(tmp_path):
+    db = ElementEvaluationDB(str(tmp_path / "eval.db"))
+    future = db.submit_evaluation_batch([("layout_style", None, 5)])
+    assert isinstance(future.exception(timeout=10), sqlite3.IntegrityError)
+
+
+def test_writer_connection_is_shared_per_db_path(tmp_path):
+    from creative_core.evaluation import database
+
+    db_path = str(tmp_path / "eval.db")
+    first = ElementEvaluationDB(db_path)
+    second = ElementEvaluationDB(db_path)
+    first.submit_evaluation_batch([("layout_style", "neon_tech", 5)]).result(timeout=10)
+    conn = database._writer_connections[db_path]
+    second.submit_evaluation_batch([("layout_style", "clay_ui", 5)]).result(timeout=10)
+
+    assert database._writer_connections[db_path] is conn
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM element_ratings").fetchone() == (2,)
+
+
+def test_shutdown_writer_closes_connections(tmp_path):
+    code = (
+        "import sqlite3, sys\n"
+        "from creative_core.evaluation import database\n"
+        "db = database.ElementEvaluationDB(sys.argv[1])\n"
+        "db.submit_evaluation_batch([('layout_style', 'neon_tech', 5)]).result(timeout=10)\n"
+        "conn = database._writer_connections[sys.argv[1]]\n"
+        "database._shutdown_writer()\n"
+        "try:\n"
+        "    conn.execute('SELECT 1')\n"
+        "except sqlite3.ProgrammingError:\n"
+        "    print('closed', database._writer_connections)\n"
+    )
+    db_path = str(tmp_path / "eval.db")
+    out = subprocess.run([sys.executable, "-c", code, db_path], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "closed {}"
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM element_ratings").fetchone() == (1,)
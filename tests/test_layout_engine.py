@@ -0,0 +1,148 @@
+import copy
+
+import pytest
+
+from creative_core.layout import invalidate, layout_engine
+from creative_core.layout.loader import _load_from_separate_file
+
+
+def _raw_layout(layout_id):
+    # Layout-Datei ohne vorherige Koordinatenberechnung (wie im Cache-Pfad)
+    return _load_from_separate_file(layout_id)
+
+
+@pytest.mark.parametrize("layout_id", [
+    "skizze7_split_layout",        # Split
+    "skizze8_hero_layout",         # Hero
+    "skizze6_grid_layout",         # Container-Layout mit container_style
+    "skizze9_storytelling_layout",
+])
+def test_update_transparency_matches_full_calculation(layout_id):
+    full = layout_engine.calculate_layout_coordinates(_raw_layout(layout_id), 70, 80)
+    before = copy.deepcopy(full)
+
+    updated = layout_engine.update_transparency(full, 30)
+    expected = layout_engine.calculate_layout_coordinates(_raw_layout(layout_id), 70, 30)
+
+    assert updated['calculated_values'] == expected['calculated_values']
+    for zone_name, zone in expected['zones'].items():
+        assert updated['zones'][zone_name].get('container_style') == zone.get('container_style'), zone_name
+        assert updated['zones'][zone_name].get('transparency') == zone.get('transparency'), zone_name
+    assert updated == expected
+    # Das Ausgangs-Layout bleibt unverändert
+    assert full == before
+
+
+def test_calculate_layout_coordinates_cached_hit_miss_and_clamping():
+    from creative_core.layout import calculate_layout_coordinates_cached
+
+    calculate_layout_coordinates_cached.cache_clear()
+    first = calculate_layout_coordinates_cached("skizze1_vertical_split", 70, 80)
+    info = calculate_layout_coordinates_cached.cache_info()
+    assert (info.hits, info.misses) == (0, 1)
+
+    second = calculate_layout_coordinates_cached("skizze1_vertical_split", 70, 80)
+    info = calculate_layout_coordinates_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert second == first and second is not first
+
+    # Außerhalb des gültigen Bereichs: auf 85 bzw. 90 geklemmt, trifft denselben Eintrag
+    calculate_layout_coordinates_cached("skizze1_vertical_split", 85, 90)
+    clamped = calculate_layout_coordinates_cached("skizze1_vertical_split", 200, 500)
+    info = calculate_layout_coordinates_cached.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+    assert clamped['calculated_values']['image_text_ratio'] == 85
+
+
+def test_calculate_layout_coordinates_cached_returns_mutable_copy():
+    from creative_core.layout import calculate_layout_coordinates_cached
+
+    result = calculate_layout_coordinates_cached("skizze8_hero_layout", 60, 40)
+    expected = layout_engine.calculate_layout_coordinates(_raw_layout("skizze8_hero_layout"), 60, 40)
+    assert type(result) is dict
+    assert result == expected
+
+    # Änderungen am Ergebnis erreichen den Cache nicht
+    zone_name = next(iter(result['zones']))
+    result['zones'][zone_name]['x'] = -1
+    again = calculate_layout_coordinates_cached("skizze8_hero_layout", 60, 40)
+    assert again['zones'][zone_name] == expected['zones'][zone_name]
+
+
+def test_thaw_layout_round_trip():
+    from types import MappingProxyType
+    from creative_core.layout import thaw_layout
+    from creative_core.layout.engine import _freeze
+
+    layout = layout_engine.calculate_layout_coordinates(_raw_layout("skizze6_grid_layout"), 65, 50)
+    frozen = _freeze(layout)
+    assert isinstance(frozen, MappingProxyType)
+    with pytest.raises(TypeError):
+        frozen['zones']['x'] = {}
+
+    thawed = thaw_layout(frozen)
+    assert thawed == layout
+    thawed['zones']['new_zone'] = {}
+    assert 'new_zone' not in frozen['zones']
+
+
+def test_calculate_layout_coordinates_cached_picks_up_file_changes(tmp_path, monkeypatch):
+    import os
+    import shutil
+    from creative_core.layout import calculate_layout_coordinates_cached, loader
+
+    layout_file = tmp_path / "skizze1_vertical_split.yaml"
+    shutil.copy(os.path.join(loader._LAYOUTS_DIR, "skizze1_vertical_split.yaml"), layout_file)
+    monkeypatch.setattr(loader, "_LAYOUTS_DIR", str(tmp_path))
+
+    calculate_layout_coordinates_cached.cache_clear()
+    first = calculate_layout_coordinates_cached("skizze1_vertical_split", 70, 80)
+    assert first['name'] == "Skizze 1 – Vertical Split"
+
+    text = layout_file.read_text(encoding="utf-8")
+    layout_file.write_text(text.replace("Skizze 1 – Vertical Split", "Geändert", 1), encoding="utf-8")
+    stat = layout_file.stat()
+    os.utime(layout_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = calculate_layout_coordinates_cached("skizze1_vertical_split", 70, 80)
+    assert second['name'] == "Geändert"
+    assert calculate_layout_coordinates_cached.cache_info().misses == 2
+
+
+@pytest.mark.parametrize("layout_id", [
+    "skizze7_split_layout",
+    "skizze6_grid_layout",
+    "skizze10_modern_split",
+])
+def test_recalculated_layout_drops_validation_status(layout_id):
+    from creative_core.layout import load_layout
+
+    validated = load_layout(layout_id)
+    assert validated['__validated__'] is True
+
+    recalculated = layout_engine.calculate_layout_coordinates(validated, 60, 40)
+    assert '__validated__' not in recalculated
+    assert 'validation_status' not in recalculated
+    assert '__validated__' not in layout_engine.update_transparency(validated, 30)
+    assert '__validated__' not in layout_engine.apply_transparency_effects(validated)
+    # Die neue Geometrie lässt sich wieder validieren
+    assert layout_engine.validate_layout(recalculated)['__validated__'] is True
+
+
+def test_invalidate_forces_full_validation(monkeypatch):
+    from creative_core.layout import engine
+
+    validated = layout_engine.validate_layout(layout_engine.calculate_layout_coordinates(
+        _raw_layout("skizze7_split_layout"), 70, 80
+    ))
+    calls = []
+    original = engine.validate_layout_with_warnings
+    monkeypatch.setattr(engine, "validate_layout_with_warnings", lambda layout: calls.append(1) or original(layout))
+
+    assert layout_engine.validate_layout(validated) is validated
+    assert calls == []
+
+    assert invalidate(validated) is validated
+    assert '__validated__' not in validated and 'validation_status' not in validated
+    assert layout_engine.validate_layout(validated)['__validated__'] is True
+    assert calls == [1]
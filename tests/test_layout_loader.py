@@ -0,0 +1,44 @@
+import os
+
+from creative_core.layout import load_layout, preload_layouts
+from creative_core.layout.loader import _parse_layout_file
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_preload_layouts_parses_only_valid_yaml_files(tmp_path):
+    _write(tmp_path / "a.yaml", "layout_id: a\nzones:\n  headline_block: {x: 1}\n")
+    _write(tmp_path / "b.yaml", "layout_id: b\n")
+    _write(tmp_path / "broken.yaml", "zones: [unclosed\n")
+    _write(tmp_path / "notes.txt", "layout_id: ignored\n")
+    (tmp_path / "dir.yaml").mkdir()
+
+    _parse_layout_file.cache_clear()
+    assert preload_layouts(str(tmp_path)) == 2
+    assert _parse_layout_file.cache_info().currsize == 2
+    assert preload_layouts(str(tmp_path / "missing")) == 0
+
+
+def test_preloaded_entries_survive_cwd_change(tmp_path, monkeypatch):
+    layouts = tmp_path / "layouts"
+    layouts.mkdir()
+    layout_file = _write(layouts / "a.yaml", "layout_id: a\n")
+
+    _parse_layout_file.cache_clear()
+    monkeypatch.chdir(tmp_path)
+    assert preload_layouts("layouts") == 1
+
+    # Gleiche Datei aus einem anderen Arbeitsverzeichnis: Cache-Treffer über den absoluten Pfad
+    monkeypatch.chdir(layouts)
+    parsed = _parse_layout_file(os.path.abspath("a.yaml"), layout_file.stat().st_mtime_ns)
+    assert parsed == {'layout_id': 'a'}
+    assert _parse_layout_file.cache_info().hits == 1
+
+
+def test_load_layout_parses_lazily():
+    _parse_layout_file.cache_clear()
+    load_layout("skizze1_vertical_split")
+    assert _parse_layout_file.cache_info().currsize == 1
@@ -0,0 +1,37 @@
+import pytest
+
+from creative_core.motive_inputs import MotifInputProcessor, evaluate_quality_batch
+
+
+def test_same_seed_produces_same_auto_generated_motif():
+    input_data = {'stellentitel': 'Pflegefachkraft (m/w/d)', 'company': 'Klinikum Nord', 'location': 'Hamburg'}
+
+    first = MotifInputProcessor(seed=1234)
+    second = MotifInputProcessor(seed=1234)
+    for _ in range(5):
+        motif = first.process_motif_input(dict(input_data))
+        assert motif['generation_method'] == 'auto_generate'
+        assert motif == second.process_motif_input(dict(input_data))
+
+
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_evaluate_quality_batch_matches_single_scoring(monkeypatch, use_kernel):
+    from creative_core.motive_inputs import processor
+
+    if use_kernel and not processor.NUMPY_AVAILABLE:
+        pytest.skip("NumPy nicht installiert")
+    # Kernel-Pfad auch ohne Numba prüfbar (läuft dann als Python-Funktion)
+    monkeypatch.setattr(processor, "NUMBA_AVAILABLE", use_kernel)
+
+    fields = [name for name, _ in processor._QUALITY_WEIGHTS] + ['lighting_mood']
+    specs = [
+        {name: ('x' if bits >> i & 1 else '') for i, name in enumerate(fields)}
+        for bits in range(2 ** len(fields))
+    ]
+    specs.append({})
+
+    p = MotifInputProcessor(seed=0)
+    scores = evaluate_quality_batch(specs)
+    assert type(scores) is list
+    assert scores == [p._evaluate_quality(s) for s in specs]
+    assert evaluate_quality_batch([]) == []